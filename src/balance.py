@@ -0,0 +1,268 @@
+import os
+import json
+import time
+import argparse
+import itertools
+import numpy
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Tuple
+
+from utility import *  # Importing utility functions and constants
+from gameSystems import BatchEnv, LevelConfig, LevelTable  # Importing the batched environment and the level table
+from batchenv import game_rules
+from main import Game
+
+def random_player(env: BatchEnv, rng: "numpy.random.Generator") -> "numpy.ndarray":
+    """
+    Picks a random action in every game.
+
+    Args:
+        env (BatchEnv): The environment.
+        rng (numpy.random.Generator): Random number generator of the player.
+
+    Returns:
+        numpy.ndarray: One action per game.
+    """
+    return rng.integers(len(BatchEnv.ACTIONS), size=env.games)
+
+def chase_player(env: BatchEnv, rng: "numpy.random.Generator", dodge: bool = False) -> "numpy.ndarray":
+    """
+    Moves every basket under the lowest fruit still above it, optionally never moving under a bug about to land in it.
+
+    Args:
+        env (BatchEnv): The environment.
+        rng (numpy.random.Generator): Random number generator of the player (unused, the player is deterministic).
+        dodge (bool, optional): Flag indicating if bugs are avoided. Defaults to False.
+
+    Returns:
+        numpy.ndarray: One action per game.
+    """
+    basketWidth: int = env.rules["basketSize"][0]
+    basketY: int = env.rules["basketY"]
+    solidWidth, solidHeight, solidDX, solidDY = env.rules["basketSolid"]
+    center = env.basketX + basketWidth // 2
+    above = env.alive & (env.posY < basketY + solidDY + solidHeight)  # Objects that can still be caught
+    objectCenter = env.posX + env.width // 2
+
+    # Lowest fruit of every game, the basket stays put when there is none
+    fruitY = numpy.where(above & (env.kind > 0), env.posY, -numpy.inf)
+    lowest = fruitY.argmax(axis=1)
+    games = numpy.arange(env.games)
+    offset = numpy.where(numpy.isfinite(fruitY[games, lowest]), objectCenter[games, lowest] - center, 0)
+
+    # Distance covered in one step, stay when the fruit is closer than half of it
+    speeds = numpy.array([level.playerSpd for level in env.rules["levels"]]) * env.rules["playerSpeedScale"]
+    step = speeds[env.lvl - 1] * env.actionRepeat / env.rules["simulationHz"]
+    actions = numpy.where(offset < -step / 2, 1, numpy.where(offset > step / 2, 2, 0))
+
+    if dodge:
+        # Bugs less than 200 px above the basket: never move (or stay) under one of them
+        low, high = env.rules["basketRange"]
+        danger = above & (env.kind < 0) & (env.posY + env.height > basketY - 200)
+        safe = []
+        for move in (0, -1, 1):
+            target = numpy.clip(env.basketX + move * step, low, high - 1) + basketWidth // 2
+            overlap = numpy.abs(objectCenter - target[:, None]) < (solidWidth + env.width) // 2 + 1
+            safe.append(~(danger & overlap).any(axis=1))
+        safe = numpy.stack(safe, axis=1)
+        games = numpy.arange(env.games)
+        # Keep the chasing action when it is safe, otherwise take the first safe one (stay, left, right)
+        actions = numpy.where(safe[games, actions], actions, numpy.where(safe.any(axis=1), safe.argmax(axis=1), actions))
+    return actions
+
+# Heuristic players, by name
+players: Dict[str, Callable[[BatchEnv, "numpy.random.Generator"], "numpy.ndarray"]] = {
+    "random": random_player,
+    "chase": chase_player,
+    "dodge": lambda env, rng: chase_player(env, rng, dodge=True),
+}
+
+def parse_grid(specs: List[str], levels: LevelTable) -> List[Tuple[str, List[float]]]:
+    """
+    Parses the grid specifications. "param=a,b" multiplies the parameter of every level by each factor,
+    "level.param=a,b" sets the parameter of one level to each value.
+
+    Args:
+        specs (List[str]): The specifications.
+        levels (LevelTable): The level table the grid applies to.
+
+    Returns:
+        List[Tuple[str, List[float]]]: Key and values of every grid axis.
+
+    Raises:
+        ValueError: If a specification is malformed or names an unknown parameter.
+    """
+    axes: List[Tuple[str, List[float]]] = []
+    for spec in specs:
+        key, separator, values = spec.partition("=")
+        param: str = key.split(".")[-1]
+        if (not separator or param not in LevelConfig._fields or param == "level"
+                or (key != param and not 1 <= int(key.split(".")[0]) <= levels.maxLevel)):
+            raise ValueError(f"bad grid specification {spec!r}, expected param=a,b or level.param=a,b")
+        axes.append((key, [float(value) for value in values.split(",")]))
+    return axes
+
+def apply_grid(levels: LevelTable, point: Dict[str, float]) -> LevelTable:
+    """
+    Returns a copy of the level table with one grid point applied.
+
+    Args:
+        levels (LevelTable): The level table.
+        point (Dict[str, float]): Value of every grid axis.
+
+    Returns:
+        LevelTable: The changed level table.
+
+    Raises:
+        ValueError: If the grid point breaks the order of the score thresholds.
+    """
+    for key, value in point.items():
+        if "." in key:
+            lvl, param = key.split(".")
+            levels = levels.replace(int(lvl), **{param: round(value)})
+        else:
+            for level in levels:
+                # Scaled values stay positive, the zero score threshold of the first level stays zero
+                current: int = getattr(level, key)
+                levels = levels.replace(level.level, **{key: max(round(current * value), 1) if current else 0})
+    return levels
+
+def simulate(rules: Dict[str, Any], player: str, games: int, seconds: float, seed: int) -> Dict[str, Any]:
+    """
+    Runs one batch of headless games for a fixed simulated time. Runs in a worker process.
+
+    A game that ends restarts at once, so every game plays sessions back to back and the level totals
+    cover all of them. A session still running at the end counts as truncated when it is the first
+    session of its game (a later one would only add a short, low score).
+
+    Args:
+        rules (Dict[str, Any]): Game rules of the batch.
+        player (str): Name of the heuristic player.
+        games (int): Number of concurrent games.
+        seconds (float): Simulated time run.
+        seed (int): Seed of the batch.
+
+    Returns:
+        Dict[str, Any]: Level totals, final scores and the number of finished and truncated sessions.
+    """
+    env: BatchEnv = BatchEnv(games, rules, seed=seed)
+    policy: Callable[[BatchEnv, "numpy.random.Generator"], "numpy.ndarray"] = players[player]
+    # The player's stream is a child of the batch seed, independent of the environment's own stream
+    rng: "numpy.random.Generator" = numpy.random.default_rng(numpy.random.SeedSequence(seed).spawn(1)[0])
+    steps: int = int(seconds * rules["simulationHz"]) // env.actionRepeat
+    scores: List[int] = []
+
+    for _ in range(steps):
+        _, _, done = env.step(policy(env, rng))
+        if done.any():
+            scores.extend(env.finalPoint[done].tolist())
+
+    firstSession = env.age == steps * env.actionRepeat
+    return {
+        "levelStats": {name: values.tolist() for name, values in env.levelStats.items()},
+        "scores": scores + env.point[firstSession].tolist(),
+        "finished": len(scores),
+        "truncated": int(firstSession.sum())
+    }
+
+def summarize(point: Dict[str, float], runs: List[Dict[str, Any]], simulationHz: int) -> Dict[str, Any]:
+    """
+    Aggregates the batches of one grid point into per level statistics.
+
+    Args:
+        point (Dict[str, float]): Value of every grid axis.
+        runs (List[Dict[str, Any]]): Results of the batches.
+        simulationHz (int): Simulation rate, to turn ticks into seconds.
+
+    Returns:
+        Dict[str, Any]: Per level catch rate, damage per minute, time spent and time to reach, and the score distribution.
+    """
+    totals: Dict[str, "numpy.ndarray"] = {
+        name: numpy.sum([run["levelStats"][name] for run in runs], axis=0) for name in runs[0]["levelStats"]
+    }
+    scores = numpy.array([score for run in runs for score in run["scores"]])
+
+    levels: Dict[int, Dict[str, Any]] = {}
+    for lvl in range(1, len(totals["ticks"])):
+        minutes: float = totals["ticks"][lvl] / simulationHz / 60
+        levels[lvl] = {
+            "reached": int(totals["reached"][lvl]),
+            "secondsToReach": totals["reachedTicks"][lvl] / totals["reached"][lvl] / simulationHz if totals["reached"][lvl] else None,
+            "secondsSpent": totals["ticks"][lvl] / simulationHz,
+            "catchRate": totals["fruitCaught"][lvl] / totals["fruitSpawned"][lvl] if totals["fruitSpawned"][lvl] else None,
+            "bugHitRate": totals["bugCaught"][lvl] / totals["bugSpawned"][lvl] if totals["bugSpawned"][lvl] else None,
+            "damagePerMinute": totals["damage"][lvl] / minutes if minutes else None
+        }
+
+    return {
+        "grid": point,
+        "sessions": int(scores.size),
+        "finished": sum(run["finished"] for run in runs),
+        "truncated": sum(run["truncated"] for run in runs),
+        "score": {
+            "mean": float(scores.mean()),
+            "p10": float(numpy.percentile(scores, 10)),
+            "p50": float(numpy.percentile(scores, 50)),
+            "p90": float(numpy.percentile(scores, 90)),
+            "max": int(scores.max())
+        },
+        "levels": levels
+    }
+
+def main() -> None:
+    """
+    Sweeps a grid of level parameters over a process pool and streams one JSON line per grid point.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=f"{Game.NAME} level balancer")
+    parser.add_argument("--grid", action="append", default=[], help="param=a,b (factors for every level) or level.param=a,b (values), repeatable")
+    parser.add_argument("--player", choices=sorted(players), default="dodge", help="heuristic player")
+    parser.add_argument("--games", type=int, default=1024, help="concurrent games per grid point")
+    parser.add_argument("--batch", type=int, default=256, help="games per worker task")
+    parser.add_argument("--seconds", type=float, default=300, help="simulated time every game runs")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--seed", type=int, default=1234, help="base seed")
+    parser.add_argument("--out", default="balance.jsonl", help="output JSON lines file, one line per grid point")
+    args: argparse.Namespace = parser.parse_args()
+
+    baseRules: Dict[str, Any] = game_rules()
+    # Every grid point is checked before the pool starts and the output file is truncated
+    try:
+        axes: List[Tuple[str, List[float]]] = parse_grid(args.grid, baseRules["levels"])
+        points: List[Dict[str, float]] = [
+            dict(zip((key for key, _ in axes), values)) for values in itertools.product(*(values for _, values in axes))
+        ]
+        pointLevels: List[LevelTable] = [apply_grid(baseRules["levels"], point) for point in points]
+    except ValueError as error:
+        parser.error(str(error))
+    batches: int = max(args.games // args.batch, 1)
+    print(f"{len(points)} grid points x {batches * args.batch} games x {args.seconds:.0f} s on {args.workers} workers, player {args.player}")
+
+    start: float = time.perf_counter()
+    with ProcessPoolExecutor(args.workers) as executor, open(args.out, "w") as out:
+        pending: Dict[Future, int] = {}
+        for index, levels in enumerate(pointLevels):
+            rules: Dict[str, Any] = dict(baseRules, levels=levels)
+            for batch in range(batches):
+                future: Future = executor.submit(simulate, rules, args.player, args.batch, args.seconds, args.seed + index * batches + batch)
+                pending[future] = index
+
+        # Stream every grid point as soon as all its batches are in
+        runs: Dict[int, List[Dict[str, Any]]] = {index: [] for index in range(len(points))}
+        for future in as_completed(pending):
+            index: int = pending[future]
+            runs[index].append(future.result())
+            if len(runs[index]) < batches:
+                continue
+
+            summary: Dict[str, Any] = summarize(points[index], runs.pop(index), simulationHz)
+            out.write(json.dumps(summary, sort_keys=True) + "\n")
+            out.flush()
+            catchRates: str = " ".join(
+                f"{stats['catchRate']:.2f}" if stats["catchRate"] is not None else "-" for stats in summary["levels"].values()
+            )
+            print(f"[{time.perf_counter() - start:6.1f} s] {points[index] or 'baseline'}: {summary['sessions']} sessions, score p50 {summary['score']['p50']:.0f} "
+                  f"p90 {summary['score']['p90']:.0f}, catch rate per level {catchRates}")
+
+if __name__ == "__main__":
+    # Run the sweep
+    main()
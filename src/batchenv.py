@@ -0,0 +1,133 @@
+import os
+import json
+import time
+import argparse
+import pygame
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utility import *  # Importing utility functions and constants
+from gameSystems import BatchEnv, LevelTable  # Importing the batched environment and the level table
+from main import Game
+
+def game_rules() -> Dict[str, Any]:
+    """
+    Returns the rules of the game in the form BatchEnv expects: the utility settings plus the
+    on-screen size and value of every fruit and bug image and the basket geometry.
+
+    Returns:
+        Dict[str, Any]: The rules.
+    """
+    windowWidth, windowHeight = windowConfig
+    sizes: Dict[str, List[Tuple[int, int]]] = {}
+    values: Dict[str, List[int]] = {}
+    for kind, base in (("fruit", 10), ("bug", 11)):
+        files: List[Path] = sorted(file for file in Path(folderPaths[kind]).iterdir() if file.is_file())
+        sizes[kind] = [
+            tuple(int(side * spriteScales[kind]) for side in pygame.image.load(str(file)).get_size()) for file in files
+        ]
+        values[kind] = [asset_value(str(file), base) for file in files]
+
+    # Same geometry as Busket: the solid area is a thin strip near the bottom of the basket image
+    basketWidth, basketHeight = (int(side * spriteScales["player"]) for side in pygame.image.load(filePaths["player"]).get_size())
+    return {
+        "windowWH": windowConfig,
+        "simulationHz": simulationHz,
+        "levels": LevelTable.load(filePaths["levels"]),
+        "spawnRates": spawnRates,
+        "spawnRanges": spawnRanges,
+        "sizes": sizes,
+        "values": values,
+        "basketSize": (basketWidth, basketHeight),
+        "basketSolid": (basketWidth - 50, 10, 25, basketHeight - 25),
+        "basketY": windowHeight - 150,
+        "basketRange": (-100, windowWidth),
+        "playerSpeedScale": playerSpeedScale,
+        "startLive": 100
+    }
+
+def make_env(games: int, actionRepeat: int = 4, seed: Optional[int] = None) -> BatchEnv:
+    """
+    Creates a batched environment running the game's rules.
+
+    Args:
+        games (int): Number of games in the batch.
+        actionRepeat (int, optional): Simulation ticks run per step. Defaults to 4.
+        seed (int, optional): Seed of the environment. Defaults to a random seed.
+
+    Returns:
+        BatchEnv: The environment.
+    """
+    return BatchEnv(games, game_rules(), actionRepeat, seed)
+
+def measure(games: int, steps: int, actionRepeat: int, seed: int, frames: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Runs a random policy and measures the environment throughput.
+
+    Args:
+        games (int): Number of games in the batch.
+        steps (int): Number of batched steps.
+        actionRepeat (int): Simulation ticks run per step.
+        seed (int): Seed of the environment and of the policy.
+        frames (str, optional): Folder the debug frames of game 0 are saved to. Defaults to no frames.
+
+    Returns:
+        Dict[str, Any]: Steps and simulation ticks per second, episodes finished and mean reward.
+    """
+    import numpy
+
+    env: BatchEnv = make_env(games, actionRepeat, seed)
+    policy = numpy.random.default_rng(seed)
+    if frames:
+        os.makedirs(frames, exist_ok=True)
+
+    episodes: int = 0
+    totalReward: float = 0.0
+    start: float = time.perf_counter()
+    for step in range(steps):
+        observations, rewards, done = env.step(policy.integers(len(BatchEnv.ACTIONS), size=games))
+        episodes += int(done.sum())
+        totalReward += float(rewards.sum())
+        if frames and step % 10 == 0:
+            pygame.image.save(env.render(0), os.path.join(frames, f"frame_{step:05d}.png"))
+    wallTime: float = time.perf_counter() - start
+
+    return {
+        "games": games,
+        "steps": steps,
+        "actionRepeat": actionRepeat,
+        "observationSize": env.observation_size(),
+        "wallSeconds": wallTime,
+        "batchedStepsPerSecond": steps / wallTime,
+        "gameStepsPerSecond": steps * games / wallTime,
+        "simulatedSecondsPerSecond": steps * games * actionRepeat / simulationHz / wallTime,
+        "episodes": episodes,
+        "meanRewardPerStep": totalReward / (steps * games)
+    }
+
+def main() -> None:
+    """
+    Measures the batched environment under a random policy and prints (or writes) the results.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=f"{Game.NAME} batched environment throughput")
+    parser.add_argument("--games", type=int, nargs="+", default=[1, 64, 1024], help="batch sizes to measure")
+    parser.add_argument("--steps", type=int, default=500, help="batched steps per measurement")
+    parser.add_argument("--action-repeat", type=int, default=4, help="simulation ticks per step")
+    parser.add_argument("--seed", type=int, default=1234, help="environment and policy seed")
+    parser.add_argument("--frames", help="save a debug frame of game 0 every 10 steps to this folder")
+    parser.add_argument("--out", help="output JSON file")
+    args: argparse.Namespace = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    for games in args.games:
+        result: Dict[str, Any] = measure(games, args.steps, args.action_repeat, args.seed, args.frames)
+        results.append(result)
+        print(f"{games:5d} games: {result['gameStepsPerSecond']:10.0f} game steps/s, "
+              f"{result['simulatedSecondsPerSecond']:8.0f} simulated s/s, {result['episodes']} episodes")
+    if args.out:
+        with open(args.out, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+if __name__ == "__main__":
+    # Measure the batched environment
+    main()
@@ -0,0 +1,379 @@
+import gc
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import pygame
+from typing import Any, Callable, Dict, List
+
+from utility import *  # Importing utility functions and constants
+from gameObjects import Fruit, Bug  # Importing game object classes
+from gameSystems import LevelTable, Snapshot, Autosaver, AnalyticsStore, atomic_write, ScriptedInput, surfaceCache, rotationCache, resident_memory  # Importing the level table, the snapshots, the analytics store, the scripted input source, the asset caches and the memory probe
+import main as gameModule
+from main import Game
+
+# Stress levels: last level physics with raised spawn limits and spawn rates
+stressLevels: Dict[str, Dict[str, int]] = {
+    "stress200": {"fruitSpwanLimit": 120, "bugSpwanLimit": 80},
+    "stress500": {"fruitSpwanLimit": 300, "bugSpwanLimit": 200},
+}
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """
+    Returns the p50/p95/p99 (and mean/max) of a list of samples in milliseconds.
+
+    Args:
+        samples (List[float]): Samples in seconds.
+
+    Returns:
+        Dict[str, float]: The statistics in milliseconds.
+    """
+    ordered: List[float] = sorted(samples)
+    pick: Callable[[float], float] = lambda q: ordered[min(int(q * len(ordered)), len(ordered) - 1)] * 1000
+    return {
+        "mean": sum(ordered) / len(ordered) * 1000,
+        "p50": pick(.50),
+        "p95": pick(.95),
+        "p99": pick(.99),
+        "max": ordered[-1] * 1000
+    }
+
+def pin_level(game: Game, lvl: int) -> None:
+    """
+    Keeps the game in PlayState on the given level with full lives.
+
+    Args:
+        game (Game): The game being measured.
+        lvl (int): The level to stay on.
+    """
+    game.state = Game.STATE[0]
+    game.point = game.levels[lvl].minScore
+    game.lvl = lvl
+    game.player.live = 100
+
+def run_frames(game: Game, lvl: int, frames: int, frameTime: float) -> List[float]:
+    """
+    Drives the game for a number of frames and returns the time taken by each of them.
+
+    Args:
+        game (Game): The game being measured.
+        lvl (int): The level the game is pinned on.
+        frames (int): Number of frames to run.
+        frameTime (float): Simulated time between two frames.
+
+    Returns:
+        List[float]: Wall time of every frame in seconds.
+    """
+    samples: List[float] = []
+    for _ in range(frames):
+        pin_level(game, lvl)
+        start: float = time.perf_counter()
+        game.step_frame(frameTime)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+def measure_level(game: Game, lvl: int, frames: int, frameTime: float, seed: int) -> Dict[str, Any]:
+    """
+    Measures frame times, allocations and sprite counts for one level.
+
+    Args:
+        game (Game): The game being measured.
+        lvl (int): The level to measure.
+        frames (int): Number of measured frames.
+        frameTime (float): Simulated time between two frames.
+        seed (int): Seed of the game's random number generator for this level.
+
+    Returns:
+        Dict[str, Any]: The level results.
+    """
+    game.rng.seed(seed)
+    game.inputSource = ScriptedInput.alternating((pygame.K_LEFT, pygame.K_RIGHT), 20, frames * 2)
+
+    # Warm up until the sprite groups reach their steady state
+    run_frames(game, lvl, min(frames, 300), frameTime)
+
+    gcBefore: int = sum(stat["collections"] for stat in gc.get_stats())
+    samples: List[float] = run_frames(game, lvl, frames, frameTime)
+    gcCollections: int = sum(stat["collections"] for stat in gc.get_stats()) - gcBefore
+    sprites: int = len(game.fruitGroup) + len(game.bugGroup)
+
+    # Allocations are traced in a separate, shorter pass so tracing does not skew the frame times
+    allocFrames: int = max(frames // 4, 1)
+    tracemalloc.start()
+    blocksBefore: int = sys.getallocatedblocks()
+    run_frames(game, lvl, allocFrames, frameTime)
+    blocksAfter: int = sys.getallocatedblocks()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "frames": frames,
+        "frameMs": percentiles(samples),
+        "snapshot": measure_snapshot(game),
+        "spritesAtEnd": sprites,
+        "gcCollections": gcCollections,
+        "allocations": {
+            "netBlocksPerFrame": (blocksAfter - blocksBefore) / allocFrames,
+            "tracedPeakKiB": peak / 1024
+        }
+    }
+
+def measure_snapshot(game: Game, rounds: int = 20) -> Dict[str, Any]:
+    """
+    Measures the size of a session snapshot and the latency of capturing, encoding, decoding,
+    restoring and writing it, the last both directly and through the background autosaver.
+
+    Args:
+        game (Game): The game in its current state.
+        rounds (int, optional): Number of measured rounds. Defaults to 20.
+
+    Returns:
+        Dict[str, Any]: Snapshot size, sprite count and latency percentiles per operation.
+    """
+    samples: Dict[str, List[float]] = {name: [] for name in ("capture", "encode", "decode", "restore", "write", "autosaveSubmit")}
+    path: str = os.path.join(tempfile.gettempdir(), "benchmark_snapshot.fbs")
+    autosaver: Autosaver = Autosaver(path)
+
+    def timed(name: str, job: Callable[[], Any]) -> Any:
+        start: float = time.perf_counter()
+        result: Any = job()
+        samples[name].append(time.perf_counter() - start)
+        return result
+
+    for _ in range(rounds):
+        snapshot: Snapshot = timed("capture", game.snapshot)
+        data: bytes = timed("encode", snapshot.encode)
+        restored: Snapshot = timed("decode", lambda: Snapshot.decode(data))
+        timed("restore", lambda: game.restore(restored))
+        timed("write", lambda: atomic_write(path, data))
+        # The game loop only pays for the capture and the hand-off, the autosaver thread does the rest
+        timed("autosaveSubmit", lambda: autosaver.submit(game.snapshot()))
+        autosaver.flush()
+    autosaver.close()
+    os.remove(path)
+
+    return {
+        "bytes": len(data),
+        "sprites": len(snapshot.sprites),
+        "latencyMs": {name: percentiles(values) for name, values in samples.items()},
+        "autosaver": autosaver.stats()
+    }
+
+def measure_idle(game: Game, frames: int, frameTime: float) -> Dict[str, Any]:
+    """
+    Measures the frames of the static menu screen, which is drawn once and then skipped until it changes.
+
+    Args:
+        game (Game): The game being measured.
+        frames (int): Number of measured frames.
+        frameTime (float): Simulated time between two frames.
+
+    Returns:
+        Dict[str, Any]: Frame-time percentiles and the number of drawn and skipped frames.
+    """
+    game.state = Game.STATE[1]
+    game.inputSource = ScriptedInput()
+    before: Dict[str, float] = dict(game.scheduler.stats().get(game.state, {"drawn": 0, "skipped": 0}))
+
+    samples: List[float] = []
+    for _ in range(frames):
+        start: float = time.perf_counter()
+        game.step_frame(frameTime)
+        samples.append(time.perf_counter() - start)
+
+    after: Dict[str, Any] = game.scheduler.stats()[game.state]
+    return {
+        "frames": frames,
+        "frameMs": percentiles(samples),
+        "drawn": after["drawn"] - before["drawn"],
+        "skipped": after["skipped"] - before["skipped"]
+    }
+
+def measure_analytics(game: Game, lvl: int, frames: int, frameTime: float, seed: int, blocks: int = 10) -> Dict[str, Any]:
+    """
+    Measures the frame times of a level with and without the analytics store attached. The two
+    cases alternate in short blocks so drift of the machine affects both the same way.
+
+    Args:
+        game (Game): The game being measured.
+        lvl (int): The level to measure.
+        frames (int): Number of measured frames per case.
+        frameTime (float): Simulated time between two frames.
+        seed (int): Seed of the game's random number generator.
+        blocks (int, optional): Number of blocks per case. Defaults to 10.
+
+    Returns:
+        Dict[str, Any]: Frame-time percentiles of both cases and the store counters.
+    """
+    game.rng.seed(seed)
+    game.inputSource = ScriptedInput.alternating((pygame.K_LEFT, pygame.K_RIGHT), 20, frames * 3)
+    run_frames(game, lvl, min(frames, 300), frameTime)
+
+    samples: Dict[str, List[float]] = {"off": [], "on": []}
+    blockFrames: int = max(frames // blocks, 1)
+    with tempfile.TemporaryDirectory() as folder:
+        store: AnalyticsStore = AnalyticsStore(os.path.join(folder, "analytics.db"))
+        try:
+            for _ in range(blocks):
+                game.analytics = None
+                samples["off"].extend(run_frames(game, lvl, blockFrames, frameTime))
+                game.analytics = store
+                samples["on"].extend(run_frames(game, lvl, blockFrames, frameTime))
+        finally:
+            game.analytics = None
+            store.close()
+        stats: Dict[str, Any] = store.stats()
+
+    return {"frameMs": {name: percentiles(values) for name, values in samples.items()}, "store": stats}
+
+def measure_spawns(game: Game, count: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measures the cost of creating fruit and bug sprites.
+
+    Args:
+        game (Game): The game providing the assets.
+        count (int): Number of sprites created per kind.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Spawn time statistics per kind.
+    """
+    group: pygame.sprite.Group = pygame.sprite.Group()
+    results: Dict[str, Dict[str, float]] = {}
+
+    for kind, spawn in (
+        ("fruit", lambda asset: Fruit((asset,), group, game.windowConfig, True, spriteScales["fruit"], animateDrops, 10, 330, (30, 50))),
+        ("bug", lambda asset: Bug((asset,), group, game.windowConfig, True, spriteScales["bug"], animateDrops, 11, 333, (50, 100))),
+    ):
+        assets: List[str] = game.fruitsAssets if kind == "fruit" else game.bugAssets
+        samples: List[float] = []
+        for index in range(count):
+            start: float = time.perf_counter()
+            spawn(assets[index % len(assets)])
+            samples.append(time.perf_counter() - start)
+        group.empty()
+        results[kind] = percentiles(samples)
+
+    return results
+
+def measure_music_memory() -> Dict[str, Any]:
+    """
+    Compares the resident memory of the music tracks decoded into Sound objects with streaming them
+    through pygame.mixer.music.
+
+    Returns:
+        Dict[str, Any]: Decoded PCM size, resident memory growth and load time of both approaches.
+    """
+    tracks: List[str] = [filePaths["menuMusic"], filePaths["bgMusic"]]
+    frequency, size, channels = pygame.mixer.get_init()
+
+    before: int = resident_memory()
+    start: float = time.perf_counter()
+    sounds: List[pygame.mixer.Sound] = [pygame.mixer.Sound(track) for track in tracks]
+    decodeTime: float = time.perf_counter() - start
+    decoded: Dict[str, Any] = {
+        "pcmKiB": sum(sound.get_length() * frequency * channels * abs(size) // 8 for sound in sounds) / 1024,
+        "residentKiB": (resident_memory() - before) / 1024,
+        "loadMs": decodeTime * 1000
+    }
+    del sounds
+    gc.collect()
+
+    before = resident_memory()
+    start = time.perf_counter()
+    for track in tracks:
+        pygame.mixer.music.load(track)
+    streamTime: float = time.perf_counter() - start
+    streamed: Dict[str, Any] = {
+        "residentKiB": (resident_memory() - before) / 1024,
+        "loadMs": streamTime * 1000
+    }
+    pygame.mixer.music.unload()
+
+    return {"decoded": decoded, "streamed": streamed}
+
+def main() -> None:
+    """
+    Runs the benchmark suite and writes the results to a JSON file.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=f"{Game.NAME} frame-time benchmark")
+    parser.add_argument("--frames", type=int, default=1200, help="measured frames per level")
+    parser.add_argument("--fps", type=int, default=60, help="simulated frame rate")
+    parser.add_argument("--spawns", type=int, default=2000, help="sprites created per kind for the spawn cost")
+    parser.add_argument("--seed", type=int, default=1, help="base seed of the game's random number generator")
+    parser.add_argument("--physics", choices=("sprite", "numpy"), default=physicsBackend, help="physics backend")
+    parser.add_argument("--out", default="benchmark.json", help="output JSON file")
+    args: argparse.Namespace = parser.parse_args()
+
+    gameModule.physicsBackend = args.physics
+    game: Game = Game(windowConfig, headless=True)
+    game.wait_for_assets()
+    frameTime: float = 1 / args.fps
+    results: Dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "frames": args.frames,
+            "fps": args.fps,
+            "seed": args.seed,
+            "simulationHz": simulationHz,
+            "dirtyRectRendering": dirtyRectRendering,
+            "physicsBackend": args.physics,
+            "animateDrops": animateDrops,
+            "rotationSteps": rotationSteps
+        },
+        "startup": {"timeline": game.loader.timeline(), "blockedMs": game.loader.blocked * 1000},
+        "levels": {},
+        "stress": {}
+    }
+
+    for lvl in range(1, game.levels.maxLevel + 1):
+        results["levels"][str(lvl)] = measure_level(game, lvl, args.frames, frameTime, args.seed + lvl)
+        print(f"level {lvl}: {results['levels'][str(lvl)]['frameMs']}")
+
+    for name, limits in stressLevels.items():
+        saved: LevelTable = game.levels
+        savedRates: Dict[str, float] = dict(spawnRates)
+        game.levels = saved.replace(saved.maxLevel, **limits)
+        spawnRates.update({"fruit": 400.0, "bug": 300.0})
+        try:
+            results["stress"][name] = measure_level(game, saved.maxLevel, args.frames, frameTime, args.seed)
+        finally:
+            game.levels = saved
+            spawnRates.update(savedRates)
+        print(f"{name}: {results['stress'][name]['frameMs']}")
+        snapshot: Dict[str, Any] = results["stress"][name]["snapshot"]
+        print(f"{name} snapshot: {snapshot['bytes']} bytes for {snapshot['sprites']} sprites, "
+              f"capture {snapshot['latencyMs']['capture']['p50']:.3f} ms, restore {snapshot['latencyMs']['restore']['p50']:.3f} ms, "
+              f"write {snapshot['latencyMs']['write']['p50']:.3f} ms")
+
+    results["idle"] = measure_idle(game, args.frames, frameTime)
+    print(f"idle menu: {results['idle']['drawn']} drawn, {results['idle']['skipped']} skipped, {results['idle']['frameMs']}")
+
+    results["analytics"] = measure_analytics(game, game.levels.maxLevel, args.frames, frameTime, args.seed)
+    print(f"analytics: off {results['analytics']['frameMs']['off']}, on {results['analytics']['frameMs']['on']}")
+
+    results["music"] = measure_music_memory()
+    print(f"music: {results['music']}")
+    results["spawnUs"] = {
+        kind: {key: value * 1000 for key, value in stats.items()}
+        for kind, stats in measure_spawns(game, args.spawns).items()
+    }
+    results["surfaceCache"] = surfaceCache.stats()
+    results["rotationCache"] = rotationCache.stats()
+    results["pools"] = {"fruit": game.fruitPool.stats(), "bug": game.bugPool.stats()}
+    results["collision"] = game.collider.stats()
+    results["soundEffects"] = game.sounds.stats()
+
+    with open(args.out, "w") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+    print(f"results written to {args.out}")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    # Run the benchmark suite
+    main()
@@ -0,0 +1,28 @@
+import time
+import argparse
+from typing import List, Tuple
+
+from utility import *  # Importing utility functions and constants
+from gameSystems import TextureAtlas  # Importing the texture atlas builder
+from main import Game
+
+def main() -> None:
+    """
+    Packs the fruit, bug and player sprites into the texture atlas (only when it is stale unless --force is given).
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=f"{Game.NAME} sprite atlas builder")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the atlas is up to date")
+    args: argparse.Namespace = parser.parse_args()
+
+    entries: List[Tuple[str, float]] = Game.sprite_atlas_entries()
+    if not args.force and not TextureAtlas.is_stale(entries, filePaths["atlasImage"], filePaths["atlasIndex"]):
+        print(f"{filePaths['atlasImage']} is up to date ({len(entries)} images)")
+        return
+
+    start: float = time.perf_counter()
+    TextureAtlas.build(entries, filePaths["atlasImage"], filePaths["atlasIndex"])
+    print(f"packed {len(entries)} images into {filePaths['atlasImage']} in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    # Build the sprite atlas
+    main()
@@ -1,8 +1,10 @@
 import math
 import pygame
-from typing import Tuple
+from typing import Dict, Tuple
 import random
 
+from gameSystems import rotationCache, surfaceCache
+
 class StaticBackgroundImageBaseClass:
     def __init__(self: "StaticBackgroundImageBaseClass", imgPath: str, pos: Tuple[int]) -> None:
         """
@@ -12,13 +14,16 @@ class StaticBackgroundImageBaseClass:
             imgPath (str): The file path of the background image.
             pos (Tuple[int]): The position of the background image.
         """
-        self.image: "pygame.surface.Surface" = pygame.image.load(imgPath).convert_alpha()
+        # The background is opaque, so it is stored in the display pixel format without per-pixel alpha
+        self.image: "pygame.surface.Surface" = pygame.image.load(imgPath).convert()
         self.posRect: "pygame.Rect" = self.image.get_rect()
         self.posRect.x, self.posRect.y = pos
-        
+        self.scaledImages: Dict[Tuple[int, int], "pygame.surface.Surface"] = {}
+
     def get_render_object(self: "StaticBackgroundImageBaseClass", scaleFactor=None) -> "pygame.surface.Surface":
         """
         Returns a scaled background image.
+        The scaled surface is memoized per target size, so it is only rebuilt when the window size changes.
 
         Args:
             scaleFactor: The scale factor for the background image. Defaults to None.
@@ -27,7 +32,10 @@ class StaticBackgroundImageBaseClass:
             pygame.surface.Surface: The scaled background image.
         """
         if scaleFactor:
-            scaledImage = pygame.transform.scale(self.image, (self.image.get_width(), self.image.get_height() * scaleFactor))
+            size: Tuple[int, int] = (self.image.get_width(), int(self.image.get_height() * scaleFactor))
+            scaledImage: "pygame.surface.Surface" = self.scaledImages.get(size)
+            if scaledImage is None:
+                scaledImage = self.scaledImages[size] = pygame.transform.scale(self.image, size).convert()
             return scaledImage
         return self.image
     
@@ -46,6 +54,7 @@ class DropAbleSpriteBaseClass(pygame.sprite.Sprite):
 
     Attributes:
         __DEFAULT_GRAVITY (int): Default gravity value affecting the downward acceleration of the sprite.
+        imagesSrc (Tuple[str]): File paths of the sprite images.
         singleSrcImgSprite (bool): Flag indicating if the sprite has a single source image.
         windowWH (Tuple[int]): Window dimensions (width, height).
         animate (bool): Flag indicating if animation is enabled for the sprite.
@@ -56,23 +65,37 @@ class DropAbleSpriteBaseClass(pygame.sprite.Sprite):
         oscillationDirection (int): Direction of oscillation (-1 for left, 1 for right).
         rotation_angle (float): Accumulated rotation angle during oscillation.
         rotation_speed (float): Speed at which the rotation angle changes.
+        swingAngle (float): Current swing offset around rotation_angle, in degrees.
+        swingAmplitude (float): Maximum swing offset, in degrees.
+        spawnOffsetY (int): Vertical re-centering offset of the spawn frame.
+        swingOffsetY (int): Vertical shift of the shown frame against the spawn frame, keeps the rect centered while its size changes.
         spriteGenaratePos (Tuple[int]): Initial position of the sprite.
+        pool (SpritePool): Pool the sprite is returned to when it is killed, None if it is not pooled.
+        physics (ArrayPhysics): Array physics backend owning the sprite's vertical motion, None for the per-sprite path.
+        physicsRow (int): Row of the sprite in the array physics backend.
 
     Methods:
         __init__: Initializes the DropAbleSpriteBaseClass instance.
+        __seed: Sets up (or resets) the sprite's state, shared by __init__ and reseed.
+        reseed: Re-initializes a recycled sprite in place.
+        kill: Removes the sprite from its groups and returns it to its pool.
         __apply_physics: Applies physics simulation to the sprite based on gravity and time.
         __fall_rotation: Applies a swinging effect to the sprite during its fall.
+        __apply_rotation: Shows the pre-rendered frame closest to an angle and re-centers the rect.
         __handle_single_src_image: Handles loading and scaling of a single source image for the sprite.
         __handle_multi_src_images: Handles loading and scaling of multiple source images for the sprite.
         load_src_images: Chooses between handling a single or multiple source images based on input.
         make_images: Initializes the sprite's image, rect, and position vector.
-        animate: Placeholder method for sprite animation (to be implemented).
+        animate_sprite: Swings the sprite back and forth around its spawn angle.
         update: Updates the sprite's state based on time and physics, handles animation, and checks if the sprite has fallen out of the window.
+        interpolate: Places the sprite's rect between the previous and the current simulation step for rendering.
+        motion_state: Returns the spawn position, vertical motion and rotation of the sprite.
+        restore_motion: Restores a state returned by motion_state.
     """
 
     __DEFAULT_GRAVITY: int = 377
 
-    def __init__(self, imagesSrc: Tuple[str], groups: "pygame.sprite.Group", windowWH: Tuple[int], scaleable: bool, scaleValue: float, animate: bool, randomFactor: Tuple[int] = None) -> None:
+    def __init__(self, imagesSrc: Tuple[str], groups: "pygame.sprite.Group", windowWH: Tuple[int], scaleable: bool, scaleValue: float, animate: bool, randomFactor: Tuple[int] = None, rng: random.Random = None) -> None:
         """
         Initializes a DropAbleSpriteBaseClass instance.
 
@@ -84,9 +107,32 @@ class DropAbleSpriteBaseClass(pygame.sprite.Sprite):
             scaleValue (float): Scale factor of the sprite.
             animate (bool): Flag indicating if animation is enabled for the sprite.
             randomFactor (Tuple[int], optional): Tuple representing random factors for sprite generation. Defaults to None.
+            rng (random.Random, optional): Random number generator of the game. Defaults to the random module.
         """
         super().__init__(groups)
 
+        self.pool = None
+        self.physics = None
+        self.physicsRow: int = None
+        self.posVector: "pygame.math.Vector2" = None
+        self.__seed(imagesSrc, windowWH, scaleable, scaleValue, animate, randomFactor, rng)
+
+    def __seed(self, imagesSrc: Tuple[str], windowWH: Tuple[int], scaleable: bool, scaleValue: float, animate: bool, randomFactor: Tuple[int] = None, rng: random.Random = None) -> None:
+        """
+        Sets up (or resets) the sprite's state, shared by __init__ and reseed.
+
+        Args:
+            imagesSrc (Tuple[str]): Tuple containing file paths of sprite images.
+            windowWH (Tuple[int]): Window dimensions (width, height).
+            scaleable (bool): Flag indicating if the sprite is scalable.
+            scaleValue (float): Scale factor of the sprite.
+            animate (bool): Flag indicating if animation is enabled for the sprite.
+            randomFactor (Tuple[int], optional): Tuple representing random factors for sprite generation. Defaults to None.
+            rng (random.Random, optional): Random number generator of the game. Defaults to the random module.
+        """
+        if rng is None:
+            rng = random  # The module level functions share the global generator
+        self.imagesSrc: Tuple[str] = imagesSrc
         self.singleSrcImgSprite: bool = False
         self.windowWH: Tuple[int] = windowWH
         self.animate: bool = animate
@@ -94,35 +140,64 @@ class DropAbleSpriteBaseClass(pygame.sprite.Sprite):
         self.scaleValue: float = scaleValue
         self.gravity: int = DropAbleSpriteBaseClass.__DEFAULT_GRAVITY
         self.acc: float = 0.0
-        self.oscillationDirection: int = random.choice([1, -1])
+        self.oscillationDirection: int = rng.choice([1, -1])
         self.rotation_angle: float = 0.0
-        self.rotation_speed: float = random.uniform(100.0, 500.0)
+        self.rotation_speed: float = rng.uniform(100.0, 500.0)
 
         if randomFactor:
             self.spriteGenaratePos: Tuple[int] = (
-                random.randint(randomFactor[0], randomFactor[1]),
-                -1 * random.randint(100, 150),
+                rng.randint(randomFactor[0], randomFactor[1]),
+                -1 * rng.randint(100, 150),
             )
         else:
             self.spriteGenaratePos: Tuple[int] = (
-                random.randint(0, windowWH[0]),
-                -1 * random.randint(100, 150),
+                rng.randint(0, windowWH[0]),
+                -1 * rng.randint(100, 150),
             )
 
         self.load_src_images(imagesSrc, scaleable, scaleValue)
         self.make_images()
         self.__fall_rotation()
 
+    def reseed(self, imagesSrc: Tuple[str], groups: "pygame.sprite.Group", windowWH: Tuple[int], scaleable: bool, scaleValue: float, animate: bool, randomFactor: Tuple[int] = None, rng: random.Random = None) -> None:
+        """
+        Re-initializes a recycled sprite in place (position, gravity, rotation, image) and adds it back to its groups.
+
+        Args:
+            imagesSrc (Tuple[str]): Tuple containing file paths of sprite images.
+            groups (pygame.sprite.Group): Sprite groups to which the sprite belongs.
+            windowWH (Tuple[int]): Window dimensions (width, height).
+            scaleable (bool): Flag indicating if the sprite is scalable.
+            scaleValue (float): Scale factor of the sprite.
+            animate (bool): Flag indicating if animation is enabled for the sprite.
+            randomFactor (Tuple[int], optional): Tuple representing random factors for sprite generation. Defaults to None.
+            rng (random.Random, optional): Random number generator of the game. Defaults to the random module.
+        """
+        self.__seed(imagesSrc, windowWH, scaleable, scaleValue, animate, randomFactor, rng)
+        self.add(groups)
+
+    def kill(self) -> None:
+        """
+        Removes the sprite from its groups, detaches it from the array physics backend and returns it to its pool.
+        """
+        wasAlive: bool = self.alive()
+        super().kill()
+        if self.physics is not None:
+            self.physics.detach(self)
+        if wasAlive and self.pool is not None:
+            self.pool.release(self)
+
     def __apply_physics(self, dt: float) -> None:
         """
         Applies physics simulation to the sprite based on gravity and time.
 
         Args:
-            dt (float): Time passed since the last frame.
+            dt (float): Length of the simulation step.
         """
+        self.prevPosY = self.posVector.y
         self.acc += self.gravity * dt
         self.posVector.y += self.acc * dt
-        self.rect.y = round(self.posVector.y)
+        self.rect.y = round(self.posVector.y) - self.swingOffsetY
 
     def __fall_rotation(self, amplitude: float = 10.0) -> None:
         """
@@ -132,13 +207,33 @@ class DropAbleSpriteBaseClass(pygame.sprite.Sprite):
             amplitude (float, optional): Amplitude of the swinging effect. Defaults to 10.0.
         """
         self.rotation_angle += self.oscillationDirection * self.rotation_speed
-        rotated_image: "pygame.surface.Surface" = pygame.transform.rotate(self.srcImages[0], self.rotation_angle)
-        self.image = rotated_image
-        self.rect = rotated_image.get_rect(center=self.rect.center)
+        self.swingAngle: float = 0.0
+        self.swingAmplitude: float = amplitude
+        self.spawnOffsetY: int = rotationCache.frame(self.srcImages[0], self.rotation_angle)[1][1]
+        self.swingOffsetY: int = 0
+        self.__apply_rotation(self.rotation_angle)
+
+    def __apply_rotation(self, angle: float) -> None:
+        """
+        Shows the pre-rendered frame closest to an angle and re-centers the rect on the unrotated
+        image. The physics step owns the vertical position, the rect top sits swingOffsetY above it,
+        so the sprite does not drift when the frame size changes during the swing.
+        The frames are shared by every sprite through the process wide rotation cache.
+
+        Args:
+            angle (float): Rotation angle in degrees.
+        """
+        self.image, offset = rotationCache.frame(self.srcImages[0], angle)
+        swingOffsetY: int = offset[1] - self.spawnOffsetY
+        self.rect.size = self.image.get_size()
+        self.rect.x = self.spriteGenaratePos[0] - offset[0]
+        self.rect.y += self.swingOffsetY - swingOffsetY
+        self.swingOffsetY = swingOffsetY
 
     def __handle_single_src_image(self, imagesSrc: Tuple[str], scaleable: bool, scaleValue: float) -> None:
         """
         Handles loading and scaling of a single source image for the sprite.
+        The surface is shared through the process wide surface cache, so it is only decoded once.
 
         Args:
             imagesSrc (Tuple[str]): Tuple containing file paths of sprite images.
@@ -146,12 +241,7 @@ class DropAbleSpriteBaseClass(pygame.sprite.Sprite):
             scaleValue (float): Scale factor of the sprite.
         """
         self.singleSrcImgSprite = True
-        self.srcImages = [pygame.image.load(imagesSrc[0]).convert_alpha()]
-
-        if scaleable:
-            self.srcImages[0] = pygame.transform.scale(
-                self.srcImages[0], (int(self.srcImages[0].get_width() * scaleValue), int(self.srcImages[0].get_height() * scaleValue))
-            )
+        self.srcImages = [surfaceCache.get(imagesSrc[0], scaleValue if scaleable else None)]
 
     def __handle_multi_src_images(self, imagesSrc: Tuple[str], scaleable: bool, scaleValue: float) -> None:
         """
@@ -162,15 +252,7 @@ class DropAbleSpriteBaseClass(pygame.sprite.Sprite):
             scaleable (bool): Flag indicating if the sprite is scalable.
             scaleValue (float): Scale factor of the sprite.
         """
-        self.srcImages = []
-
-        for srcImg in imagesSrc:
-            img = pygame.image.load(srcImg).convert_alpha()
-            if scaleable:
-                img = pygame.transform.scale(
-                    img, (int(img.get_width() * scaleValue), int(img.get_height() * scaleValue))
-                )
-            self.srcImages.append(img)
+        self.srcImages = [surfaceCache.get(srcImg, scaleValue if scaleable else None) for srcImg in imagesSrc]
 
     def load_src_images(self, imagesSrc: Tuple[str], scaleable: bool, scaleValue: float) -> None:
         """
@@ -192,27 +274,89 @@ class DropAbleSpriteBaseClass(pygame.sprite.Sprite):
         """
         self.image = self.srcImages[0]
         self.rect = self.image.get_rect(topleft=self.spriteGenaratePos)
-        self.posVector = pygame.math.Vector2(self.rect.topleft)
+        if self.posVector is None:
+            self.posVector = pygame.math.Vector2(self.rect.topleft)
+        else:
+            self.posVector.update(self.rect.topleft)
+        self.prevPosY: float = self.posVector.y
 
     def animate_sprite(self, dt: float) -> None:
         """
-        Placeholder method for sprite animation (to be implemented).
+        Swings the sprite back and forth around its spawn angle, at a tenth of its rotation speed.
+        Only the frame index changes, no surface is rotated per frame.
 
         Args:
-            dt (float): Time passed since the last frame.
+            dt (float): Length of the simulation step.
         """
-        # TO-DO
-        pass
+        self.swingAngle += self.oscillationDirection * self.rotation_speed * .1 * dt
+        if abs(self.swingAngle) >= self.swingAmplitude:
+            self.swingAngle = math.copysign(self.swingAmplitude, self.swingAngle)
+            self.oscillationDirection *= -1
+        self.__apply_rotation(self.rotation_angle + self.swingAngle)
 
     def update(self, dt: float) -> None:
         """
         Updates the sprite's state based on time and physics, handles animation, and checks if the sprite has fallen out of the window.
 
         Args:
-            dt (float): Time passed since the last frame.
+            dt (float): Length of the simulation step.
         """
         self.__apply_physics(dt)
         if self.animate:
             self.animate_sprite(dt)
         if self.posVector.y > self.windowWH[1] + 100:
             self.kill()
+
+    def interpolate(self, alpha: float) -> None:
+        """
+        Places the sprite's rect between the previous and the current simulation step for rendering.
+
+        Args:
+            alpha (float): Fraction of a simulation step elapsed since the last step (0.0 to 1.0).
+        """
+        self.rect.y = round(self.prevPosY + (self.posVector.y - self.prevPosY) * alpha) - self.swingOffsetY
+
+    def motion_state(self) -> Tuple[int, int, float, float, float, int, float, float, float, float, int]:
+        """
+        Returns the spawn position, vertical motion and rotation of the sprite, e.g. for a snapshot.
+        With the array physics backend, the rows must be synced back into the sprites first.
+
+        Returns:
+            Tuple: spawnX, spawnY, posY, prevPosY, acc, gravity, rotation_angle, rotation_speed, swingAngle, swingAmplitude, oscillationDirection.
+        """
+        return (
+            self.spriteGenaratePos[0], self.spriteGenaratePos[1], self.posVector.y, self.prevPosY, self.acc,
+            self.gravity, self.rotation_angle, self.rotation_speed, self.swingAngle, self.swingAmplitude, self.oscillationDirection
+        )
+
+    def restore_motion(self, spawnX: int, spawnY: int, posY: float, prevPosY: float, acc: float, gravity: int,
+                       angle: float, speed: float, swing: float, amplitude: float, direction: int) -> None:
+        """
+        Restores a state returned by motion_state and shows the matching rotation frame.
+
+        Args:
+            spawnX (int): Horizontal spawn position.
+            spawnY (int): Vertical spawn position.
+            posY (float): Vertical position.
+            prevPosY (float): Vertical position of the previous simulation step.
+            acc (float): Vertical speed.
+            gravity (int): Gravity.
+            angle (float): Spawn rotation angle.
+            speed (float): Rotation speed.
+            swing (float): Current swing offset.
+            amplitude (float): Maximum swing offset.
+            direction (int): Swing direction.
+        """
+        self.spriteGenaratePos = (spawnX, spawnY)
+        self.posVector.update(spawnX, posY)
+        self.prevPosY = prevPosY
+        self.acc = acc
+        self.gravity = gravity
+        self.rotation_angle = angle
+        self.rotation_speed = speed
+        self.swingAngle = swing
+        self.swingAmplitude = amplitude
+        self.oscillationDirection = direction
+        self.spawnOffsetY = rotationCache.frame(self.srcImages[0], angle)[1][1]
+        self.__apply_rotation(self.rotation_angle + self.swingAngle)
+        self.rect.y = round(posY) - self.swingOffsetY
@@ -1,9 +1,10 @@
+import random
 from typing import Tuple
 from pygame.sprite import Group
 from . import DropAbleSpriteBaseClass
 
 class Bug(DropAbleSpriteBaseClass):
-    def __init__(self, imagesSrc: Tuple[str], groups: Group, windowWH: Tuple[int], scaleable: bool, scaleValue: float, animate: bool, damage: int, gravity: int = None, randomFactor: Tuple[int] = None) -> None:
+    def __init__(self, imagesSrc: Tuple[str], groups: Group, windowWH: Tuple[int], scaleable: bool, scaleValue: float, animate: bool, damage: int, gravity: int = None, randomFactor: Tuple[int] = None, rng: random.Random = None) -> None:
         """
         Constructor for Bug class.
 
@@ -17,9 +18,32 @@ class Bug(DropAbleSpriteBaseClass):
             damage (int): Damage value inflicted by the bug.
             gravity (int, optional): Gravity value for the bug. Defaults to None.
             randomFactor (Tuple[int], optional): Tuple representing a range of random factors. Defaults to None.
+            rng (random.Random, optional): Random number generator of the game. Defaults to the random module.
         """
-        super().__init__(imagesSrc, groups, windowWH, scaleable, scaleValue, animate, randomFactor)
+        super().__init__(imagesSrc, groups, windowWH, scaleable, scaleValue, animate, randomFactor, rng)
         self.damage: int = damage
         
         if gravity:
             self.gravity = gravity
+
+    def reseed(self, imagesSrc: Tuple[str], groups: Group, windowWH: Tuple[int], scaleable: bool, scaleValue: float, animate: bool, damage: int, gravity: int = None, randomFactor: Tuple[int] = None, rng: random.Random = None) -> None:
+        """
+        Re-initializes a recycled bug in place, takes the same arguments as the constructor.
+
+        Args:
+            imagesSrc (Tuple[str]): Tuple of image file paths for the bug.
+            groups (Group): Sprite groups to add the bug to.
+            windowWH (Tuple[int]): Window width and height.
+            scaleable (bool): Flag indicating if the bug is scalable.
+            scaleValue (float): Scale value for the bug.
+            animate (bool): Flag indicating if the bug should be animated.
+            damage (int): Damage value inflicted by the bug.
+            gravity (int, optional): Gravity value for the bug. Defaults to None.
+            randomFactor (Tuple[int], optional): Tuple representing a range of random factors. Defaults to None.
+            rng (random.Random, optional): Random number generator of the game. Defaults to the random module.
+        """
+        super().reseed(imagesSrc, groups, windowWH, scaleable, scaleValue, animate, randomFactor, rng)
+        self.damage: int = damage
+
+        if gravity:
+            self.gravity = gravity
@@ -1,4 +1,7 @@
 import pygame
+from typing import Optional
+
+from gameSystems import surfaceCache
 
 class Busket(pygame.sprite.Sprite):
     def __init__(self, image: str, live: int, posY: int, movementRange: tuple, scaleFactor: float = None) -> None:
@@ -13,38 +16,51 @@ class Busket(pygame.sprite.Sprite):
             scaleFactor (float, optional): Scaling factor for the busket image. Defaults to None.
         """
         self.movementRange = movementRange
-        self.image = pygame.image.load(image).convert_alpha()
-        if scaleFactor:
-            self.image = pygame.transform.scale(self.image, (int(self.image.get_width() * scaleFactor), int(self.image.get_height() * scaleFactor)))
+        self.image = surfaceCache.get(image, scaleFactor)
         self.postRect = self.image.get_rect(topleft=(movementRange[1] // 2, posY))  # Using // for integer division
         solid_area_x = self.postRect.left + 25
         solid_area_y = self.postRect.top + self.postRect.height - 25  # Adjust the position as needed
         solid_area_width = self.postRect.width - 50
         solid_area_height = 10  # Set the height as needed
         self.solidAreaRect = pygame.Rect(solid_area_x, solid_area_y, solid_area_width, solid_area_height)
+        self.posX: float = float(self.postRect.x)  # Exact horizontal position, the rects hold it rounded
+        self.solidOffsetX: int = solid_area_x - self.postRect.x
         self.live = live
+        self.drawnRect: Optional[pygame.Rect] = None
 
-    def move(self, x: int) -> None:
+    def move(self, x: float) -> None:
         """
-        Move the busket horizontally.
+        Move the busket horizontally, clamped to the movement range.
 
         Args:
-            x (int): Amount of horizontal movement.
+            x (float): Amount of horizontal movement.
         """
-        newX = self.postRect[0] + x
+        newX = self.posX + x
+        if newX < self.movementRange[0]:
+            newX = self.movementRange[0]
+        elif newX > self.movementRange[1] - 1:
+            newX = self.movementRange[1] - 1
 
-        if newX in range(*self.movementRange):
-            self.postRect[0] += x
-            self.solidAreaRect[0] += x
+        self.posX = newX
+        self.postRect[0] = round(newX)
+        self.solidAreaRect[0] = self.postRect[0] + self.solidOffsetX
 
-    def draw_on(self, surface: pygame.surface.Surface) -> None:
+    def draw_on(self, surface: pygame.surface.Surface) -> Optional[pygame.Rect]:
         """
         Draw the busket on a surface.
 
         Args:
             surface (pygame.surface.Surface): Surface on which to draw the busket.
+
+        Returns:
+            pygame.Rect: The area that changed since the previous draw, None if the busket did not move.
         """
-        surface.blit(self.image, self.postRect)
+        lastDrawnRect: Optional[pygame.Rect] = self.drawnRect
+        self.drawnRect = surface.blit(self.image, self.postRect)
+
+        if lastDrawnRect == self.drawnRect:
+            return None
+        return self.drawnRect.union(lastDrawnRect) if lastDrawnRect else self.drawnRect
 
     def collision_occurred(self, sprite) -> bool:
         """
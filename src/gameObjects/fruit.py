@@ -1,9 +1,10 @@
+import random
 from typing import Tuple
 from pygame.sprite import Group
 from . import DropAbleSpriteBaseClass  # Assuming DropAbleSpriteBaseClass is defined in another module
 
 class Fruit(DropAbleSpriteBaseClass):
-    def __init__(self, imagesSrc: Tuple[str], groups: Group, windowWH: Tuple[int], scaleable: bool, scaleValue: float, animate: bool, point: int, gravity: int = None, randomFactor: Tuple[int] = None) -> None:
+    def __init__(self, imagesSrc: Tuple[str], groups: Group, windowWH: Tuple[int], scaleable: bool, scaleValue: float, animate: bool, point: int, gravity: int = None, randomFactor: Tuple[int] = None, rng: random.Random = None) -> None:
         """
         Constructor for Fruit class.
 
@@ -17,8 +18,31 @@ class Fruit(DropAbleSpriteBaseClass):
             point (int): Point value associated with the fruit.
             gravity (int, optional): Gravity value affecting the fruit's fall speed. Defaults to None.
             randomFactor (Tuple[int], optional): Tuple representing the range of random factors affecting the fruit's behavior. Defaults to None.
+            rng (random.Random, optional): Random number generator of the game. Defaults to the random module.
         """
-        super().__init__(imagesSrc, groups, windowWH, scaleable, scaleValue, animate, randomFactor)
+        super().__init__(imagesSrc, groups, windowWH, scaleable, scaleValue, animate, randomFactor, rng)
+        self.point: int = point
+
+        if gravity:
+            self.gravity = gravity
+
+    def reseed(self, imagesSrc: Tuple[str], groups: Group, windowWH: Tuple[int], scaleable: bool, scaleValue: float, animate: bool, point: int, gravity: int = None, randomFactor: Tuple[int] = None, rng: random.Random = None) -> None:
+        """
+        Re-initializes a recycled fruit in place, takes the same arguments as the constructor.
+
+        Args:
+            imagesSrc (Tuple[str]): Tuple of image file paths for the fruit.
+            groups (Group): Sprite groups to add the fruit to.
+            windowWH (Tuple[int]): Window width and height.
+            scaleable (bool): Flag indicating if the fruit is scalable.
+            scaleValue (float): Scale value for the fruit.
+            animate (bool): Flag indicating if the fruit should be animated.
+            point (int): Point value associated with the fruit.
+            gravity (int, optional): Gravity value for the fruit. Defaults to None.
+            randomFactor (Tuple[int], optional): Tuple representing a range of random factors. Defaults to None.
+            rng (random.Random, optional): Random number generator of the game. Defaults to the random module.
+        """
+        super().reseed(imagesSrc, groups, windowWH, scaleable, scaleValue, animate, randomFactor, rng)
         self.point: int = point
 
         if gravity:
@@ -0,0 +1,62 @@
+# Importing all objects from the 'assets' module or file in the current package or directory.
+from .assets import *
+
+# Importing all objects from the 'atlas' module or file in the current package or directory.
+from .atlas import *
+
+# Importing all objects from the 'loader' module or file in the current package or directory.
+from .loader import *
+
+# Importing all objects from the 'render' module or file in the current package or directory.
+from .render import *
+
+# Importing all objects from the 'text' module or file in the current package or directory.
+from .text import *
+
+# Importing all objects from the 'inputs' module or file in the current package or directory.
+from .inputs import *
+
+# Importing all objects from the 'profiler' module or file in the current package or directory.
+from .profiler import *
+
+# Importing all objects from the 'pool' module or file in the current package or directory.
+from .pool import *
+
+# Importing all objects from the 'levels' module or file in the current package or directory.
+from .levels import *
+
+# Importing all objects from the 'physics' module or file in the current package or directory.
+from .physics import *
+
+# Importing all objects from the 'collision' module or file in the current package or directory.
+from .collision import *
+
+# Importing all objects from the 'rotation' module or file in the current package or directory.
+from .rotation import *
+
+# Importing all objects from the 'music' module or file in the current package or directory.
+from .music import *
+
+# Importing all objects from the 'sound' module or file in the current package or directory.
+from .sound import *
+
+# Importing all objects from the 'replay' module or file in the current package or directory.
+from .replay import *
+
+# Importing all objects from the 'batch' module or file in the current package or directory.
+from .batch import *
+
+# Importing all objects from the 'snapshot' module or file in the current package or directory.
+from .snapshot import *
+
+# Importing all objects from the 'scheduler' module or file in the current package or directory.
+from .scheduler import *
+
+# Importing all objects from the 'capture' module or file in the current package or directory.
+from .capture import *
+
+# Importing all objects from the 'telemetry' module or file in the current package or directory.
+from .telemetry import *
+
+# Importing all objects from the 'analytics' module or file in the current package or directory.
+from .analytics import *
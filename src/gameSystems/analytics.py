@@ -0,0 +1,483 @@
+import time
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Any, Dict, List, Optional, Tuple
+
+class AnalyticsStore:
+    """
+    AnalyticsStore keeps the history of every session in a local SQLite file: the fruits caught and
+    bugs hit (with their asset and value), the level changes, the game overs and the time of every
+    frame. The game thread only appends rows to in-memory buffers; a background thread writes them
+    in one transaction per batch, so gameplay never waits on the disk.
+
+    The database runs in WAL mode, so the queries (leaderboard, per level and per asset figures)
+    read while batches are written. Besides the raw rows, every batch updates per level and per
+    asset totals, so those queries read a handful of rows however many events were stored.
+
+    Tables:
+        sessions: One row per session (seed, start and end time, final score, level and ticks, game over flag).
+        levels: One row per level played in a session (ticks spent, fruits caught, bugs hit, damage taken).
+        events: One row per event (session, tick, level, kind, asset, value).
+        frames: One row per frame played (session, frame number, frame time in milliseconds).
+        assets: Asset paths referenced by the events.
+        level_totals, asset_totals: Running totals of the levels and events tables.
+
+    Attributes:
+        FRUIT, BUG, LEVEL_UP, GAME_OVER (int): Event kinds.
+        path (str): Path of the database file.
+        flushInterval (float): Longest time rows stay buffered, in seconds.
+        batchSize (int): Number of buffered rows that triggers a flush at once.
+        session (int): Identifier of the running session, None between sessions.
+        recorded (int): Number of rows recorded.
+        written (int): Number of rows written.
+        batches (int): Number of transactions written.
+        failures (int): Number of batches that could not be written.
+
+    Methods:
+        begin_session: Starts a session.
+        fruit_caught: Records a fruit caught.
+        bug_hit: Records a bug hit.
+        level_up: Records a level change.
+        frame: Records the time of a frame.
+        end_session: Ends the running session.
+        flush: Waits until the buffered rows are written.
+        close: Writes the buffered rows and stops the thread.
+        leaderboard: Returns the best finished sessions.
+        level_stats: Returns the totals of every level.
+        asset_stats: Returns the totals of every fruit and bug asset.
+        session_levels: Returns the levels played in one session.
+        frame_stats: Returns the frame-time statistics of one session.
+        stats: Returns the counters.
+        report: Returns a one line summary of the counters.
+    """
+
+    FRUIT: int = 0
+    BUG: int = 1
+    LEVEL_UP: int = 2
+    GAME_OVER: int = 3
+
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            id INTEGER PRIMARY KEY, seed INTEGER, started REAL, ended REAL,
+            score INTEGER, level INTEGER, ticks INTEGER, gameOver INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS levels (
+            session INTEGER, level INTEGER, ticks INTEGER, caught INTEGER, hits INTEGER, damage INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS events (
+            session INTEGER, tick INTEGER, level INTEGER, kind INTEGER, asset INTEGER, value INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS frames (session INTEGER, frame INTEGER, ms REAL);
+        CREATE TABLE IF NOT EXISTS assets (id INTEGER PRIMARY KEY, path TEXT UNIQUE);
+        CREATE TABLE IF NOT EXISTS level_totals (
+            level INTEGER PRIMARY KEY, visits INTEGER, ticks INTEGER, caught INTEGER, hits INTEGER, damage INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS asset_totals (asset INTEGER PRIMARY KEY, kind INTEGER, count INTEGER, value INTEGER);
+        CREATE INDEX IF NOT EXISTS sessionsByScore ON sessions (score DESC) WHERE ended IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS levelsBySession ON levels (session, level);
+        CREATE INDEX IF NOT EXISTS levelsByLevel ON levels (level, ticks);
+        CREATE INDEX IF NOT EXISTS eventsBySession ON events (session, tick);
+        CREATE INDEX IF NOT EXISTS eventsByAsset ON events (kind, asset, level);
+        CREATE INDEX IF NOT EXISTS framesBySession ON frames (session, frame);
+    """
+
+    def __init__(self, path: str, flushInterval: float = 1.0, batchSize: int = 4096) -> None:
+        """
+        Initializes an AnalyticsStore instance, creates the database if needed and starts the writer thread.
+
+        Args:
+            path (str): Path of the database file.
+            flushInterval (float, optional): Longest time rows stay buffered, in seconds. Defaults to 1.0.
+            batchSize (int, optional): Number of buffered rows that triggers a flush at once. Defaults to 4096.
+        """
+        self.path: str = path
+        self.flushInterval: float = flushInterval
+        self.batchSize: int = batchSize
+        self.session: Optional[int] = None
+        self.recorded: int = 0
+        self.written: int = 0
+        self.batches: int = 0
+        self.failures: int = 0
+        self.writeTime: float = 0.0
+        self.maxWriteTime: float = 0.0
+
+        with closing(self.__connect()) as connection:
+            with connection:
+                connection.executescript(AnalyticsStore.SCHEMA)
+            self.__nextSession: int = connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM sessions").fetchone()[0]
+
+        # Per session state, only touched by the game thread
+        self.__level: int = 1
+        self.__levelStart: int = 0
+        self.__levelCounts: List[int] = [0, 0, 0]  # Fruits caught, bugs hit, damage taken on the current level
+        self.__frame: int = 0
+
+        # Buffers swapped out by the writer thread
+        self.__sessions: List[Tuple] = []
+        self.__sessionEnds: List[Tuple] = []
+        self.__levels: List[Tuple] = []
+        self.__events: List[Tuple] = []
+        self.__frames: List[Tuple] = []
+        self.__pending: int = 0
+        self.__busy: bool = False
+        self.__closed: bool = False
+        self.__condition: threading.Condition = threading.Condition()
+        self.__thread: threading.Thread = threading.Thread(target=self.__run, name="analytics", daemon=True)
+        self.__thread.start()
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Opens a connection to the database in WAL mode.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        connection: sqlite3.Connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def __add(self, buffer: List[Tuple], row: Tuple) -> None:
+        """
+        Buffers one row and wakes the writer when a batch is full.
+
+        Args:
+            buffer (List[Tuple]): The buffer of the row's table.
+            row (Tuple): The row.
+        """
+        with self.__condition:
+            buffer.append(row)
+            self.__pending += 1
+            self.recorded += 1
+            if self.__pending >= self.batchSize:
+                self.__condition.notify_all()
+
+    def begin_session(self, seed: int, tick: int, lvl: int) -> int:
+        """
+        Starts a session, the running one is ended first.
+
+        Args:
+            seed (int): Seed of the game's random number generator.
+            tick (int): Simulation tick the session starts at.
+            lvl (int): Level the session starts on.
+
+        Returns:
+            int: Identifier of the session.
+        """
+        if self.session is not None:
+            self.end_session(0, tick, False)
+
+        self.session = self.__nextSession
+        self.__nextSession += 1
+        self.__level, self.__levelStart, self.__levelCounts, self.__frame = lvl, tick, [0, 0, 0], 0
+        # Seeds are unsigned 64 bit numbers, SQLite integers are signed
+        self.__add(self.__sessions, (self.session, seed - (1 << 64) if seed >= 1 << 63 else seed, time.time()))
+        return self.session
+
+    def __close_level(self, tick: int) -> None:
+        """
+        Buffers the row of the current level.
+
+        Args:
+            tick (int): Simulation tick the level ends at.
+        """
+        self.__add(self.__levels, (self.session, self.__level, tick - self.__levelStart, *self.__levelCounts))
+
+    def fruit_caught(self, asset: str, point: int, tick: int) -> None:
+        """
+        Records a fruit caught.
+
+        Args:
+            asset (str): Image path of the fruit.
+            point (int): Points the fruit was worth.
+            tick (int): Simulation tick.
+        """
+        if self.session is None:
+            return
+        self.__levelCounts[0] += 1
+        self.__add(self.__events, (self.session, tick, self.__level, AnalyticsStore.FRUIT, asset, point))
+
+    def bug_hit(self, asset: str, damage: int, tick: int) -> None:
+        """
+        Records a bug hit.
+
+        Args:
+            asset (str): Image path of the bug.
+            damage (int): Damage the bug did.
+            tick (int): Simulation tick.
+        """
+        if self.session is None:
+            return
+        self.__levelCounts[1] += 1
+        self.__levelCounts[2] += damage
+        self.__add(self.__events, (self.session, tick, self.__level, AnalyticsStore.BUG, asset, damage))
+
+    def level_up(self, lvl: int, tick: int) -> None:
+        """
+        Records a level change.
+
+        Args:
+            lvl (int): The new level.
+            tick (int): Simulation tick.
+        """
+        if self.session is None:
+            return
+        self.__close_level(tick)
+        self.__add(self.__events, (self.session, tick, lvl, AnalyticsStore.LEVEL_UP, None, lvl))
+        self.__level, self.__levelStart, self.__levelCounts = lvl, tick, [0, 0, 0]
+
+    def frame(self, frameTime: float) -> None:
+        """
+        Records the time of a frame.
+
+        Args:
+            frameTime (float): Time of the frame, in seconds.
+        """
+        if self.session is None:
+            return
+        self.__frame += 1
+        self.__add(self.__frames, (self.session, self.__frame, frameTime * 1000))
+
+    def end_session(self, point: int, tick: int, gameOver: bool) -> None:
+        """
+        Ends the running session.
+
+        Args:
+            point (int): Final score.
+            tick (int): Simulation tick the session ends at.
+            gameOver (bool): True if the session ended with a game over, False if it was quit.
+        """
+        if self.session is None:
+            return
+        self.__close_level(tick)
+        if gameOver:
+            self.__add(self.__events, (self.session, tick, self.__level, AnalyticsStore.GAME_OVER, None, point))
+        self.__add(self.__sessionEnds, (time.time(), point, self.__level, tick, int(gameOver), self.session))
+        self.session = None
+
+    def __run(self) -> None:
+        """
+        Writes the buffered rows every flushInterval seconds, or as soon as a batch is full, until the store is closed.
+        """
+        connection: sqlite3.Connection = self.__connect()
+        assetIds: Dict[str, int] = dict(connection.execute("SELECT path, id FROM assets"))
+        while True:
+            with self.__condition:
+                if not self.__closed and self.__pending < self.batchSize:
+                    self.__condition.wait(self.flushInterval)
+                if not self.__pending:
+                    if self.__closed:
+                        break
+                    continue
+                batch: Tuple[List[Tuple], ...] = (self.__sessions, self.__sessionEnds, self.__levels, self.__events, self.__frames)
+                self.__sessions, self.__sessionEnds, self.__levels, self.__events, self.__frames = [], [], [], [], []
+                rows: int = self.__pending
+                self.__pending = 0
+                self.__busy = True
+
+            start: float = time.perf_counter()
+            try:
+                self.__write(connection, assetIds, *batch)
+                written: bool = True
+            except (sqlite3.Error, ValueError, OverflowError):
+                # A bad batch is counted and dropped, the writer keeps serving the next ones
+                written = False
+            elapsed: float = time.perf_counter() - start
+
+            with self.__condition:
+                if written:
+                    self.written += rows
+                    self.batches += 1
+                else:
+                    self.failures += 1
+                self.writeTime += elapsed
+                self.maxWriteTime = max(self.maxWriteTime, elapsed)
+                self.__busy = False
+                self.__condition.notify_all()
+        connection.close()
+
+    @staticmethod
+    def __write(connection: sqlite3.Connection, assetIds: Dict[str, int], sessions: List[Tuple], sessionEnds: List[Tuple],
+                levels: List[Tuple], events: List[Tuple], frames: List[Tuple]) -> None:
+        """
+        Writes one batch in a single transaction and updates the running totals.
+
+        Args:
+            connection (sqlite3.Connection): Connection of the writer thread.
+            assetIds (Dict[str, int]): Identifier of every known asset path, new paths are added once the batch commits.
+            sessions (List[Tuple]): Started sessions.
+            sessionEnds (List[Tuple]): Ended sessions.
+            levels (List[Tuple]): Levels played.
+            events (List[Tuple]): Events, with asset paths.
+            frames (List[Tuple]): Frame times.
+        """
+        # New identifiers only join the cache once committed, a rolled back batch would leave them dangling
+        newIds: Dict[str, int] = {}
+        with connection:
+            for path in {event[4] for event in events if event[4] is not None} - assetIds.keys():
+                newIds[path] = connection.execute("INSERT INTO assets (path) VALUES (?)", (path,)).lastrowid
+            events = [(*event[:4], assetIds.get(event[4], newIds.get(event[4])), event[5]) for event in events]
+
+            connection.executemany("INSERT INTO sessions (id, seed, started) VALUES (?, ?, ?)", sessions)
+            connection.executemany("INSERT INTO levels VALUES (?, ?, ?, ?, ?, ?)", levels)
+            connection.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?)", events)
+            connection.executemany("INSERT INTO frames VALUES (?, ?, ?)", frames)
+            connection.executemany(
+                "UPDATE sessions SET ended = ?, score = ?, level = ?, ticks = ?, gameOver = ? WHERE id = ?", sessionEnds
+            )
+
+            # Running totals, so the per level and per asset queries never scan the raw rows
+            connection.executemany(
+                "INSERT INTO level_totals VALUES (?, 1, ?, ?, ?, ?) ON CONFLICT (level) DO UPDATE SET "
+                "visits = visits + 1, ticks = ticks + excluded.ticks, caught = caught + excluded.caught, "
+                "hits = hits + excluded.hits, damage = damage + excluded.damage",
+                (level[1:] for level in levels)
+            )
+            totals: Dict[int, List[int]] = {}
+            for event in events:
+                if event[3] in (AnalyticsStore.FRUIT, AnalyticsStore.BUG):
+                    total: List[int] = totals.setdefault(event[4], [event[3], 0, 0])
+                    total[1] += 1
+                    total[2] += event[5]
+            connection.executemany(
+                "INSERT INTO asset_totals VALUES (?, ?, ?, ?) ON CONFLICT (asset) DO UPDATE SET "
+                "count = count + excluded.count, value = value + excluded.value",
+                ((asset, *total) for asset, total in totals.items())
+            )
+        assetIds.update(newIds)
+
+    def flush(self) -> None:
+        """
+        Waits until the buffered rows are written.
+        """
+        with self.__condition:
+            if self.__pending:
+                self.__condition.notify_all()
+            while self.__pending or self.__busy:
+                self.__condition.wait()
+
+    def close(self) -> None:
+        """
+        Writes the buffered rows and stops the writer thread. A running session is not ended.
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__thread.join()
+
+    def __query(self, sql: str, parameters: Tuple = ()) -> List[Dict[str, Any]]:
+        """
+        Runs a read query on its own connection, the writer thread is never blocked.
+
+        Args:
+            sql (str): The query.
+            parameters (Tuple, optional): The query parameters. Defaults to none.
+
+        Returns:
+            List[Dict[str, Any]]: The rows, keyed by column name.
+        """
+        with closing(sqlite3.connect(self.path)) as connection:
+            connection.row_factory = sqlite3.Row
+            return [dict(row) for row in connection.execute(sql, parameters)]
+
+    def leaderboard(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Returns the best finished sessions.
+
+        Args:
+            limit (int, optional): Number of sessions. Defaults to 10.
+
+        Returns:
+            List[Dict[str, Any]]: Session, seed, end time, score, level and ticks, best score first.
+        """
+        entries: List[Dict[str, Any]] = self.__query(
+            "SELECT id AS session, seed, ended, score, level, ticks FROM sessions "
+            "WHERE ended IS NOT NULL ORDER BY score DESC LIMIT ?", (limit,)
+        )
+        for entry in entries:
+            entry["seed"] %= 1 << 64
+        return entries
+
+    def level_stats(self) -> List[Dict[str, Any]]:
+        """
+        Returns the totals of every level.
+
+        Returns:
+            List[Dict[str, Any]]: Visits, mean ticks per visit, fruits caught, bugs hit and damage taken per level.
+        """
+        return self.__query(
+            "SELECT level, visits, CAST(ticks AS REAL) / visits AS meanTicks, caught, hits, damage "
+            "FROM level_totals ORDER BY level"
+        )
+
+    def asset_stats(self) -> List[Dict[str, Any]]:
+        """
+        Returns the totals of every fruit and bug asset.
+
+        Returns:
+            List[Dict[str, Any]]: Asset path, kind, number of catches or hits and total points or damage.
+        """
+        return self.__query(
+            "SELECT assets.path AS asset, asset_totals.kind AS kind, count, value "
+            "FROM asset_totals JOIN assets ON assets.id = asset_totals.asset ORDER BY kind, count DESC"
+        )
+
+    def session_levels(self, session: int) -> List[Dict[str, Any]]:
+        """
+        Returns the levels played in one session.
+
+        Args:
+            session (int): Identifier of the session.
+
+        Returns:
+            List[Dict[str, Any]]: Level, ticks spent, fruits caught, bugs hit and damage taken, in play order.
+        """
+        return self.__query(
+            "SELECT level, ticks, caught, hits, damage FROM levels WHERE session = ? ORDER BY rowid", (session,)
+        )
+
+    def frame_stats(self, session: int) -> Dict[str, Any]:
+        """
+        Returns the frame-time statistics of one session.
+
+        Args:
+            session (int): Identifier of the session.
+
+        Returns:
+            Dict[str, Any]: Number of frames, mean and longest frame time in milliseconds.
+        """
+        return self.__query(
+            "SELECT COUNT(*) AS frames, AVG(ms) AS meanMs, MAX(ms) AS maxMs FROM frames WHERE session = ?", (session,)
+        )[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the counters.
+
+        Returns:
+            Dict[str, Any]: Rows recorded, written and pending, batches, failures and write times in milliseconds.
+        """
+        with self.__condition:
+            return {
+                "recorded": self.recorded,
+                "written": self.written,
+                "pending": self.__pending,
+                "batches": self.batches,
+                "failures": self.failures,
+                "meanBatchRows": self.written / self.batches if self.batches else 0.0,
+                "meanWriteMs": self.writeTime / self.batches * 1000 if self.batches else 0.0,
+                "maxWriteMs": self.maxWriteTime * 1000
+            }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the counters.
+
+        Returns:
+            str: The formatted summary.
+        """
+        stats: Dict[str, Any] = self.stats()
+        return (f"AnalyticsStore ({self.path}): {stats['written']}/{stats['recorded']} rows written in {stats['batches']} batches "
+                f"({stats['meanBatchRows']:.0f} rows each), {stats['failures']} failed, "
+                f"write {stats['meanWriteMs']:.2f} ms mean / {stats['maxWriteMs']:.2f} ms max")
@@ -0,0 +1,148 @@
+import pygame
+from typing import Dict, Iterable, Optional, Tuple
+
+class SurfaceCache:
+    """
+    SurfaceCache keeps one decoded (and optionally scaled) surface per (path, scale) pair and hands
+    the same surface out to every sprite that asks for it.
+
+    Surfaces returned by the cache are shared, so callers must treat them as read-only and make a
+    copy (or a transformed surface such as a rotation) before drawing onto them.
+
+    Attributes:
+        surfaces (Dict[Tuple[str, float], pygame.surface.Surface]): Cached surfaces keyed by (path, scale).
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that had to load the image from disk.
+
+    Methods:
+        get: Returns the cached surface for a path and scale, loading it on a miss.
+        preload: Loads and scales a batch of images ahead of time.
+        add_atlas: Serves the entries of a texture atlas from the cache.
+        memory_usage: Returns the number of bytes held by the cached pixel data.
+        stats: Returns the cache counters as a dictionary.
+        report: Returns a one line, human readable summary of the cache counters.
+        clear: Drops every cached surface and resets the counters.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty SurfaceCache instance.
+        """
+        self.surfaces: Dict[Tuple[str, Optional[float]], "pygame.surface.Surface"] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def __load(path: str, scale: Optional[float]) -> "pygame.surface.Surface":
+        """
+        Decodes an image from disk and scales it.
+
+        Args:
+            path (str): File path of the image.
+            scale (float, optional): Scale factor applied to both dimensions. None keeps the original size.
+
+        Returns:
+            pygame.surface.Surface: The decoded surface in the display pixel format.
+        """
+        image: "pygame.surface.Surface" = pygame.image.load(path).convert_alpha()
+        if scale:
+            image = pygame.transform.scale(
+                image, (int(image.get_width() * scale), int(image.get_height() * scale))
+            )
+        return image
+
+    def get(self, path: str, scale: Optional[float] = None) -> "pygame.surface.Surface":
+        """
+        Returns the shared surface for a path and scale, loading it on the first request.
+
+        Args:
+            path (str): File path of the image.
+            scale (float, optional): Scale factor applied to both dimensions. Defaults to None.
+
+        Returns:
+            pygame.surface.Surface: The cached surface.
+        """
+        key: Tuple[str, Optional[float]] = (str(path), scale)
+        surface: Optional["pygame.surface.Surface"] = self.surfaces.get(key)
+
+        if surface is None:
+            self.misses += 1
+            surface = self.surfaces[key] = SurfaceCache.__load(key[0], scale)
+        else:
+            self.hits += 1
+
+        return surface
+
+    def preload(self, paths: Iterable[str], scale: Optional[float] = None) -> None:
+        """
+        Loads and scales a batch of images so that later lookups never touch the disk.
+
+        Args:
+            paths (Iterable[str]): File paths of the images.
+            scale (float, optional): Scale factor applied to every image. Defaults to None.
+        """
+        for path in paths:
+            key: Tuple[str, Optional[float]] = (str(path), scale)
+            if key not in self.surfaces:
+                self.misses += 1
+                self.surfaces[key] = SurfaceCache.__load(key[0], scale)
+
+    def add_atlas(self, atlas) -> None:
+        """
+        Serves the entries of a texture atlas from the cache: later lookups of an atlas (path, scale)
+        return a subsurface of the atlas instead of decoding the PNG.
+
+        Args:
+            atlas (TextureAtlas): The loaded atlas.
+        """
+        self.surfaces.update(atlas.surfaces())
+
+    def memory_usage(self) -> int:
+        """
+        Returns the number of bytes held by the cached pixel data.
+        Subsurfaces share the pixels of their parent, so an atlas is only counted once.
+
+        Returns:
+            int: Sum of pitch * height over every distinct pixel buffer.
+        """
+        owners: Dict[int, "pygame.surface.Surface"] = {}
+        for surface in self.surfaces.values():
+            owner: "pygame.surface.Surface" = surface.get_abs_parent()
+            owners[id(owner)] = owner
+        return sum(owner.get_pitch() * owner.get_height() for owner in owners.values())
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters.
+
+        Returns:
+            Dict[str, int]: Entry count, hits, misses and memory usage in bytes.
+        """
+        return {
+            "entries": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes": self.memory_usage()
+        }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the cache counters.
+
+        Returns:
+            str: The formatted summary.
+        """
+        stats: Dict[str, int] = self.stats()
+        return (f"SurfaceCache: {stats['entries']} entries, {stats['hits']} hits, "
+                f"{stats['misses']} misses, {stats['bytes'] / 1024:.1f} KiB")
+
+    def clear(self) -> None:
+        """
+        Drops every cached surface and resets the counters.
+        """
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+# Process wide cache shared by every sprite
+surfaceCache: SurfaceCache = SurfaceCache()
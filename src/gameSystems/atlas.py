@@ -0,0 +1,232 @@
+import os
+import json
+import pygame
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+class TextureAtlas:
+    """
+    TextureAtlas packs sprite images, at their game scale, into a single image plus a JSON index of
+    the sub-rect of every (path, scale) entry. Loading the atlas is one file read and one decode, and
+    every sprite image is a subsurface sharing the atlas pixels.
+
+    The index also records the size and modification time of every source PNG, so a stale atlas
+    (source changed, added or removed) is detected and rebuilt automatically by ensure.
+
+    Attributes:
+        VERSION (int): Index format version, an index with another version is rebuilt.
+        PADDING (int): Transparent pixels left between two packed images.
+        image (pygame.surface.Surface): The atlas image.
+        regions (Dict[Tuple[str, float], pygame.Rect]): Sub-rect of every entry keyed by (path, scale).
+
+    Methods:
+        build: Packs the source images into an atlas image and writes its index.
+        is_stale: Checks whether an atlas must be rebuilt for a set of entries.
+        load: Loads an atlas image and its index.
+        ensure: Rebuilds the atlas if it is stale, then loads it.
+        surface: Returns the subsurface of an entry.
+        surfaces: Returns the subsurface of every entry keyed by (path, scale).
+    """
+
+    VERSION: int = 1
+    PADDING: int = 1
+
+    def __init__(self, image: "pygame.surface.Surface", regions: Dict[Tuple[str, float], "pygame.Rect"]) -> None:
+        """
+        Initializes a TextureAtlas instance.
+
+        Args:
+            image (pygame.surface.Surface): The atlas image.
+            regions (Dict[Tuple[str, float], pygame.Rect]): Sub-rect of every entry keyed by (path, scale).
+        """
+        self.image: "pygame.surface.Surface" = image
+        self.regions: Dict[Tuple[str, float], "pygame.Rect"] = regions
+
+    @staticmethod
+    def __source_info(path: str) -> Dict[str, int]:
+        """
+        Returns the size and modification time of a source file.
+
+        Args:
+            path (str): File path of the source image.
+
+        Returns:
+            Dict[str, int]: File size in bytes and modification time in nanoseconds.
+        """
+        stat: os.stat_result = os.stat(path)
+        return {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    @staticmethod
+    def __pack(sizes: Sequence[Tuple[int, int]]) -> Tuple[Tuple[int, int], List[Tuple[int, int]]]:
+        """
+        Places rectangles on shelves, tallest first, in an atlas about as wide as it is tall.
+
+        Args:
+            sizes (Sequence[Tuple[int, int]]): Width and height of every image.
+
+        Returns:
+            Tuple[Tuple[int, int], List[Tuple[int, int]]]: The atlas size and the top left position of every image.
+        """
+        padding: int = TextureAtlas.PADDING
+        area: int = sum((width + padding) * (height + padding) for width, height in sizes)
+        atlasWidth: int = max(max(width for width, _ in sizes) + padding, int(area ** .5 * 1.1))
+
+        positions: List[Tuple[int, int]] = [(0, 0)] * len(sizes)
+        x: int = 0
+        y: int = 0
+        shelfHeight: int = 0
+        for index in sorted(range(len(sizes)), key=lambda index: -sizes[index][1]):
+            width, height = sizes[index]
+            if x + width + padding > atlasWidth:
+                x = 0
+                y += shelfHeight
+                shelfHeight = 0
+            positions[index] = (x, y)
+            x += width + padding
+            shelfHeight = max(shelfHeight, height + padding)
+
+        return (atlasWidth, y + shelfHeight), positions
+
+    @staticmethod
+    def build(entries: Sequence[Tuple[str, Optional[float]]], imagePath: str, indexPath: str) -> None:
+        """
+        Packs the source images, scaled like the game scales them, into an atlas image and writes its index.
+        This does not need a display, so it can run as a build step.
+
+        Args:
+            entries (Sequence[Tuple[str, float]]): (path, scale) of every image, None keeps the original size.
+            imagePath (str): Output path of the atlas image (PNG).
+            indexPath (str): Output path of the JSON index.
+        """
+        images: List["pygame.surface.Surface"] = []
+        for path, scale in entries:
+            image: "pygame.surface.Surface" = pygame.image.load(path)
+            if scale:
+                image = pygame.transform.scale(
+                    image, (int(image.get_width() * scale), int(image.get_height() * scale))
+                )
+            images.append(image)
+
+        atlasSize, positions = TextureAtlas.__pack([image.get_size() for image in images])
+        atlas: "pygame.surface.Surface" = pygame.Surface(atlasSize, pygame.SRCALPHA, 32)
+        for image, position in zip(images, positions):
+            # Max blending onto the transparent atlas copies the pixels, alpha included, without blending them
+            atlas.blit(image, position, special_flags=pygame.BLEND_RGBA_MAX)
+
+        Path(imagePath).parent.mkdir(parents=True, exist_ok=True)
+        Path(indexPath).parent.mkdir(parents=True, exist_ok=True)
+        pygame.image.save(atlas, imagePath)
+
+        index: Dict = {
+            "version": TextureAtlas.VERSION,
+            "image": os.path.basename(imagePath),
+            "size": list(atlasSize),
+            "entries": [
+                {
+                    "path": str(Path(path)),
+                    "scale": scale,
+                    "rect": [*position, *image.get_size()],
+                    "source": TextureAtlas.__source_info(path)
+                }
+                for (path, scale), image, position in zip(entries, images, positions)
+            ]
+        }
+        with open(indexPath, "w") as file:
+            json.dump(index, file, indent=2)
+
+    @staticmethod
+    def is_stale(entries: Sequence[Tuple[str, Optional[float]]], imagePath: str, indexPath: str) -> bool:
+        """
+        Checks whether an atlas must be rebuilt: missing files, another index version, different
+        entries or a source image that changed since the atlas was built.
+
+        Args:
+            entries (Sequence[Tuple[str, float]]): (path, scale) of every image the atlas must hold.
+            imagePath (str): Path of the atlas image.
+            indexPath (str): Path of the JSON index.
+
+        Returns:
+            bool: True if the atlas must be rebuilt.
+        """
+        if not os.path.isfile(imagePath) or not os.path.isfile(indexPath):
+            return True
+
+        try:
+            with open(indexPath) as file:
+                index: Dict = json.load(file)
+        except (OSError, ValueError):
+            return True
+
+        if index.get("version") != TextureAtlas.VERSION:
+            return True
+
+        indexed: Dict[Tuple[str, Optional[float]], Dict[str, int]] = {
+            (entry["path"], entry["scale"]): entry["source"] for entry in index.get("entries", [])
+        }
+        if set(indexed) != {(str(Path(path)), scale) for path, scale in entries}:
+            return True
+
+        try:
+            return any(TextureAtlas.__source_info(path) != source for (path, _), source in indexed.items())
+        except OSError:
+            return True
+
+    @staticmethod
+    def load(imagePath: str, indexPath: str) -> "TextureAtlas":
+        """
+        Loads an atlas image (one decode, converted to the display pixel format) and its index.
+
+        Args:
+            imagePath (str): Path of the atlas image.
+            indexPath (str): Path of the JSON index.
+
+        Returns:
+            TextureAtlas: The loaded atlas.
+        """
+        with open(indexPath) as file:
+            index: Dict = json.load(file)
+
+        image: "pygame.surface.Surface" = pygame.image.load(imagePath).convert_alpha()
+        regions: Dict[Tuple[str, Optional[float]], "pygame.Rect"] = {
+            (entry["path"], entry["scale"]): pygame.Rect(entry["rect"]) for entry in index["entries"]
+        }
+        return TextureAtlas(image, regions)
+
+    @staticmethod
+    def ensure(entries: Sequence[Tuple[str, Optional[float]]], imagePath: str, indexPath: str) -> "TextureAtlas":
+        """
+        Rebuilds the atlas if it is stale, then loads it.
+
+        Args:
+            entries (Sequence[Tuple[str, float]]): (path, scale) of every image the atlas must hold.
+            imagePath (str): Path of the atlas image.
+            indexPath (str): Path of the JSON index.
+
+        Returns:
+            TextureAtlas: The loaded atlas.
+        """
+        if TextureAtlas.is_stale(entries, imagePath, indexPath):
+            TextureAtlas.build(entries, imagePath, indexPath)
+        return TextureAtlas.load(imagePath, indexPath)
+
+    def surface(self, path: str, scale: Optional[float] = None) -> "pygame.surface.Surface":
+        """
+        Returns the subsurface of an entry, it shares the atlas pixels.
+
+        Args:
+            path (str): File path of the source image.
+            scale (float, optional): Scale factor of the entry. Defaults to None.
+
+        Returns:
+            pygame.surface.Surface: The subsurface.
+        """
+        return self.image.subsurface(self.regions[(str(Path(path)), scale)])
+
+    def surfaces(self) -> Dict[Tuple[str, Optional[float]], "pygame.surface.Surface"]:
+        """
+        Returns the subsurface of every entry.
+
+        Returns:
+            Dict[Tuple[str, float], pygame.surface.Surface]: Subsurfaces keyed by (path, scale).
+        """
+        return {key: self.image.subsurface(rect) for key, rect in self.regions.items()}
@@ -0,0 +1,327 @@
+import pygame
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .levels import LevelTable
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, only the batch environment needs it
+    numpy = None
+
+class BatchEnv:
+    """
+    BatchEnv steps many independent games in lockstep without rendering, for training basket-control
+    agents. The state of every game lives in NumPy arrays of shape (games, ...) and one simulation
+    tick is a handful of array operations for the whole batch.
+
+    The rules follow Game.__game_logic: spawn rolls against the level's spawn limits, gravity
+    integration, basket collisions against the solid area, culling below the window and levels from
+    the score thresholds. Falling objects collide with their unrotated image rect (the swing does
+    not change the footprint) and the random stream is NumPy's, not the game's.
+
+    Every object kind owns a fixed block of slots, sized by the largest spawn limit over the levels.
+    Per level totals over the whole batch are kept in levelStats for balancing tools.
+
+    Attributes:
+        ACTIONS (Tuple[str, ...]): Meaning of the action values: stay, move left, move right.
+        games (int): Number of games in the batch.
+        actionRepeat (int): Simulation ticks run per step.
+        point (numpy.ndarray): Score of every game.
+        live (numpy.ndarray): Lives of every game.
+        lvl (numpy.ndarray): Level of every game.
+        basketX (numpy.ndarray): Exact left edge of every basket.
+        alive (numpy.ndarray): Occupied object slots, shape (games, slots).
+        kind (numpy.ndarray): Kind of every slot: 1 for fruits, -1 for bugs.
+        age (numpy.ndarray): Simulation ticks since the start of every game.
+        finalPoint (numpy.ndarray): Score every game ended its last session with.
+        levelStats (Dict[str, numpy.ndarray]): Totals indexed by level: fruitSpawned, fruitCaught, bugSpawned,
+            bugCaught, damage, ticks (spent at the level), reached (games that reached it) and reachedTicks (sum of their age then).
+        steps (int): Number of batched steps run.
+
+    Methods:
+        observation_size: Returns the length of an observation vector.
+        reset: Starts new games.
+        step: Applies one action per game and advances every game.
+        observe: Returns the observation of every game.
+        render: Draws one game on an offscreen surface (debugging only).
+    """
+
+    ACTIONS: Tuple[str, ...] = ("stay", "left", "right")  # Held for the whole step
+
+    def __init__(self, games: int, rules: Dict[str, Any], actionRepeat: int = 4, seed: Optional[int] = None) -> None:
+        """
+        Initializes a BatchEnv instance and resets every game.
+
+        Args:
+            games (int): Number of games in the batch.
+            rules (Dict[str, Any]): Game rules: windowWH, simulationHz, levels (LevelTable), spawnRates, spawnRanges, sizes and values
+                (per kind, one entry per image), basketSize, basketSolid (width, height and offset of the
+                solid area), basketY, basketRange, playerSpeedScale and startLive.
+            actionRepeat (int, optional): Simulation ticks run per step, the action is applied on the first one. Defaults to 4.
+            seed (int, optional): Seed of the random number generator. Defaults to a random seed.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        if numpy is None:
+            raise ImportError("the batch environment requires numpy to be installed")
+
+        self.games: int = games
+        self.rules: Dict[str, Any] = rules
+        self.actionRepeat: int = actionRepeat
+        self.steps: int = 0
+        self.__rng = numpy.random.default_rng(seed)
+        self.__dt: float = 1 / rules["simulationHz"]
+        self.__width, self.__height = rules["windowWH"]
+
+        # Level tables, indexed by level (row 0 is unused)
+        levels: LevelTable = rules["levels"]
+        table = lambda key: numpy.array([0] + [getattr(level, key) for level in levels], dtype=numpy.float64)
+        self.__gravity: Dict[str, "numpy.ndarray"] = {"fruit": table("fruitG"), "bug": table("bugG")}
+        self.__limit: Dict[str, "numpy.ndarray"] = {"fruit": table("fruitSpwanLimit"), "bug": table("bugSpwanLimit")}
+        self.__speed: "numpy.ndarray" = table("playerSpd") * rules["playerSpeedScale"]  # Pixels per second
+        self.__thresholds: "numpy.ndarray" = numpy.array(levels.thresholds())
+
+        # Fixed slot block of every kind
+        self.__slots: Dict[str, slice] = {}
+        start: int = 0
+        for kind in ("fruit", "bug"):
+            count: int = int(self.__limit[kind].max())
+            self.__slots[kind] = slice(start, start + count)
+            start += count
+        slots: int = start
+        self.kind = numpy.zeros(slots, dtype=numpy.int64)
+        self.kind[self.__slots["fruit"]] = 1
+        self.kind[self.__slots["bug"]] = -1
+
+        self.__sizes: Dict[str, "numpy.ndarray"] = {kind: numpy.array(rules["sizes"][kind]) for kind in self.__slots}
+        self.__values: Dict[str, "numpy.ndarray"] = {kind: numpy.array(rules["values"][kind]) for kind in self.__slots}
+        self.__ranges: Dict[str, "numpy.ndarray"] = {kind: numpy.array(rules["spawnRanges"][kind]) for kind in self.__slots}
+
+        self.point = numpy.zeros(games, dtype=numpy.int64)
+        self.live = numpy.zeros(games, dtype=numpy.int64)
+        self.lvl = numpy.ones(games, dtype=numpy.int64)
+        self.basketX = numpy.zeros(games, dtype=numpy.float64)
+        self.alive = numpy.zeros((games, slots), dtype=numpy.bool_)
+        self.posX = numpy.zeros((games, slots), dtype=numpy.int64)
+        self.posY = numpy.zeros((games, slots), dtype=numpy.float64)
+        self.acc = numpy.zeros((games, slots), dtype=numpy.float64)
+        self.gravity = numpy.zeros((games, slots), dtype=numpy.float64)
+        self.width = numpy.zeros((games, slots), dtype=numpy.int64)
+        self.height = numpy.zeros((games, slots), dtype=numpy.int64)
+        self.value = numpy.zeros((games, slots), dtype=numpy.int64)
+        self.age = numpy.zeros(games, dtype=numpy.int64)
+        self.finalPoint = numpy.zeros(games, dtype=numpy.int64)
+        self.levelStats: Dict[str, "numpy.ndarray"] = {
+            name: numpy.zeros(len(levels) + 1, dtype=numpy.int64)
+            for name in ("fruitSpawned", "fruitCaught", "bugSpawned", "bugCaught", "damage", "ticks", "reached", "reachedTicks")
+        }
+        self.reset()
+
+    def observation_size(self) -> int:
+        """
+        Returns the length of an observation vector.
+
+        Returns:
+            int: 3 game values plus 4 values per object slot.
+        """
+        return 3 + 4 * self.alive.shape[1]
+
+    def reset(self, mask: Optional["numpy.ndarray"] = None) -> "numpy.ndarray":
+        """
+        Starts new games.
+
+        Args:
+            mask (numpy.ndarray, optional): Boolean mask of the games to reset. Defaults to every game.
+
+        Returns:
+            numpy.ndarray: The observation of every game.
+        """
+        if mask is None:
+            mask = numpy.ones(self.games, dtype=numpy.bool_)
+
+        self.point[mask] = 0
+        self.live[mask] = self.rules["startLive"]
+        self.lvl[mask] = 1
+        self.basketX[mask] = self.rules["basketRange"][1] // 2
+        self.alive[mask] = False
+        self.acc[mask] = 0.0
+        self.age[mask] = 0
+        self.levelStats["reached"][1] += int(numpy.count_nonzero(mask))
+        return self.observe()
+
+    def __spawn(self, kind: str, active: "numpy.ndarray") -> None:
+        """
+        Rolls the spawn of one kind in every active game and fills the first free slot where it happens.
+
+        Args:
+            kind (str): The object kind ("fruit" or "bug").
+            active (numpy.ndarray): Boolean mask of the games that still run.
+        """
+        slots: slice = self.__slots[kind]
+        alive = self.alive[:, slots]
+        spawn = (
+            (self.__rng.random(self.games) < self.rules["spawnRates"][kind] * self.__dt)
+            & (alive.sum(axis=1) < self.__limit[kind][self.lvl])
+            & active
+        )
+        games = numpy.flatnonzero(spawn)
+        if not games.size:
+            return
+
+        count: int = games.size
+        columns = (~alive[games]).argmax(axis=1) + slots.start
+        images = self.__rng.integers(len(self.__sizes[kind]), size=count)
+        ranges = self.__ranges[kind][self.__rng.integers(len(self.__ranges[kind]), size=count)]
+
+        self.alive[games, columns] = True
+        self.posX[games, columns] = self.__rng.integers(ranges[:, 0], ranges[:, 1] + 1)
+        self.posY[games, columns] = -self.__rng.integers(100, 151, size=count)
+        self.acc[games, columns] = 0.0
+        self.gravity[games, columns] = self.__gravity[kind][self.lvl[games]]
+        self.width[games, columns] = self.__sizes[kind][images, 0]
+        self.height[games, columns] = self.__sizes[kind][images, 1]
+        self.value[games, columns] = self.__values[kind][images]
+        self.levelStats[kind + "Spawned"] += self.__per_level(self.lvl[games])
+
+    def __per_level(self, levels: "numpy.ndarray", weights: Optional["numpy.ndarray"] = None) -> "numpy.ndarray":
+        """
+        Counts (or sums weights) per level.
+
+        Args:
+            levels (numpy.ndarray): Level of every entry.
+            weights (numpy.ndarray, optional): Weight of every entry. Defaults to 1.
+
+        Returns:
+            numpy.ndarray: Totals indexed by level.
+        """
+        return numpy.bincount(levels, weights, minlength=len(self.levelStats["ticks"])).astype(numpy.int64)
+
+    def __tick(self, direction: "numpy.ndarray", active: "numpy.ndarray") -> "numpy.ndarray":
+        """
+        Advances every active game by one simulation tick, the other games stay frozen.
+
+        Args:
+            direction (numpy.ndarray): Held direction of every basket (-1, 0 or 1).
+            active (numpy.ndarray): Boolean mask of the games that still run.
+
+        Returns:
+            numpy.ndarray: Reward of the tick: points caught minus damage taken (0 for frozen games).
+        """
+        dt: float = self.__dt
+        low, high = self.rules["basketRange"]
+        self.basketX = numpy.clip(self.basketX + direction * active * self.__speed[self.lvl] * dt, low, high - 1)
+
+        self.__spawn("fruit", active)
+        self.__spawn("bug", active)
+
+        moving = active[:, None]
+        self.acc += self.gravity * dt * moving
+        self.posY += self.acc * dt * moving
+        rectY = numpy.rint(self.posY)
+
+        # Collisions between every object rect and the basket's solid area
+        solidWidth, solidHeight, solidDX, solidDY = self.rules["basketSolid"]
+        solidX = (numpy.rint(self.basketX) + solidDX)[:, None]
+        solidY: int = self.rules["basketY"] + solidDY
+        hit = (
+            self.alive & moving
+            & (self.posX < solidX + solidWidth) & (self.posX + self.width > solidX)
+            & (rectY < solidY + solidHeight) & (rectY + self.height > solidY)
+        )
+        fruitSlots, bugSlots = self.__slots["fruit"], self.__slots["bug"]
+        gained = (hit[:, fruitSlots] * self.value[:, fruitSlots]).sum(axis=1)
+        damage = (hit[:, bugSlots] * self.value[:, bugSlots]).sum(axis=1)
+        self.point += gained
+        self.live -= damage
+
+        stats: Dict[str, "numpy.ndarray"] = self.levelStats
+        stats["fruitCaught"] += self.__per_level(self.lvl, hit[:, fruitSlots].sum(axis=1))
+        stats["bugCaught"] += self.__per_level(self.lvl, hit[:, bugSlots].sum(axis=1))
+        stats["damage"] += self.__per_level(self.lvl, damage)
+        stats["ticks"] += self.__per_level(self.lvl, active)
+        self.age += active
+
+        # Caught and fallen objects free their slot, the level follows the score
+        self.alive &= ~hit & (self.posY <= self.__height + 100)
+        lvl = 1 + numpy.searchsorted(self.__thresholds, self.point, side="right")
+        raised = lvl > self.lvl
+        if raised.any():
+            stats["reached"] += self.__per_level(lvl[raised])
+            stats["reachedTicks"] += self.__per_level(lvl[raised], self.age[raised])
+        self.lvl = lvl
+        return gained - damage
+
+    def step(self, actions: Sequence[int]) -> Tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+        """
+        Holds one action per game for actionRepeat ticks and advances every game. A game that ends
+        stays frozen for the rest of the step, then finished games are reset, so their observation
+        is the one of the new game.
+
+        Args:
+            actions (Sequence[int]): One action per game, an index of ACTIONS.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Observations (games, observation_size),
+            rewards (games,) and done flags (games,).
+        """
+        actions = numpy.asarray(actions)
+        direction = numpy.where(actions == 1, -1, numpy.where(actions == 2, 1, 0))
+
+        rewards = numpy.zeros(self.games, dtype=numpy.float64)
+        done = numpy.zeros(self.games, dtype=numpy.bool_)
+        for _ in range(self.actionRepeat):
+            rewards += self.__tick(direction, ~done)
+            done |= self.live <= 0
+
+        self.steps += 1
+        if done.any():
+            self.finalPoint[done] = self.point[done]
+            self.reset(done)
+        return self.observe(), rewards, done
+
+    def observe(self) -> "numpy.ndarray":
+        """
+        Returns the observation of every game: basket x, lives and level, then kind (+1 fruit, -1 bug,
+        0 empty), x, y and vertical speed of every slot, all roughly scaled to [-1, 1].
+
+        Returns:
+            numpy.ndarray: Observations of shape (games, observation_size).
+        """
+        kind = self.kind * self.alive
+
+        objects = numpy.stack(
+            (kind, self.posX / self.__width * self.alive, self.posY / self.__height * self.alive, self.acc / 1000 * self.alive),
+            axis=2
+        ).reshape(self.games, -1)
+        header = numpy.stack((self.basketX / self.__width, self.live / self.rules["startLive"], self.lvl / len(self.rules["levels"])), axis=1)
+        return numpy.concatenate((header, objects), axis=1).astype(numpy.float32)
+
+    def render(self, index: int = 0, surface: Optional["pygame.surface.Surface"] = None) -> "pygame.surface.Surface":
+        """
+        Draws one game on an offscreen surface with plain rectangles, for debugging only.
+
+        Args:
+            index (int, optional): Game to draw. Defaults to 0.
+            surface (pygame.surface.Surface, optional): Surface to draw on. Defaults to a new surface.
+
+        Returns:
+            pygame.surface.Surface: The surface.
+        """
+        if surface is None:
+            surface = pygame.Surface((self.__width, self.__height))
+        surface.fill("black")
+
+        for slot in numpy.flatnonzero(self.alive[index]).tolist():
+            color: str = "green" if self.kind[slot] > 0 else "red"
+            pygame.draw.rect(surface, color, (
+                int(self.posX[index, slot]), int(numpy.rint(self.posY[index, slot])),
+                int(self.width[index, slot]), int(self.height[index, slot])
+            ))
+
+        basketX: int = round(float(self.basketX[index]))
+        basketWidth, basketHeight = self.rules["basketSize"]
+        pygame.draw.rect(surface, "white", (basketX, self.rules["basketY"], basketWidth, basketHeight), 1)
+        solidWidth, solidHeight, solidDX, solidDY = self.rules["basketSolid"]
+        pygame.draw.rect(surface, "yellow", (basketX + solidDX, self.rules["basketY"] + solidDY, solidWidth, solidHeight))
+        return surface
@@ -0,0 +1,309 @@
+import os
+import sys
+import time
+import zlib
+import struct
+import threading
+import pygame
+from collections import deque
+from typing import Any, BinaryIO, Deque, Dict, List, Optional, TextIO, Tuple
+
+class FrameCapture:
+    """
+    FrameCapture records the presented frames to a PNG sequence or to one raw video file without
+    stalling the game loop. The game loop only copies the pixels of a frame into one of a fixed
+    number of preallocated buffers (a single memory copy of the surface buffer where the pixel
+    layout allows it); a worker thread encodes and writes the queued buffers in order.
+
+    The buffers are the bounded queue. When all of them are waiting to be written the drop policy
+    decides: "drop" skips the new frame so the game never waits, "block" waits for a free buffer so
+    no frame is lost (offline captures such as replay playback). If writing fails (disk full, no
+    permission) the worker stops, the error is kept and every later frame is dropped, so the game
+    never waits on a writer that is gone.
+
+    Raw captures are written to capture.raw with the pixel format named in the report, e.g.
+    ffmpeg -f rawvideo -pixel_format bgr0 -video_size 480x720 -framerate 60 -i capture.raw capture.mp4.
+    Every written frame is listed with its simulation tick and capture time in frames.csv.
+
+    Attributes:
+        FORMATS (Tuple[str, ...]): Supported output formats.
+        POLICIES (Tuple[str, ...]): Supported drop policies.
+        folder (str): Output folder.
+        size (Tuple[int, int]): Frame size in pixels.
+        outputFormat (str): "png" or "raw".
+        dropPolicy (str): "drop" or "block".
+        fps (int): Frame rate of a raw capture, for the report.
+        compression (int): zlib level of the PNG files.
+        pixelFormat (str): Byte order of a raw frame, as an ffmpeg pixel format name.
+        captured (int): Number of frames offered.
+        written (int): Number of frames written.
+        dropped (int): Number of frames skipped because every buffer was busy.
+        stalls (int): Number of frames that had to wait for a free buffer (block policy).
+        maxDepth (int): Largest number of frames waiting to be written.
+        error (Optional[str]): Reason the worker stopped writing, None while it works.
+
+    Methods:
+        capture: Copies a frame into a free buffer and queues it for writing.
+        close: Writes the queued frames and stops the worker.
+        stats: Returns the counters.
+        report: Returns a one line summary of the counters.
+    """
+
+    FORMATS: Tuple[str, ...] = ("png", "raw")
+    POLICIES: Tuple[str, ...] = ("drop", "block")
+
+    # Pixel layouts that can be copied straight from a little endian 32 bit surface, keyed by RGB masks
+    __DIRECT: Dict[Tuple[int, int, int], str] = {(0xFF0000, 0xFF00, 0xFF): "bgr0", (0xFF, 0xFF00, 0xFF0000): "rgb0"}
+
+    def __init__(self, folder: str, surface: "pygame.surface.Surface", outputFormat: str = "raw", slots: int = 8,
+                 dropPolicy: str = "drop", fps: int = 60, compression: int = 6) -> None:
+        """
+        Initializes a FrameCapture instance, allocates its buffers and starts its worker.
+
+        Args:
+            folder (str): Output folder, created if needed.
+            surface (pygame.surface.Surface): The surface that will be captured, its size and pixel layout are used.
+            outputFormat (str, optional): "png" (one file per frame) or "raw" (one video file). Defaults to "raw".
+            slots (int, optional): Number of frame buffers, the length of the queue. Defaults to 8.
+            dropPolicy (str, optional): "drop" or "block". Defaults to "drop".
+            fps (int, optional): Frame rate written to the report. Defaults to 60.
+            compression (int, optional): zlib level of the PNG files (0 to 9). Defaults to 6.
+
+        Raises:
+            ValueError: If the format or the drop policy is unknown, or there are no buffers.
+        """
+        if outputFormat not in FrameCapture.FORMATS:
+            raise ValueError(f"unknown capture format {outputFormat!r}, expected one of {FrameCapture.FORMATS}")
+        if dropPolicy not in FrameCapture.POLICIES:
+            raise ValueError(f"unknown drop policy {dropPolicy!r}, expected one of {FrameCapture.POLICIES}")
+        if slots < 1:
+            raise ValueError("a capture needs at least one buffer")
+
+        width, height = surface.get_size()
+        self.folder: str = folder
+        self.size: Tuple[int, int] = (width, height)
+        self.outputFormat: str = outputFormat
+        self.dropPolicy: str = dropPolicy
+        self.fps: int = fps
+        self.compression: int = compression
+        self.captured: int = 0
+        self.written: int = 0
+        self.dropped: int = 0
+        self.stalls: int = 0
+        self.maxDepth: int = 0
+        self.error: Optional[str] = None
+        self.copyTime: float = 0.0
+        self.maxCopyTime: float = 0.0
+        self.stallTime: float = 0.0
+        self.writeTime: float = 0.0
+        self.__depthSum: int = 0
+
+        # Surfaces with a known 32 bit layout are copied byte for byte, anything else is converted to RGBX
+        masks: Tuple[int, int, int] = tuple(surface.get_masks()[:3])
+        self.__direct: bool = (sys.byteorder == "little" and surface.get_bytesize() == 4
+                               and surface.get_pitch() == width * 4 and masks in FrameCapture.__DIRECT)
+        self.pixelFormat: str = FrameCapture.__DIRECT[masks] if self.__direct else "rgb0"
+        self.__canvas: "pygame.surface.Surface" = (
+            pygame.Surface(self.size, 0, surface) if self.__direct else pygame.Surface(self.size, 0, 32, (0xFF, 0xFF00, 0xFF0000, 0))
+        )
+
+        self.__slots: List[bytearray] = [bytearray(width * height * 4) for _ in range(slots)]
+        self.__free: Deque[int] = deque(range(slots))
+        self.__queue: Deque[Tuple[int, int, float]] = deque()
+        self.__closed: bool = False
+        self.__start: float = time.perf_counter()
+        self.__condition: threading.Condition = threading.Condition()
+
+        os.makedirs(folder, exist_ok=True)
+        self.__video: Optional[BinaryIO] = open(os.path.join(folder, "capture.raw"), "wb") if outputFormat == "raw" else None
+        self.__index: TextIO = open(os.path.join(folder, "frames.csv"), "w")
+        self.__index.write("frame,tick,seconds\n")
+        self.__thread: threading.Thread = threading.Thread(target=self.__run, name="capture", daemon=True)
+        self.__thread.start()
+
+    def capture(self, surface: "pygame.surface.Surface", tick: int) -> bool:
+        """
+        Copies a frame into a free buffer and queues it for writing. With the drop policy the frame
+        is skipped when no buffer is free, with the block policy the call waits for one. Every frame
+        is dropped once the worker stopped on a write error.
+
+        Args:
+            surface (pygame.surface.Surface): The presented frame.
+            tick (int): Simulation tick of the frame.
+
+        Returns:
+            bool: True if the frame was queued, False if it was dropped.
+        """
+        with self.__condition:
+            self.captured += 1
+            if not self.__free and self.error is None:
+                if self.dropPolicy == "drop":
+                    self.dropped += 1
+                    return False
+                self.stalls += 1
+                start: float = time.perf_counter()
+                while not self.__free and self.error is None:
+                    self.__condition.wait()
+                self.stallTime += time.perf_counter() - start
+            if self.error is not None:
+                self.dropped += 1
+                return False
+            slot: int = self.__free.popleft()
+
+        # The buffer belongs to the game loop until it is queued, so the copy runs outside the lock
+        start = time.perf_counter()
+        if self.__direct:
+            memoryview(self.__slots[slot])[:] = memoryview(surface.get_view("1")).cast("B")
+        else:
+            self.__slots[slot][:] = pygame.image.tobytes(surface, "RGBX")
+        elapsed: float = time.perf_counter() - start
+
+        with self.__condition:
+            self.copyTime += elapsed
+            self.maxCopyTime = max(self.maxCopyTime, elapsed)
+            self.__queue.append((slot, tick, start - self.__start))
+            self.maxDepth = max(self.maxDepth, len(self.__queue))
+            self.__depthSum += len(self.__queue)
+            self.__condition.notify_all()
+        return True
+
+    def __run(self) -> None:
+        """
+        Writes the queued frames in order until the capture is closed and the queue is empty, or
+        until a write fails: the error is kept and the queued frames are dropped.
+        """
+        while True:
+            with self.__condition:
+                while not self.__queue and not self.__closed:
+                    self.__condition.wait()
+                if not self.__queue:
+                    return
+                slot, tick, seconds = self.__queue[0]
+
+            start: float = time.perf_counter()
+            try:
+                self.__write(self.__slots[slot], self.written)
+                self.__index.write(f"{self.written},{tick},{seconds:.6f}\n")
+            except (OSError, ValueError, zlib.error) as error:
+                with self.__condition:
+                    self.error = str(error)
+                    self.dropped += len(self.__queue)
+                    self.__free.extend(queued for queued, _, _ in self.__queue)
+                    self.__queue.clear()
+                    self.__condition.notify_all()
+                return
+            elapsed: float = time.perf_counter() - start
+
+            with self.__condition:
+                self.__queue.popleft()
+                self.__free.append(slot)
+                self.written += 1
+                self.writeTime += elapsed
+                self.__condition.notify_all()
+
+    def __write(self, pixels: bytearray, index: int) -> None:
+        """
+        Encodes and writes one frame.
+
+        Args:
+            pixels (bytearray): The frame buffer.
+            index (int): Index of the frame in the output.
+        """
+        if self.__video is not None:
+            self.__video.write(pixels)
+            return
+
+        memoryview(self.__canvas.get_view("1")).cast("B")[:] = pixels
+        with open(os.path.join(self.folder, f"frame_{index:06d}.png"), "wb") as file:
+            file.write(self.__encode_png(pygame.image.tobytes(self.__canvas, "RGB")))
+
+    def __encode_png(self, rgb: bytes) -> bytes:
+        """
+        Encodes an RGB frame as PNG. pygame.image.save holds the interpreter lock for the whole
+        encode, which would stall the game loop, while zlib releases it while compressing.
+
+        Args:
+            rgb (bytes): The frame, 3 bytes per pixel, row by row.
+
+        Returns:
+            bytes: The PNG file.
+        """
+        width, height = self.size
+        stride: int = width * 3
+        # Every row starts with its filter type, 0 (none)
+        rows: bytes = b"".join(b"\x00" + rgb[offset:offset + stride] for offset in range(0, stride * height, stride))
+
+        def chunk(tag: bytes, data: bytes) -> bytes:
+            return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(data, zlib.crc32(tag)))
+
+        return b"".join((
+            b"\x89PNG\r\n\x1a\n",
+            chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)),
+            chunk(b"IDAT", zlib.compress(rows, self.compression)),
+            chunk(b"IEND", b"")
+        ))
+
+    def close(self) -> None:
+        """
+        Writes the queued frames, stops the worker and closes the output files.
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__thread.join()
+        try:
+            if self.__video is not None:
+                self.__video.close()
+            self.__index.close()
+        except OSError as error:
+            self.error = self.error or str(error)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the counters.
+
+        Returns:
+            Dict[str, Any]: Frame counts, the write error, queue depths and copy, stall and write times in milliseconds.
+        """
+        with self.__condition:
+            queued: int = self.captured - self.dropped
+            return {
+                "format": self.outputFormat,
+                "pixelFormat": self.pixelFormat,
+                "size": self.size,
+                "buffers": len(self.__slots),
+                "dropPolicy": self.dropPolicy,
+                "captured": self.captured,
+                "written": self.written,
+                "dropped": self.dropped,
+                "stalls": self.stalls,
+                "error": self.error,
+                "queueDepth": len(self.__queue),
+                "maxQueueDepth": self.maxDepth,
+                "meanQueueDepth": self.__depthSum / queued if queued else 0.0,
+                "meanCopyMs": self.copyTime / queued * 1000 if queued else 0.0,
+                "maxCopyMs": self.maxCopyTime * 1000,
+                "stallMs": self.stallTime * 1000,
+                "meanWriteMs": self.writeTime / self.written * 1000 if self.written else 0.0
+            }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the counters, with the ffmpeg input options of a raw capture.
+
+        Returns:
+            str: The formatted summary.
+        """
+        stats: Dict[str, Any] = self.stats()
+        summary: str = (
+            f"FrameCapture ({stats['format']}, {stats['buffers']} buffers, {stats['dropPolicy']}): "
+            f"{stats['written']}/{stats['captured']} frames written, {stats['dropped']} dropped, {stats['stalls']} stalls, "
+            f"queue depth {stats['meanQueueDepth']:.1f} mean / {stats['maxQueueDepth']} max, "
+            f"copy {stats['meanCopyMs']:.3f} ms, write {stats['meanWriteMs']:.2f} ms"
+        )
+        if stats["error"] is not None:
+            summary += f"; writing stopped: {stats['error']}"
+        elif self.outputFormat == "raw":
+            summary += (f"; encode with ffmpeg -f rawvideo -pixel_format {self.pixelFormat} "
+                        f"-video_size {self.size[0]}x{self.size[1]} -framerate {self.fps} -i {os.path.join(self.folder, 'capture.raw')}")
+        return summary
@@ -0,0 +1,108 @@
+import pygame
+from typing import Dict, List, Sequence, Set
+
+class RowBandCollider:
+    """
+    RowBandCollider is the broad phase of the basket collision checks. Everything falls vertically
+    and baskets sit on a fixed row, so once per step the rects of every group are indexed in one
+    list and a single Rect.collidelistall call against a full width rect over the row band (run in
+    C) picks the candidates. The narrow phase runs one Rect.collidelistall call per query rect on
+    those candidates only, and a sprite hit by several query rects is reported for the first one.
+
+    Attributes:
+        candidates (int): Candidates that reached the narrow phase in the last query.
+        hits (int): Hits found in the last query.
+        totalCandidates (int): Candidates over every query.
+        totalHits (int): Hits over every query.
+        queries (int): Number of queries.
+
+    Methods:
+        collide: Returns every hit of a frame in one call.
+        stats: Returns the candidate and hit counters.
+        report: Returns a one line summary of the counters.
+    """
+
+    # Half width of the band rect, wider than any window so only the rows matter
+    __REACH: int = 1 << 20
+
+    def __init__(self) -> None:
+        """
+        Initializes a RowBandCollider instance.
+        """
+        self.candidates: int = 0
+        self.hits: int = 0
+        self.totalCandidates: int = 0
+        self.totalHits: int = 0
+        self.queries: int = 0
+
+    def collide(self, rects: Sequence["pygame.Rect"], groups: Sequence["pygame.sprite.AbstractGroup"]) -> List[List[List["pygame.sprite.Sprite"]]]:
+        """
+        Returns every hit of a frame in one call.
+
+        Args:
+            rects (Sequence[pygame.Rect]): Query rects, e.g. the solid area of every basket.
+            groups (Sequence[pygame.sprite.AbstractGroup]): Sprite groups tested against the rects.
+
+        Returns:
+            List[List[List[pygame.sprite.Sprite]]]: hits[rectIndex][groupIndex] is the list of sprites of
+            that group colliding with that rect, every sprite appears at most once.
+        """
+        bandTop: int = min(rect.top for rect in rects)
+        bandBottom: int = max(rect.bottom for rect in rects)
+        band: pygame.Rect = pygame.Rect(-RowBandCollider.__REACH, bandTop, 2 * RowBandCollider.__REACH, bandBottom - bandTop)
+        hits: List[List[List["pygame.sprite.Sprite"]]] = [[] for _ in rects]
+        candidates: int = 0
+        hitCount: int = 0
+
+        for group in groups:
+            # Broad phase: index the rects of the group, then let the band rect pick the candidates in C
+            sprites: List["pygame.sprite.Sprite"] = group.sprites()
+            bandIndices: List[int] = band.collidelistall([sprite.rect for sprite in sprites])
+            candidates += len(bandIndices)
+            bandSprites: List["pygame.sprite.Sprite"] = [sprites[index] for index in bandIndices]
+            bandRects: List["pygame.Rect"] = [sprite.rect for sprite in bandSprites]
+
+            # Narrow phase: one collidelistall per query rect on the candidates, a sprite already hit is not reported again
+            taken: Set[int] = set()
+            for index, rect in enumerate(rects):
+                groupHits: List["pygame.sprite.Sprite"] = []
+                for hit in rect.collidelistall(bandRects) if bandRects else ():
+                    if hit not in taken:
+                        taken.add(hit)
+                        groupHits.append(bandSprites[hit])
+                hitCount += len(groupHits)
+                hits[index].append(groupHits)
+
+        self.candidates = candidates
+        self.hits = hitCount
+        self.totalCandidates += candidates
+        self.totalHits += hitCount
+        self.queries += 1
+        return hits
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the candidate and hit counters.
+
+        Returns:
+            Dict[str, float]: Last and average candidate / hit counts per query.
+        """
+        queries: int = max(self.queries, 1)
+        return {
+            "queries": self.queries,
+            "candidates": self.candidates,
+            "hits": self.hits,
+            "candidatesPerQuery": self.totalCandidates / queries,
+            "hitsPerQuery": self.totalHits / queries
+        }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the counters.
+
+        Returns:
+            str: The formatted summary.
+        """
+        stats: Dict[str, float] = self.stats()
+        return (f"RowBandCollider: {stats['queries']} queries, {stats['candidatesPerQuery']:.2f} candidates/query, "
+                f"{stats['hitsPerQuery']:.3f} hits/query")
@@ -0,0 +1,123 @@
+import pygame
+from typing import Dict, List, Optional, Sequence
+
+# Horizontal direction held by every movement key
+MOVEMENT_KEYS: Dict[int, int] = {pygame.K_LEFT: -1, pygame.K_RIGHT: 1}
+
+def restrict_events(eventTypes: Sequence[int]) -> None:
+    """
+    Lets only the given event types into the pygame event queue. Key states are still tracked for
+    pygame.key.get_pressed, so held keys need no KEYDOWN/KEYUP events.
+
+    Args:
+        eventTypes (Sequence[int]): The event types the game handles.
+    """
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(eventTypes))
+
+class EventInput:
+    """
+    EventInput is the default input source, it reads the pygame event queue for key presses and
+    polls the keyboard state for the held movement keys.
+
+    Methods:
+        get: Returns the events of the current frame.
+        direction: Returns the horizontal direction held on the keyboard.
+    """
+
+    def get(self) -> List["pygame.event.Event"]:
+        """
+        Returns the events of the current frame.
+
+        Returns:
+            List[pygame.event.Event]: Events taken from the pygame event queue.
+        """
+        return pygame.event.get()
+
+    def direction(self) -> int:
+        """
+        Returns the horizontal direction held on the keyboard, polled once per simulation step.
+
+        Returns:
+            int: -1 (left), 1 (right) or 0 (none or both).
+        """
+        pressed = pygame.key.get_pressed()
+        return sum(direction for key, direction in MOVEMENT_KEYS.items() if pressed[key])
+
+class ScriptedInput:
+    """
+    ScriptedInput replays a fixed script of key presses frame by frame, so the game can be driven
+    without a keyboard (headless runs, benchmarks). A scripted movement key is held until the other
+    movement key is pressed.
+
+    Attributes:
+        script (Dict[int, Sequence[int]]): Keys pressed (KEYDOWN) per frame index.
+        quitAt (int, optional): Frame index at which a QUIT event is sent.
+        frame (int): Index of the next frame.
+        held (int): Horizontal direction of the held movement key.
+
+    Methods:
+        alternating: Builds a script that presses keys in turn at a fixed interval.
+        get: Returns the scripted events of the current frame.
+        direction: Returns the horizontal direction of the held movement key.
+    """
+
+    def __init__(self, script: Dict[int, Sequence[int]] = None, quitAt: Optional[int] = None) -> None:
+        """
+        Initializes a ScriptedInput instance.
+
+        Args:
+            script (Dict[int, Sequence[int]], optional): Keys pressed per frame index. Defaults to None.
+            quitAt (int, optional): Frame index at which a QUIT event is sent. Defaults to None.
+        """
+        self.script: Dict[int, Sequence[int]] = script or {}
+        self.quitAt: Optional[int] = quitAt
+        self.frame: int = 0
+        self.held: int = 0
+
+    @classmethod
+    def alternating(cls, keys: Sequence[int], every: int, frames: int, quitAt: Optional[int] = None) -> "ScriptedInput":
+        """
+        Builds a script that presses the given keys in turn every few frames.
+
+        Args:
+            keys (Sequence[int]): Keys pressed in turn.
+            every (int): Number of frames between two presses.
+            frames (int): Length of the script in frames.
+            quitAt (int, optional): Frame index at which a QUIT event is sent. Defaults to None.
+
+        Returns:
+            ScriptedInput: The scripted input source.
+        """
+        script: Dict[int, Sequence[int]] = {
+            frame: (keys[(frame // every) % len(keys)],) for frame in range(every, frames, every)
+        }
+        return cls(script, quitAt)
+
+    def get(self) -> List["pygame.event.Event"]:
+        """
+        Returns the scripted events of the current frame. Real events are dropped so the queue never fills up.
+
+        Returns:
+            List[pygame.event.Event]: The KEYDOWN (and QUIT) events of the frame.
+        """
+        pygame.event.clear()
+
+        events: List["pygame.event.Event"] = []
+        for key in self.script.get(self.frame, ()):
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+            self.held = MOVEMENT_KEYS.get(key, self.held)
+        if self.frame == self.quitAt:
+            events.append(pygame.event.Event(pygame.QUIT))
+
+        self.frame += 1
+        return events
+
+    def direction(self) -> int:
+        """
+        Returns the horizontal direction of the held movement key.
+
+        Returns:
+            int: -1 (left), 1 (right) or 0 (none yet).
+        """
+        return self.held
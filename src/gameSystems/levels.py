@@ -0,0 +1,191 @@
+import json
+import bisect
+from typing import Any, Dict, Iterator, List, NamedTuple, Sequence, Tuple
+
+class LevelConfig(NamedTuple):
+    """
+    LevelConfig holds the parameters of one level. It is immutable, so a level can be shared freely.
+
+    Attributes:
+        level (int): Level number, starting at 1.
+        minScore (int): Lowest score of the level.
+        fruitG (int): Gravity of the fruits.
+        bugG (int): Gravity of the bugs.
+        playerSpd (int): Speed of the player.
+        fruitSpwanLimit (int): Maximum number of fruits falling at once.
+        bugSpwanLimit (int): Maximum number of bugs falling at once.
+    """
+
+    level: int
+    minScore: int
+    fruitG: int
+    bugG: int
+    playerSpd: int
+    fruitSpwanLimit: int
+    bugSpwanLimit: int
+
+class LevelTable:
+    """
+    LevelTable is the ordered list of levels and the score thresholds between them. The level of a
+    score is found by a binary search over the thresholds.
+
+    The table is loaded from a JSON file, {"levels": [{"minScore": 0, "fruitG": 330, ...}, ...]}, so
+    levels can be added or tuned without code changes. The levels are numbered in file order.
+
+    Attributes:
+        levels (Tuple[LevelConfig, ...]): Every level, in order.
+        maxLevel (int): Number of the last level.
+
+    Methods:
+        level_for: Returns the level number of a score.
+        thresholds: Returns the lowest score of every level above the first.
+        replace: Returns a copy of the table with some parameters of one level changed.
+        to_data: Returns the table as JSON data.
+        from_data: Builds a table from JSON data.
+        load: Reads a table from a JSON file.
+        save: Writes the table to a JSON file.
+    """
+
+    def __init__(self, levels: Sequence[LevelConfig]) -> None:
+        """
+        Initializes a LevelTable instance.
+
+        Args:
+            levels (Sequence[LevelConfig]): Every level, in order.
+
+        Raises:
+            ValueError: If the table is empty, is not numbered from 1, does not start at score 0 or its thresholds do not increase.
+        """
+        if not levels or levels[0].minScore != 0:
+            raise ValueError("the first level must start at score 0")
+        for index, level in enumerate(levels):
+            if level.level != index + 1:
+                raise ValueError(f"level {level.level} is at position {index + 1}")
+            if index and level.minScore <= levels[index - 1].minScore:
+                raise ValueError(f"level {level.level} must start above the score of level {level.level - 1}")
+
+        self.levels: Tuple[LevelConfig, ...] = tuple(levels)
+        self.maxLevel: int = len(levels)
+        self.__minScores: List[int] = [level.minScore for level in levels]
+
+    def __getitem__(self, lvl: int) -> LevelConfig:
+        """
+        Returns a level.
+
+        Args:
+            lvl (int): Level number, starting at 1.
+
+        Returns:
+            LevelConfig: The level.
+        """
+        return self.levels[lvl - 1]
+
+    def __iter__(self) -> Iterator[LevelConfig]:
+        """
+        Iterates over the levels, in order.
+
+        Returns:
+            Iterator[LevelConfig]: The levels.
+        """
+        return iter(self.levels)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of levels.
+
+        Returns:
+            int: The number of levels.
+        """
+        return self.maxLevel
+
+    def level_for(self, score: int) -> int:
+        """
+        Returns the level number of a score.
+
+        Args:
+            score (int): The score.
+
+        Returns:
+            int: The highest level whose lowest score is reached (1 for negative scores).
+        """
+        return max(bisect.bisect_right(self.__minScores, score), 1)
+
+    def thresholds(self) -> List[int]:
+        """
+        Returns the lowest score of every level above the first.
+
+        Returns:
+            List[int]: The thresholds, in increasing order.
+        """
+        return self.__minScores[1:]
+
+    def replace(self, lvl: int, **changes: int) -> "LevelTable":
+        """
+        Returns a copy of the table with some parameters of one level changed.
+
+        Args:
+            lvl (int): Level number.
+            **changes (int): New values keyed by parameter name.
+
+        Returns:
+            LevelTable: The changed table.
+        """
+        levels: List[LevelConfig] = list(self.levels)
+        levels[lvl - 1] = levels[lvl - 1]._replace(**changes)
+        return LevelTable(levels)
+
+    def to_data(self) -> Dict[str, Any]:
+        """
+        Returns the table as JSON data.
+
+        Returns:
+            Dict[str, Any]: The table, without the level numbers (they follow from the order).
+        """
+        return {"levels": [{key: value for key, value in level._asdict().items() if key != "level"} for level in self.levels]}
+
+    @staticmethod
+    def from_data(data: Dict[str, Any]) -> "LevelTable":
+        """
+        Builds a table from JSON data.
+
+        Args:
+            data (Dict[str, Any]): The table.
+
+        Returns:
+            LevelTable: The table.
+
+        Raises:
+            ValueError: If a level misses a parameter or has an unknown one, or the table is invalid.
+        """
+        levels: List[LevelConfig] = []
+        for index, entry in enumerate(data["levels"]):
+            try:
+                levels.append(LevelConfig(level=index + 1, **entry))
+            except TypeError as error:
+                raise ValueError(f"level {index + 1}: {error}") from error
+        return LevelTable(levels)
+
+    @staticmethod
+    def load(path: str) -> "LevelTable":
+        """
+        Reads a table from a JSON file.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            LevelTable: The table.
+        """
+        with open(path) as file:
+            return LevelTable.from_data(json.load(file))
+
+    def save(self, path: str) -> None:
+        """
+        Writes the table to a JSON file.
+
+        Args:
+            path (str): Path of the file.
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_data(), file, indent=4)
+            file.write("\n")
@@ -0,0 +1,201 @@
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+class AssetLoader:
+    """
+    AssetLoader decodes assets on a pool of worker threads while the main thread keeps drawing frames.
+    Every job is tracked by a future, so callers only block on the assets they need, and every job
+    and milestone is recorded in a startup timeline.
+
+    Pygame releases the GIL while it decodes images and sounds, so the jobs really run in parallel.
+
+    Attributes:
+        startTime (float): perf_counter time the timeline is measured from.
+        futures (Dict[str, Future]): Future of every submitted job keyed by name.
+        jobs (Dict[str, Dict[str, Any]]): Timeline of every job (submitted, started, finished, thread).
+        marks (Dict[str, float]): Milestones of the startup, in seconds since startTime.
+        blocked (float): Total time the main thread spent waiting for jobs.
+
+    Methods:
+        submit: Runs a job on the worker pool.
+        mark: Records a milestone.
+        result: Returns the result of a job, waiting for it if needed.
+        wait: Waits for a set of jobs.
+        progress: Returns the number of finished jobs and the number of jobs.
+        done: Checks whether every job finished.
+        timeline: Returns the jobs and milestones sorted by time.
+        report: Returns the startup timeline as text.
+        shutdown: Stops the worker pool.
+    """
+
+    def __init__(self, workers: int = 4, startTime: Optional[float] = None) -> None:
+        """
+        Initializes an AssetLoader instance.
+
+        Args:
+            workers (int, optional): Number of worker threads. Defaults to 4.
+            startTime (float, optional): perf_counter time the timeline is measured from. Defaults to now.
+        """
+        self.startTime: float = startTime if startTime is not None else time.perf_counter()
+        self.futures: Dict[str, Future] = {}
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.marks: Dict[str, float] = {}
+        self.blocked: float = 0.0
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="loader")
+        self.__lock: threading.Lock = threading.Lock()
+        self.__pending: int = 0
+
+    def __now(self) -> float:
+        """
+        Returns the time elapsed since startTime.
+
+        Returns:
+            float: Seconds since startTime.
+        """
+        return time.perf_counter() - self.startTime
+
+    def __run(self, name: str, job: Callable, args: Tuple) -> Any:
+        """
+        Runs a job on a worker thread and records its timeline.
+
+        Args:
+            name (str): Name of the job.
+            job (Callable): The loading function.
+            args (Tuple): Arguments of the loading function.
+
+        Returns:
+            Any: The result of the job.
+        """
+        record: Dict[str, Any] = self.jobs[name]
+        record["started"] = self.__now()
+        record["thread"] = threading.current_thread().name
+        try:
+            return job(*args)
+        finally:
+            record["finished"] = self.__now()
+            with self.__lock:
+                self.__pending -= 1
+                if not self.__pending:
+                    self.marks.setdefault("assets ready", record["finished"])
+
+    def submit(self, name: str, job: Callable, *args) -> Future:
+        """
+        Runs a job on the worker pool.
+
+        Args:
+            name (str): Unique name of the job.
+            job (Callable): The loading function.
+            *args: Arguments of the loading function.
+
+        Returns:
+            Future: The future of the job.
+        """
+        self.jobs[name] = {"submitted": self.__now(), "started": None, "finished": None, "thread": None}
+        with self.__lock:
+            self.__pending += 1
+        future: Future = self.__executor.submit(self.__run, name, job, args)
+        self.futures[name] = future
+        return future
+
+    def mark(self, name: str) -> None:
+        """
+        Records a milestone, only its first occurrence is kept.
+
+        Args:
+            name (str): Name of the milestone.
+        """
+        if name not in self.marks:
+            self.marks[name] = self.__now()
+
+    def result(self, name: str) -> Any:
+        """
+        Returns the result of a job, waiting for it if needed. Errors raised by the job are re-raised.
+
+        Args:
+            name (str): Name of the job.
+
+        Returns:
+            Any: The result of the job.
+        """
+        future: Future = self.futures[name]
+        if not future.done():
+            start: float = time.perf_counter()
+            future.result()
+            self.blocked += time.perf_counter() - start
+        return future.result()
+
+    def wait(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Waits for a set of jobs.
+
+        Args:
+            names (Iterable[str], optional): Names of the jobs. Defaults to every job.
+        """
+        futures: List[Future] = [self.futures[name] for name in (self.futures if names is None else names)]
+        if not all(future.done() for future in futures):
+            start: float = time.perf_counter()
+            wait(futures)
+            self.blocked += time.perf_counter() - start
+
+    def progress(self) -> Tuple[int, int]:
+        """
+        Returns the number of finished jobs and the number of jobs.
+
+        Returns:
+            Tuple[int, int]: Finished jobs and submitted jobs.
+        """
+        return sum(future.done() for future in self.futures.values()), len(self.futures)
+
+    def done(self) -> bool:
+        """
+        Checks whether every job finished.
+
+        Returns:
+            bool: True if no job is pending.
+        """
+        return all(future.done() for future in self.futures.values())
+
+    def timeline(self) -> List[Dict[str, Any]]:
+        """
+        Returns the jobs and milestones sorted by time, in milliseconds since startTime.
+
+        Returns:
+            List[Dict[str, Any]]: One entry per job (start, end, thread) or milestone (at).
+        """
+        entries: List[Dict[str, Any]] = [
+            {
+                "name": name,
+                "start": record["started"] * 1000 if record["started"] is not None else None,
+                "end": record["finished"] * 1000 if record["finished"] is not None else None,
+                "thread": record["thread"]
+            }
+            for name, record in self.jobs.items()
+        ]
+        entries.extend({"name": name, "at": at * 1000} for name, at in self.marks.items())
+        return sorted(entries, key=lambda entry: entry.get("at", entry.get("start")) or 0.0)
+
+    def report(self) -> str:
+        """
+        Returns the startup timeline as text.
+
+        Returns:
+            str: One line per job and milestone, then the time the main thread was blocked.
+        """
+        lines: List[str] = ["Startup timeline:"]
+        for entry in self.timeline():
+            if "at" in entry:
+                lines.append(f"  {entry['at']:8.1f} ms  * {entry['name']}")
+            elif entry["end"] is None:
+                lines.append(f"  {'':8} ms    {entry['name']} (pending)")
+            else:
+                lines.append(f"  {entry['start']:8.1f} ms    {entry['name']} until {entry['end']:.1f} ms ({entry['thread']})")
+        lines.append(f"  main thread blocked {self.blocked * 1000:.1f} ms")
+        return "\n".join(lines)
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker pool, pending jobs are cancelled.
+        """
+        self.__executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,137 @@
+import pygame
+from typing import Dict, Optional
+
+class MusicPlayer:
+    """
+    MusicPlayer streams long music tracks from disk through pygame.mixer.music, so only a small decode
+    buffer is resident instead of the whole PCM of every track. Switching tracks crossfades: the
+    current track is faded out, then the next one is loaded and faded in.
+
+    pygame.mixer.music plays a single stream, so the two tracks never overlap. The fade is driven by
+    update from the game loop instead of mixer.music.fadeout, which would block the frame.
+
+    Attributes:
+        tracks (Dict[str, str]): File path of every track keyed by name.
+        fadeTime (float): Duration of the fade out and of the fade in, in seconds.
+        volume (float): Volume of a fully faded in track (0.0 to 1.0).
+        current (str): Name of the loaded track, None before the first one.
+        target (str): Name of the track that should be playing.
+        level (float): Current fade level (0.0 to 1.0).
+        switches (int): Number of track changes.
+
+    Methods:
+        play: Requests a track, the switch happens over the next updates.
+        update: Advances the crossfade.
+        fading: Tells if a crossfade is in progress.
+        stop: Stops the music.
+        stats: Returns the player state.
+        report: Returns a one line summary of the player state.
+    """
+
+    def __init__(self, tracks: Dict[str, str], fadeTime: float = .8, volume: float = 1.0) -> None:
+        """
+        Initializes a MusicPlayer instance.
+
+        Args:
+            tracks (Dict[str, str]): File path of every track keyed by name.
+            fadeTime (float, optional): Duration of the fade out and of the fade in, in seconds. Defaults to .8.
+            volume (float, optional): Volume of a fully faded in track. Defaults to 1.0.
+        """
+        self.tracks: Dict[str, str] = tracks
+        self.fadeTime: float = fadeTime
+        self.volume: float = volume
+        self.current: Optional[str] = None
+        self.target: Optional[str] = None
+        self.level: float = 0.0
+        self.switches: int = 0
+
+    def play(self, name: str) -> None:
+        """
+        Requests a track. Requesting the track that is already playing does nothing, so this can be called every frame.
+
+        Args:
+            name (str): Name of the track.
+        """
+        if name == self.target:
+            return
+
+        self.target = name
+        if self.current is None:
+            self.__start(name)
+
+    def __start(self, name: str) -> None:
+        """
+        Loads a track and starts it looping at zero volume, update fades it in.
+
+        Args:
+            name (str): Name of the track.
+        """
+        pygame.mixer.music.load(self.tracks[name])
+        pygame.mixer.music.set_volume(0.0)
+        pygame.mixer.music.play(-1)
+        self.current = name
+        self.level = 0.0
+        self.switches += 1
+
+    def update(self, dt: float) -> None:
+        """
+        Advances the crossfade: fades the current track out while another one is requested, then
+        starts the requested track and fades it in.
+
+        Args:
+            dt (float): Time elapsed since the previous update.
+        """
+        if self.current is None:
+            return
+
+        step: float = dt / self.fadeTime if self.fadeTime > 0 else 1.0
+        if self.current != self.target:
+            self.level = max(self.level - step, 0.0)
+            if self.level == 0.0:
+                if self.target is None:
+                    pygame.mixer.music.stop()
+                    self.current = None
+                    return
+                self.__start(self.target)
+        elif self.level < 1.0:
+            self.level = min(self.level + step, 1.0)
+        else:
+            return
+
+        pygame.mixer.music.set_volume(self.level * self.volume)
+
+    def fading(self) -> bool:
+        """
+        Tells if a crossfade is in progress, in which case update has to keep being called every frame.
+
+        Returns:
+            bool: True while a track fades out or in.
+        """
+        return self.current is not None and (self.current != self.target or self.level < 1.0)
+
+    def stop(self) -> None:
+        """
+        Stops the music immediately.
+        """
+        pygame.mixer.music.stop()
+        self.current = self.target = None
+        self.level = 0.0
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Returns the player state.
+
+        Returns:
+            Dict[str, object]: Current and requested track, fade level and number of track changes.
+        """
+        return {"current": self.current, "target": self.target, "level": self.level, "switches": self.switches}
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the player state.
+
+        Returns:
+            str: The formatted summary.
+        """
+        return (f"MusicPlayer: {len(self.tracks)} streamed tracks, playing {self.current} "
+                f"at {self.level * 100:.0f}%, {self.switches} track changes")
@@ -0,0 +1,206 @@
+from typing import Dict, List, Tuple
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, only the array physics backend needs it
+    numpy = None
+
+class ArrayPhysics:
+    """
+    ArrayPhysics is an alternative physics backend for falling sprites. The state of every falling
+    object lives in contiguous NumPy arrays (position, previous position, velocity, gravity, alive
+    mask and kind), so a simulation step and the off-screen culling are a handful of batched array
+    operations instead of one Python method call per sprite.
+
+    Sprites attached to the backend become thin views over their array row: their rect is written
+    by the backend, and posVector / acc are only copied back on demand (sync_sprites, detach).
+    The integration matches DropAbleSpriteBaseClass.update exactly (same float64 operations and
+    round-half-to-even rounding), so both backends produce the same positions.
+
+    Attributes:
+        KINDS (Tuple[str, ...]): Names of the object kinds stored in the kind column.
+        windowWH (Tuple[int]): Window dimensions (width, height).
+        capacity (int): Number of rows currently allocated.
+        sprites (List): Sprite attached to every row, None for free rows.
+
+    Methods:
+        available: Checks whether numpy is installed.
+        attach: Moves a sprite's physics state into a free row.
+        detach: Copies a row back into its sprite and frees the row.
+        step: Advances every alive row by one simulation step and culls fallen sprites.
+        interpolate: Writes interpolated rect positions for rendering.
+        sync_sprites: Copies every alive row back into its sprite.
+        count: Returns the number of alive rows per kind.
+    """
+
+    KINDS: Tuple[str, ...] = ("fruit", "bug")
+
+    def __init__(self, windowWH: Tuple[int], capacity: int = 64) -> None:
+        """
+        Initializes an ArrayPhysics instance.
+
+        Args:
+            windowWH (Tuple[int]): Window dimensions (width, height).
+            capacity (int, optional): Initial number of rows, the arrays grow when they are full. Defaults to 64.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        if numpy is None:
+            raise ImportError("the 'numpy' physics backend requires numpy to be installed")
+
+        self.windowWH: Tuple[int] = windowWH
+        self.capacity: int = 0
+        self.sprites: List = []
+        self.__freeRows: List[int] = []
+        self.__high: int = 0  # Rows at and above this index have never been used
+        self.__grow(capacity)
+
+    @staticmethod
+    def available() -> bool:
+        """
+        Checks whether numpy is installed.
+
+        Returns:
+            bool: True if the backend can be used.
+        """
+        return numpy is not None
+
+    def __grow(self, capacity: int) -> None:
+        """
+        Reallocates the arrays with a larger capacity, keeping the existing rows.
+
+        Args:
+            capacity (int): New number of rows.
+        """
+        def resized(array, dtype):
+            grown = numpy.zeros(capacity, dtype=dtype)
+            if array is not None:
+                grown[:self.capacity] = array
+            return grown
+
+        self.posY = resized(getattr(self, "posY", None), numpy.float64)
+        self.prevY = resized(getattr(self, "prevY", None), numpy.float64)
+        self.acc = resized(getattr(self, "acc", None), numpy.float64)
+        self.gravity = resized(getattr(self, "gravity", None), numpy.float64)
+        self.alive = resized(getattr(self, "alive", None), numpy.bool_)
+        self.kind = resized(getattr(self, "kind", None), numpy.int8)
+        self.sprites.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def attach(self, sprite, kind: str) -> int:
+        """
+        Moves a sprite's physics state into a free row, the backend then owns its vertical motion.
+
+        Args:
+            sprite: The falling sprite (DropAbleSpriteBaseClass).
+            kind (str): The object kind, one of KINDS.
+
+        Returns:
+            int: The row of the sprite.
+        """
+        if self.__freeRows:
+            row: int = self.__freeRows.pop()
+        else:
+            if self.__high == self.capacity:
+                self.__grow(self.capacity * 2)
+            row = self.__high
+            self.__high += 1
+
+        self.posY[row] = self.prevY[row] = sprite.posVector.y
+        self.acc[row] = sprite.acc
+        self.gravity[row] = sprite.gravity
+        self.alive[row] = True
+        self.kind[row] = ArrayPhysics.KINDS.index(kind)
+        self.sprites[row] = sprite
+
+        sprite.physics = self
+        sprite.physicsRow = row
+        return row
+
+    def detach(self, sprite) -> None:
+        """
+        Copies a row back into its sprite and frees the row.
+
+        Args:
+            sprite: The attached sprite.
+        """
+        row: int = sprite.physicsRow
+        sprite.posVector.y = float(self.posY[row])
+        sprite.acc = float(self.acc[row])
+        sprite.prevPosY = float(self.prevY[row])
+
+        self.alive[row] = False
+        self.acc[row] = self.gravity[row] = 0.0
+        self.sprites[row] = None
+        self.__freeRows.append(row)
+        sprite.physics = None
+        sprite.physicsRow = None
+
+    def step(self, dt: float) -> None:
+        """
+        Advances every alive row by one simulation step, writes the new rect positions and kills the
+        sprites that fell out of the window.
+
+        Args:
+            dt (float): Length of the simulation step.
+        """
+        high: int = self.__high
+        if not high:
+            return
+
+        posY = self.posY[:high]
+        acc = self.acc[:high]
+        self.prevY[:high] = posY
+        acc += self.gravity[:high] * dt
+        posY += acc * dt
+
+        rows = numpy.flatnonzero(self.alive[:high])
+        sprites: List = self.sprites
+        for row, y in zip(rows.tolist(), numpy.rint(posY[rows]).tolist()):
+            sprite = sprites[row]
+            sprite.rect.y = int(y) - sprite.swingOffsetY
+            if sprite.animate:
+                sprite.animate_sprite(dt)
+
+        for row in numpy.flatnonzero(self.alive[:high] & (posY > self.windowWH[1] + 100)).tolist():
+            sprites[row].kill()
+
+    def interpolate(self, alpha: float) -> None:
+        """
+        Places every alive sprite's rect between the previous and the current step for rendering.
+
+        Args:
+            alpha (float): Fraction of a simulation step elapsed since the last step (0.0 to 1.0).
+        """
+        high: int = self.__high
+        rows = numpy.flatnonzero(self.alive[:high])
+        prevY = self.prevY[rows]
+        interpolated = numpy.rint(prevY + (self.posY[rows] - prevY) * alpha)
+
+        sprites: List = self.sprites
+        for row, y in zip(rows.tolist(), interpolated.tolist()):
+            sprites[row].rect.y = int(y) - sprites[row].swingOffsetY
+
+    def sync_sprites(self) -> None:
+        """
+        Copies every alive row back into its sprite (posVector.y, acc), e.g. before a snapshot.
+        """
+        for row in numpy.flatnonzero(self.alive[:self.__high]).tolist():
+            sprite = self.sprites[row]
+            sprite.posVector.y = float(self.posY[row])
+            sprite.acc = float(self.acc[row])
+            sprite.prevPosY = float(self.prevY[row])
+
+    def count(self) -> Dict[str, int]:
+        """
+        Returns the number of alive rows per kind.
+
+        Returns:
+            Dict[str, int]: Alive rows keyed by kind name.
+        """
+        alive = self.alive[:self.__high]
+        return {
+            kind: int(numpy.count_nonzero(alive & (self.kind[:self.__high] == index)))
+            for index, kind in enumerate(ArrayPhysics.KINDS)
+        }
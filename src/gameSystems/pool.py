@@ -0,0 +1,108 @@
+from typing import Callable, Dict, List
+
+class SpritePool:
+    """
+    SpritePool recycles dead sprites instead of building a new one for every spawn.
+    Pooled sprites must provide reseed(*args), taking the same arguments as their constructor, and
+    must call release on their pool when they are killed (see DropAbleSpriteBaseClass.kill).
+
+    Attributes:
+        factory (Callable): Builds a new sprite when the pool is empty (usually the sprite class).
+        maxSize (int): Maximum number of dead sprites kept for reuse.
+        free (List): Dead sprites waiting to be reused.
+        live (int): Number of sprites handed out and not released yet.
+        allocated (int): Number of sprites built by the factory.
+        reused (int): Number of spawns served by a recycled sprite.
+        discarded (int): Number of released sprites dropped because the pool was full.
+
+    Methods:
+        acquire: Returns a recycled (re-seeded) sprite, or a new one when the pool is empty.
+        release: Takes a dead sprite back.
+        clear: Drops every pooled sprite.
+        stats: Returns the pool counters.
+        report: Returns a one line summary of the pool counters.
+    """
+
+    def __init__(self, factory: Callable, maxSize: int = 32) -> None:
+        """
+        Initializes a SpritePool instance.
+
+        Args:
+            factory (Callable): Builds a new sprite when the pool is empty.
+            maxSize (int, optional): Maximum number of dead sprites kept for reuse. Defaults to 32.
+        """
+        self.factory: Callable = factory
+        self.maxSize: int = maxSize
+        self.free: List = []
+        self.live: int = 0
+        self.allocated: int = 0
+        self.reused: int = 0
+        self.discarded: int = 0
+
+    def acquire(self, *args):
+        """
+        Returns a recycled sprite re-seeded with the given arguments, or a new one when the pool is empty.
+
+        Args:
+            *args: Constructor arguments of the sprite.
+
+        Returns:
+            The spawned sprite.
+        """
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reseed(*args)
+            self.reused += 1
+        else:
+            sprite = self.factory(*args)
+            sprite.pool = self
+            self.allocated += 1
+
+        self.live += 1
+        return sprite
+
+    def release(self, sprite) -> None:
+        """
+        Takes a dead sprite back, it is dropped if the pool is already full.
+
+        Args:
+            sprite: The killed sprite.
+        """
+        self.live -= 1
+        if len(self.free) < self.maxSize:
+            self.free.append(sprite)
+        else:
+            self.discarded += 1
+
+    def clear(self) -> None:
+        """
+        Drops every pooled sprite.
+        """
+        self.free.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the pool counters.
+
+        Returns:
+            Dict[str, int]: Live, pooled, allocated, reused and discarded counts.
+        """
+        return {
+            "live": self.live,
+            "pooled": len(self.free),
+            "allocated": self.allocated,
+            "reused": self.reused,
+            "discarded": self.discarded
+        }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the pool counters.
+
+        Returns:
+            str: The formatted summary.
+        """
+        stats: Dict[str, int] = self.stats()
+        return (f"SpritePool ({getattr(self.factory, '__name__', 'sprite')}): {stats['live']} live, "
+                f"{stats['pooled']} pooled, {stats['allocated']} allocated, {stats['reused']} reused, "
+                f"{stats['discarded']} discarded")
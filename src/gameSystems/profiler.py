@@ -0,0 +1,232 @@
+import os
+import csv
+import sys
+import time
+import pygame
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+def resident_memory() -> int:
+    """
+    Returns the resident set size of the process.
+
+    Returns:
+        int: Resident memory in bytes, or the peak resident memory where the current value is not available.
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:  # Windows has neither /proc nor resource
+        return 0
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+class FrameProfiler:
+    """
+    FrameProfiler records how long every phase of a frame takes into a fixed size ring buffer.
+    When it is disabled every hook returns immediately, so the instrumentation can stay in the game loop.
+
+    Attributes:
+        PHASES (Tuple[str, ...]): Names of the measured phases, in frame order.
+        enabled (bool): Flag indicating if frames are recorded.
+        capacity (int): Number of frames kept in the ring buffer.
+        frames (int): Number of recorded frames (may exceed the capacity).
+
+    Methods:
+        begin_frame: Starts a frame.
+        mark: Closes the current phase.
+        end_frame: Stores the current frame in the ring buffer.
+        reset: Drops every recorded frame.
+        rows: Returns the recorded frames, oldest first.
+        summary: Returns FPS, frame-time percentiles and the average time of every phase.
+        dump_csv: Writes the recorded frames to a CSV file.
+        draw_overlay: Draws the on-screen performance overlay.
+    """
+
+    PHASES: Tuple[str, ...] = (
+        "events",
+        "background",
+        "update",
+        "collision",
+        "sprites",
+        "text",
+        "present"
+    )
+
+    def __init__(self, capacity: int = 600, enabled: bool = False, overlayInterval: float = .25) -> None:
+        """
+        Initializes a FrameProfiler instance.
+
+        Args:
+            capacity (int, optional): Number of frames kept in the ring buffer. Defaults to 600.
+            enabled (bool, optional): Flag indicating if frames are recorded. Defaults to False.
+            overlayInterval (float, optional): Seconds between two overlay text refreshes. Defaults to .25.
+        """
+        self.enabled: bool = enabled
+        self.capacity: int = capacity
+        self.frames: int = 0
+        self.overlayInterval: float = overlayInterval
+        self.phaseIndex: Dict[str, int] = {phase: index for index, phase in enumerate(FrameProfiler.PHASES)}
+
+        # Each row holds the frame interval, the frame time and one column per phase
+        self.__width: int = 2 + len(FrameProfiler.PHASES)
+        self.__ring: array = array("d", [0.0]) * (capacity * self.__width)
+        self.__current: List[float] = [0.0] * len(FrameProfiler.PHASES)
+        self.__recording: bool = False
+        self.__frameStart: float = 0.0
+        self.__lastFrameStart: Optional[float] = None
+        self.__lastMark: float = 0.0
+        self.__overlay: Optional["pygame.surface.Surface"] = None
+        self.__overlayTime: float = 0.0
+
+    def begin_frame(self) -> None:
+        """
+        Starts a frame. Enabling or disabling the profiler takes effect on the next frame.
+        """
+        self.__recording = self.enabled
+        if not self.enabled:
+            self.__lastFrameStart = None
+            return
+
+        self.__frameStart = self.__lastMark = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """
+        Closes the current phase: the time since the previous mark is added to the given phase.
+        A phase may be marked several times per frame (e.g. once per simulation step).
+
+        Args:
+            phase (str): Name of the phase that just finished, one of PHASES.
+        """
+        if not self.__recording:
+            return
+
+        now: float = time.perf_counter()
+        self.__current[self.phaseIndex[phase]] += now - self.__lastMark
+        self.__lastMark = now
+
+    def end_frame(self) -> None:
+        """
+        Stores the current frame in the ring buffer.
+        """
+        if not self.__recording:
+            return
+
+        now: float = time.perf_counter()
+        offset: int = (self.frames % self.capacity) * self.__width
+        interval: float = now - self.__lastFrameStart if self.__lastFrameStart is not None else now - self.__frameStart
+
+        self.__ring[offset] = interval
+        self.__ring[offset + 1] = now - self.__frameStart
+        for index, value in enumerate(self.__current):
+            self.__ring[offset + 2 + index] = value
+            self.__current[index] = 0.0
+
+        self.__lastFrameStart = self.__frameStart
+        self.frames += 1
+
+    def reset(self) -> None:
+        """
+        Drops every recorded frame.
+        """
+        self.frames = 0
+        self.__lastFrameStart = None
+        self.__current = [0.0] * len(FrameProfiler.PHASES)
+
+    def rows(self) -> List[List[float]]:
+        """
+        Returns the recorded frames, oldest first.
+
+        Returns:
+            List[List[float]]: One row per frame: interval, frame time and the phase times, in seconds.
+        """
+        count: int = min(self.frames, self.capacity)
+        first: int = self.frames - count
+        return [
+            list(self.__ring[(frame % self.capacity) * self.__width:(frame % self.capacity + 1) * self.__width])
+            for frame in range(first, self.frames)
+        ]
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Returns FPS, frame-time percentiles and the average time of every phase over the ring buffer.
+
+        Returns:
+            Dict[str, float]: FPS and times in milliseconds, zero filled when nothing was recorded.
+        """
+        rows: List[List[float]] = self.rows()
+        if not rows:
+            return {"fps": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, **{phase: 0.0 for phase in FrameProfiler.PHASES}}
+
+        frameTimes: List[float] = sorted(row[1] for row in rows)
+        pick = lambda q: frameTimes[min(int(q * len(frameTimes)), len(frameTimes) - 1)] * 1000
+        intervals: float = sum(row[0] for row in rows)
+
+        summary: Dict[str, float] = {
+            "fps": len(rows) / intervals if intervals else 0.0,
+            "p50": pick(.50),
+            "p95": pick(.95),
+            "p99": pick(.99)
+        }
+        for index, phase in enumerate(FrameProfiler.PHASES):
+            summary[phase] = sum(row[2 + index] for row in rows) / len(rows) * 1000
+        return summary
+
+    def dump_csv(self, path: str) -> int:
+        """
+        Writes the recorded frames to a CSV file (times in milliseconds).
+
+        Args:
+            path (str): Path of the CSV file.
+
+        Returns:
+            int: Number of written frames.
+        """
+        rows: List[List[float]] = self.rows()
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("frame", "interval", "total", *FrameProfiler.PHASES))
+            first: int = self.frames - len(rows)
+            for index, row in enumerate(rows):
+                writer.writerow((first + index, *(f"{value * 1000:.4f}" for value in row)))
+        return len(rows)
+
+    def draw_overlay(self, surface: "pygame.surface.Surface", font: "pygame.font.Font", extras: Dict[str, str], pos: Tuple[int, int] = (5, 50)) -> "pygame.Rect":
+        """
+        Draws the performance overlay. The text is only rasterized again every overlayInterval seconds.
+
+        Args:
+            surface (pygame.surface.Surface): The destination surface.
+            font (pygame.font.Font): Font of the overlay text.
+            extras (Dict[str, str]): Additional lines (sprite counts, audio channels, ...).
+            pos (Tuple[int, int], optional): Top left position of the overlay. Defaults to (5, 50).
+
+        Returns:
+            pygame.Rect: The area that was drawn.
+        """
+        now: float = time.perf_counter()
+        if self.__overlay is None or now - self.__overlayTime >= self.overlayInterval:
+            summary: Dict[str, float] = self.summary()
+            lines: List[str] = [
+                f"FPS {summary['fps']:.0f}",
+                f"p50 {summary['p50']:.2f} p95 {summary['p95']:.2f} p99 {summary['p99']:.2f} ms",
+                *(f"{phase} {summary[phase]:.3f} ms" for phase in FrameProfiler.PHASES),
+                *(f"{name} {value}" for name, value in extras.items())
+            ]
+            rendered: List["pygame.surface.Surface"] = [font.render(line, False, "yellow") for line in lines]
+            lineHeight: int = font.get_linesize()
+
+            self.__overlay = pygame.Surface(
+                (max(line.get_width() for line in rendered) + 10, lineHeight * len(rendered) + 10)
+            )
+            self.__overlay.set_alpha(200)
+            for index, line in enumerate(rendered):
+                self.__overlay.blit(line, (5, 5 + index * lineHeight))
+            self.__overlayTime = now
+
+        return surface.blit(self.__overlay, pos)
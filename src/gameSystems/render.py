@@ -0,0 +1,180 @@
+import time
+import pygame
+from typing import Dict, Iterable, List, Optional, Tuple
+
+def merge_rects(rects: Iterable["pygame.Rect"]) -> List["pygame.Rect"]:
+    """
+    Merges overlapping rectangles into their union so that no pixel is pushed twice.
+
+    Args:
+        rects (Iterable[pygame.Rect]): Dirty rectangles, zero sized rectangles are ignored.
+
+    Returns:
+        List[pygame.Rect]: Non-overlapping rectangles covering every input rectangle.
+    """
+    merged: List["pygame.Rect"] = []
+
+    for rect in rects:
+        if not rect:
+            continue
+        rect = pygame.Rect(rect)
+        index: int = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+
+    return merged
+
+class FrameRenderer:
+    """
+    FrameRenderer owns the background drawing and the display update of a frame and can run in
+    two modes: the full redraw mode fills the screen, blits the background and pushes the whole
+    surface every frame, the dirty rectangle mode only erases and pushes the areas that changed.
+
+    Attributes:
+        window (pygame.display): The display module used to present frames.
+        surface (pygame.surface.Surface): The surface everything is drawn on.
+        dirtyRects (bool): Flag indicating if the dirty rectangle mode is enabled.
+        fullRedraw (bool): Flag forcing the next frame to be drawn and pushed in full.
+        rects (List[pygame.Rect]): Dirty rectangles collected for the current frame.
+        frames (int): Number of presented frames.
+        pixelsPushed (int): Number of pixels sent to the display.
+        cpuTime (float): Process CPU time spent between begin_frame and present.
+
+    Methods:
+        set_background: Sets the background and rebuilds the backdrop used to erase sprites.
+        request_full_redraw: Forces the next frame to be drawn and pushed in full.
+        begin_frame: Starts a frame and draws the background when a full redraw is needed.
+        erase: Restores the backdrop under a rectangle.
+        mark: Adds dirty rectangles to the current frame.
+        present: Pushes the current frame to the display.
+        stats: Returns the fill rate and CPU time counters.
+        report: Returns a one line summary of the counters.
+    """
+
+    def __init__(self, window: "pygame.display", surface: "pygame.surface.Surface", dirtyRects: bool = False) -> None:
+        """
+        Initializes a FrameRenderer instance.
+
+        Args:
+            window (pygame.display): The display module used to present frames.
+            surface (pygame.surface.Surface): The surface everything is drawn on.
+            dirtyRects (bool, optional): Flag enabling the dirty rectangle mode. Defaults to False.
+        """
+        self.window: "pygame.display" = window
+        self.surface: "pygame.surface.Surface" = surface
+        self.dirtyRects: bool = dirtyRects
+        self.fullRedraw: bool = True
+        self.rects: List["pygame.Rect"] = []
+        self.background: Optional["pygame.surface.Surface"] = None
+        self.backgroundPos: Tuple[int, int] = (0, 0)
+        self.backdrop: Optional["pygame.surface.Surface"] = None
+        self.frames: int = 0
+        self.pixelsPushed: int = 0
+        self.cpuTime: float = 0.0
+        self.__frameStart: float = 0.0
+
+    def set_background(self, background: "pygame.surface.Surface", pos: Tuple[int, int]) -> None:
+        """
+        Sets the background and rebuilds the backdrop used to erase sprites.
+
+        Args:
+            background (pygame.surface.Surface): The (already scaled) background surface.
+            pos (Tuple[int, int]): Position of the background on the screen.
+        """
+        if background is self.background:
+            return
+
+        self.background = background
+        self.backgroundPos = pos
+        self.backdrop = pygame.Surface(self.surface.get_size()).convert()
+        self.backdrop.fill("Black")
+        self.backdrop.blit(background, pos)
+        self.fullRedraw = True
+
+    def request_full_redraw(self) -> None:
+        """
+        Forces the next frame to be drawn and pushed in full.
+        """
+        self.fullRedraw = True
+
+    def begin_frame(self) -> bool:
+        """
+        Starts a frame. In full redraw mode (or when a full redraw was requested) the screen is
+        cleared and the background is drawn, otherwise the caller is expected to erase what it drew.
+
+        Returns:
+            bool: True if the whole frame was redrawn, False if only dirty areas have to be erased.
+        """
+        self.__frameStart = time.process_time()
+
+        if self.dirtyRects and not self.fullRedraw:
+            return False
+
+        self.surface.fill("Black")
+        if self.background is not None:
+            self.surface.blit(self.background, self.backgroundPos)
+        return True
+
+    def erase(self, rect: Optional["pygame.Rect"]) -> None:
+        """
+        Restores the backdrop under a rectangle.
+
+        Args:
+            rect (pygame.Rect, optional): The area to erase. None is ignored.
+        """
+        if rect:
+            self.surface.blit(self.backdrop, rect, rect)
+
+    def mark(self, rects: Iterable[Optional["pygame.Rect"]]) -> None:
+        """
+        Adds dirty rectangles to the current frame.
+
+        Args:
+            rects (Iterable[pygame.Rect]): Areas that changed, None entries are ignored.
+        """
+        self.rects.extend(rect for rect in rects if rect)
+
+    def present(self) -> None:
+        """
+        Pushes the current frame to the display, either in full or as the union of the dirty areas.
+        """
+        if self.dirtyRects and not self.fullRedraw:
+            rects: List["pygame.Rect"] = merge_rects(self.rects)
+            self.window.update(rects)
+            self.pixelsPushed += sum(rect.width * rect.height for rect in rects)
+        else:
+            self.window.update()
+            self.pixelsPushed += self.surface.get_width() * self.surface.get_height()
+            self.fullRedraw = False
+
+        self.rects.clear()
+        self.frames += 1
+        self.cpuTime += time.process_time() - self.__frameStart
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the fill rate and CPU time counters.
+
+        Returns:
+            Dict[str, float]: Frame count, average pixels pushed and average CPU milliseconds per frame.
+        """
+        frames: int = max(self.frames, 1)
+        return {
+            "mode": "dirty" if self.dirtyRects else "full",
+            "frames": self.frames,
+            "pixelsPerFrame": self.pixelsPushed / frames,
+            "cpuMsPerFrame": self.cpuTime * 1000 / frames
+        }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the counters.
+
+        Returns:
+            str: The formatted summary.
+        """
+        stats: Dict[str, float] = self.stats()
+        return (f"FrameRenderer ({stats['mode']}): {stats['frames']} frames, "
+                f"{stats['pixelsPerFrame']:.0f} px/frame, {stats['cpuMsPerFrame']:.3f} ms CPU/frame")
@@ -0,0 +1,324 @@
+import struct
+import pygame
+from typing import Callable, List, Optional, Sequence, Tuple
+
+class Replay:
+    """
+    Replay is a recorded session: the seed of the game's random number generator, the key presses
+    and the changes of the held movement direction, stamped with the simulation tick they were
+    applied at. The game is deterministic for a given seed and input sequence, so this is enough to
+    re-run a session exactly.
+
+    Binary layout (little endian): the magic b"FBRP", a version byte, the seed (uint64) and the
+    simulation rate (uint16), then one record per input: the tick delta to the previous record and
+    the input code, both as unsigned LEB128 varints. Code 0 is a quit, codes 1 to 3 set the held
+    direction to code - 2 (left, none, right), any other code is a key press of key code - 4.
+
+    Attributes:
+        MAGIC (bytes): File signature.
+        VERSION (int): Format version.
+        QUIT (int): Input code of a quit event.
+        DIRECTION (int): Input code of the held direction 0, directions -1 and 1 are the codes around it.
+        KEY (int): Offset added to a key code.
+        seed (int): Seed of the game's random number generator.
+        simulationHz (int): Simulation rate the session was recorded at.
+        inputs (List[Tuple[int, int]]): (tick, input code) of every recorded input, in order.
+
+    Methods:
+        add: Appends an input.
+        encode: Returns the binary log.
+        decode: Parses a binary log.
+        save: Writes the binary log to a file.
+        load: Reads a binary log from a file.
+    """
+
+    MAGIC: bytes = b"FBRP"
+    VERSION: int = 2
+    QUIT: int = 0
+    DIRECTION: int = 2
+    KEY: int = 4
+
+    __HEADER: struct.Struct = struct.Struct("<4sBQH")
+
+    def __init__(self, seed: int, simulationHz: int, inputs: Optional[List[Tuple[int, int]]] = None) -> None:
+        """
+        Initializes a Replay instance.
+
+        Args:
+            seed (int): Seed of the game's random number generator.
+            simulationHz (int): Simulation rate of the session.
+            inputs (List[Tuple[int, int]], optional): (tick, input code) of every input. Defaults to no input.
+        """
+        self.seed: int = seed
+        self.simulationHz: int = simulationHz
+        self.inputs: List[Tuple[int, int]] = inputs if inputs is not None else []
+
+    def add(self, tick: int, code: int) -> None:
+        """
+        Appends an input.
+
+        Args:
+            tick (int): Simulation tick the input was applied at.
+            code (int): Input code (QUIT, DIRECTION + direction or KEY + key code).
+        """
+        self.inputs.append((tick, code))
+
+    @staticmethod
+    def __varint(value: int, out: bytearray) -> None:
+        """
+        Appends an unsigned LEB128 varint.
+
+        Args:
+            value (int): The non negative value.
+            out (bytearray): The output buffer.
+        """
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    def encode(self) -> bytes:
+        """
+        Returns the binary log.
+
+        Returns:
+            bytes: The encoded replay.
+
+        Raises:
+            ValueError: If a tick goes backwards or an input code is negative.
+            struct.error: If the seed or the simulation rate does not fit the header.
+        """
+        out: bytearray = bytearray(Replay.__HEADER.pack(Replay.MAGIC, Replay.VERSION, self.seed, self.simulationHz))
+        previous: int = 0
+        for tick, code in self.inputs:
+            Replay.__varint(tick - previous, out)
+            Replay.__varint(code, out)
+            previous = tick
+        return bytes(out)
+
+    @staticmethod
+    def decode(data: bytes) -> "Replay":
+        """
+        Parses a binary log.
+
+        Args:
+            data (bytes): The encoded replay.
+
+        Returns:
+            Replay: The decoded replay.
+
+        Raises:
+            ValueError: If the data is not a replay of a supported version or is truncated.
+        """
+        if len(data) < Replay.__HEADER.size:
+            raise ValueError("replay is truncated")
+        magic, version, seed, simulationHz = Replay.__HEADER.unpack_from(data)
+        if magic != Replay.MAGIC or version != Replay.VERSION:
+            raise ValueError("not a supported replay file")
+
+        values: List[int] = []
+        value: int = 0
+        shift: int = 0
+        for byte in data[Replay.__HEADER.size:]:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                values.append(value)
+                value = shift = 0
+        if shift or len(values) % 2:
+            raise ValueError("replay is truncated")
+
+        inputs: List[Tuple[int, int]] = []
+        tick: int = 0
+        for index in range(0, len(values), 2):
+            tick += values[index]
+            inputs.append((tick, values[index + 1]))
+        return Replay(seed, simulationHz, inputs)
+
+    def save(self, path: str) -> int:
+        """
+        Writes the binary log to a file.
+
+        Args:
+            path (str): Path of the replay file.
+
+        Returns:
+            int: Size of the file in bytes.
+        """
+        data: bytes = self.encode()
+        with open(path, "wb") as file:
+            file.write(data)
+        return len(data)
+
+    @staticmethod
+    def load(path: str) -> "Replay":
+        """
+        Reads a binary log from a file.
+
+        Args:
+            path (str): Path of the replay file.
+
+        Returns:
+            Replay: The decoded replay.
+        """
+        with open(path, "rb") as file:
+            return Replay.decode(file.read())
+
+class ReplayRecorder:
+    """
+    ReplayRecorder wraps an input source and records the key presses it returns and the changes of
+    the direction it holds, stamped with the current simulation tick. The quit is recorded by finish.
+
+    Attributes:
+        source: The wrapped input source.
+        replay (Replay): The replay being recorded.
+        held (int): Last recorded direction.
+
+    Methods:
+        get: Returns the events of the wrapped source and records them.
+        direction: Returns the direction held on the wrapped source and records its changes.
+        finish: Closes the recording with a quit at the given tick.
+    """
+
+    def __init__(self, source, replay: Replay, clock: Callable[[], int]) -> None:
+        """
+        Initializes a ReplayRecorder instance.
+
+        Args:
+            source: The wrapped input source.
+            replay (Replay): The replay to record into.
+            clock (Callable[[], int]): Returns the current simulation tick.
+        """
+        self.source = source
+        self.replay: Replay = replay
+        self.held: int = 0
+        self.__clock: Callable[[], int] = clock
+
+    def get(self) -> Sequence["pygame.event.Event"]:
+        """
+        Returns the events of the wrapped source and records the key presses among them. A quit is
+        left to finish: the game still steps the rest of the frame it is received in.
+
+        Returns:
+            Sequence[pygame.event.Event]: The events of the frame.
+        """
+        events: Sequence["pygame.event.Event"] = self.source.get()
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self.replay.add(self.__clock(), event.key + Replay.KEY)
+        return events
+
+    def direction(self) -> int:
+        """
+        Returns the direction held on the wrapped source and records it when it changed.
+
+        Returns:
+            int: -1 (left), 1 (right) or 0.
+        """
+        direction: int = self.source.direction()
+        if direction != self.held:
+            self.replay.add(self.__clock(), Replay.DIRECTION + direction)
+            self.held = direction
+        return direction
+
+    def finish(self, tick: int) -> Replay:
+        """
+        Closes the recording with a quit at the given tick, the last tick the game simulated.
+
+        Args:
+            tick (int): Current simulation tick.
+
+        Returns:
+            Replay: The recorded replay.
+        """
+        self.replay.add(tick, Replay.QUIT)
+        return self.replay
+
+class ReplayInput:
+    """
+    ReplayInput feeds the inputs of a replay back to the game: the events and direction changes recorded up to the current simulation tick.
+
+    Attributes:
+        replay (Replay): The replay being played.
+        position (int): Index of the next input.
+        held (int): Direction held at the current tick.
+
+    Methods:
+        get: Returns the events recorded up to the current tick.
+        direction: Returns the direction held at the current tick.
+        next_tick: Returns the tick of the next input.
+        finished: Checks whether every input was delivered.
+    """
+
+    def __init__(self, replay: Replay, clock: Callable[[], int]) -> None:
+        """
+        Initializes a ReplayInput instance.
+
+        Args:
+            replay (Replay): The replay to play.
+            clock (Callable[[], int]): Returns the current simulation tick.
+        """
+        self.replay: Replay = replay
+        self.position: int = 0
+        self.held: int = 0
+        self.__events: List["pygame.event.Event"] = []
+        self.__clock: Callable[[], int] = clock
+
+    def __advance(self) -> None:
+        """
+        Applies every input recorded up to the current tick: events are queued for get, direction changes update held.
+        """
+        tick: int = self.__clock()
+        inputs: List[Tuple[int, int]] = self.replay.inputs
+        while self.position < len(inputs) and inputs[self.position][0] <= tick:
+            code: int = inputs[self.position][1]
+            if code == Replay.QUIT:
+                self.__events.append(pygame.event.Event(pygame.QUIT))
+            elif code < Replay.KEY:
+                self.held = code - Replay.DIRECTION
+            else:
+                self.__events.append(pygame.event.Event(pygame.KEYDOWN, key=code - Replay.KEY))
+            self.position += 1
+
+    def get(self) -> List["pygame.event.Event"]:
+        """
+        Returns the events recorded up to the current tick. Real events are discarded so they cannot alter the session.
+
+        Returns:
+            List[pygame.event.Event]: The events of the frame.
+        """
+        pygame.event.pump()
+        pygame.event.clear()
+
+        self.__advance()
+        events: List["pygame.event.Event"] = self.__events
+        self.__events = []
+        return events
+
+    def direction(self) -> int:
+        """
+        Returns the direction held at the current tick.
+
+        Returns:
+            int: -1 (left), 1 (right) or 0.
+        """
+        self.__advance()
+        return self.held
+
+    def next_tick(self) -> Optional[int]:
+        """
+        Returns the tick of the next input.
+
+        Returns:
+            int: The tick, None once every input was delivered.
+        """
+        return self.replay.inputs[self.position][0] if self.position < len(self.replay.inputs) else None
+
+    def finished(self) -> bool:
+        """
+        Checks whether every input was delivered.
+
+        Returns:
+            bool: True once the replay is over.
+        """
+        return self.position >= len(self.replay.inputs)
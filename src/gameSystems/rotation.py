@@ -0,0 +1,222 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+class RotationSheet:
+    """
+    RotationSheet holds one source image pre-rotated at a fixed number of evenly spaced angles.
+
+    Attributes:
+        steps (int): Number of quantized angles.
+        stepAngle (float): Angle between two frames in degrees.
+        frames (List[pygame.surface.Surface]): Rotated frames, frame i is rotated by i * stepAngle degrees.
+        offsets (List[Tuple[int, int]]): Per frame (dx, dy) such that frame topleft = source topleft - (dx, dy)
+            keeps the frame centered on the source image.
+        bytes (int): Pixel memory held by the frames.
+
+    Methods:
+        index: Returns the frame index closest to an angle.
+        frame: Returns the frame and its re-centering offset for an angle.
+    """
+
+    def __init__(self, source: "pygame.surface.Surface", steps: int) -> None:
+        """
+        Initializes a RotationSheet instance by rendering every frame.
+
+        Args:
+            source (pygame.surface.Surface): The unrotated image.
+            steps (int): Number of quantized angles.
+        """
+        self.steps: int = steps
+        self.stepAngle: float = 360 / steps
+        self.frames: List["pygame.surface.Surface"] = [
+            pygame.transform.rotate(source, index * self.stepAngle) for index in range(steps)
+        ]
+        self.offsets: List[Tuple[int, int]] = [
+            ((frame.get_width() - source.get_width()) // 2, (frame.get_height() - source.get_height()) // 2)
+            for frame in self.frames
+        ]
+        self.bytes: int = sum(frame.get_pitch() * frame.get_height() for frame in self.frames)
+
+    def index(self, angle: float) -> int:
+        """
+        Returns the frame index closest to an angle.
+
+        Args:
+            angle (float): Rotation angle in degrees (any range, counter-clockwise like pygame.transform.rotate).
+
+        Returns:
+            int: The frame index.
+        """
+        return round(angle / self.stepAngle) % self.steps
+
+    def frame(self, angle: float) -> Tuple["pygame.surface.Surface", Tuple[int, int]]:
+        """
+        Returns the frame and its re-centering offset for an angle.
+
+        Args:
+            angle (float): Rotation angle in degrees.
+
+        Returns:
+            Tuple[pygame.surface.Surface, Tuple[int, int]]: The rotated frame and its (dx, dy) offset.
+        """
+        index: int = self.index(angle)
+        return self.frames[index], self.offsets[index]
+
+class RotationCache:
+    """
+    RotationCache shares one RotationSheet per source image (and so per (image, scale), since the
+    source surfaces come from the shared surface cache) across every sprite instance. Sheets are kept
+    in least recently used order and evicted when the memory budget is exceeded.
+
+    Attributes:
+        steps (int): Number of quantized angles per sheet.
+        budget (int): Maximum pixel memory held by the sheets, in bytes.
+        sheets (OrderedDict): Sheets keyed by source surface, least recently used first.
+        bytes (int): Pixel memory currently held by the sheets.
+        hits (int): Number of frame lookups served by a cached sheet.
+        misses (int): Number of sheets built.
+        evictions (int): Number of sheets evicted to stay within the budget.
+        uncached (int): Number of rotations done on the fly because a sheet did not fit the budget.
+        oversized (Set[pygame.surface.Surface]): Source images whose sheet alone exceeds the budget.
+
+    Methods:
+        configure: Changes the number of angles and the memory budget.
+        sheet: Returns the sheet of a source image, building it on first use.
+        frame: Returns the rotated frame and its re-centering offset for an angle.
+        preload: Builds the sheets of a batch of images ahead of time.
+        stats: Returns the cache counters.
+        report: Returns a one line summary of the cache counters.
+    """
+
+    def __init__(self, steps: int = 72, budget: int = 48 * 1024 * 1024) -> None:
+        """
+        Initializes a RotationCache instance.
+
+        Args:
+            steps (int, optional): Number of quantized angles per sheet. Defaults to 72 (5 degree steps).
+            budget (int, optional): Maximum pixel memory held by the sheets, in bytes. Defaults to 48 MiB.
+        """
+        self.steps: int = steps
+        self.budget: int = budget
+        self.sheets: "OrderedDict[pygame.surface.Surface, RotationSheet]" = OrderedDict()
+        self.bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.uncached: int = 0
+        self.oversized: Set["pygame.surface.Surface"] = set()
+
+    def configure(self, steps: int, budget: int) -> None:
+        """
+        Changes the number of angles and the memory budget, dropping the sheets if the angles changed.
+
+        Args:
+            steps (int): Number of quantized angles per sheet.
+            budget (int): Maximum pixel memory held by the sheets, in bytes.
+        """
+        if steps != self.steps:
+            self.sheets.clear()
+            self.bytes = 0
+        self.oversized.clear()
+        self.steps = steps
+        self.budget = budget
+
+        while self.bytes > self.budget and self.sheets:
+            self.bytes -= self.sheets.popitem(last=False)[1].bytes
+            self.evictions += 1
+
+    def sheet(self, source: "pygame.surface.Surface") -> Optional[RotationSheet]:
+        """
+        Returns the sheet of a source image, building it on first use.
+
+        Args:
+            source (pygame.surface.Surface): The unrotated image.
+
+        Returns:
+            RotationSheet: The sheet, None if a single sheet does not fit the memory budget.
+        """
+        sheet: Optional[RotationSheet] = self.sheets.get(source)
+        if sheet is not None:
+            self.hits += 1
+            self.sheets.move_to_end(source)
+            return sheet
+        if source in self.oversized:
+            return None
+
+        self.misses += 1
+        sheet = RotationSheet(source, self.steps)
+        if sheet.bytes > self.budget:
+            self.oversized.add(source)
+            return None
+
+        while self.bytes + sheet.bytes > self.budget:
+            self.bytes -= self.sheets.popitem(last=False)[1].bytes
+            self.evictions += 1
+
+        self.sheets[source] = sheet
+        self.bytes += sheet.bytes
+        return sheet
+
+    def frame(self, source: "pygame.surface.Surface", angle: float) -> Tuple["pygame.surface.Surface", Tuple[int, int]]:
+        """
+        Returns the rotated frame and its re-centering offset for an angle.
+
+        Args:
+            source (pygame.surface.Surface): The unrotated image.
+            angle (float): Rotation angle in degrees.
+
+        Returns:
+            Tuple[pygame.surface.Surface, Tuple[int, int]]: The rotated frame and its (dx, dy) offset.
+        """
+        sheet: Optional[RotationSheet] = self.sheet(source)
+        if sheet is not None:
+            return sheet.frame(angle)
+
+        # The sheet does not fit the budget, rotate this frame on the fly
+        self.uncached += 1
+        rotated: "pygame.surface.Surface" = pygame.transform.rotate(source, round(angle / (360 / self.steps)) * (360 / self.steps))
+        return rotated, ((rotated.get_width() - source.get_width()) // 2, (rotated.get_height() - source.get_height()) // 2)
+
+    def preload(self, sources: Iterable["pygame.surface.Surface"]) -> None:
+        """
+        Builds the sheets of a batch of images ahead of time.
+
+        Args:
+            sources (Iterable[pygame.surface.Surface]): The unrotated images.
+        """
+        for source in sources:
+            self.sheet(source)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters.
+
+        Returns:
+            Dict[str, int]: Sheet count, memory, hits, misses, evictions and on the fly rotations.
+        """
+        return {
+            "sheets": len(self.sheets),
+            "steps": self.steps,
+            "bytes": self.bytes,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "uncached": self.uncached
+        }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the cache counters.
+
+        Returns:
+            str: The formatted summary.
+        """
+        stats: Dict[str, int] = self.stats()
+        return (f"RotationCache: {stats['sheets']} sheets x {stats['steps']} angles, "
+                f"{stats['bytes'] / 1048576:.1f}/{stats['budget'] / 1048576:.1f} MiB, {stats['hits']} hits, "
+                f"{stats['misses']} misses, {stats['evictions']} evictions, {stats['uncached']} uncached")
+
+# Process wide cache shared by every sprite
+rotationCache: RotationCache = RotationCache()
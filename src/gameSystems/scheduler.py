@@ -0,0 +1,149 @@
+import time
+import pygame
+from typing import Any, Collection, Dict, Hashable, Optional
+
+class FrameScheduler:
+    """
+    FrameScheduler paces the game loop. States that animate are capped at a frame rate, while static
+    states (menus, pause, game over) are drawn once and then only again when their content changes,
+    an input arrives or something on them is animating (the performance overlay). In between, the
+    loop sleeps in pygame.event.wait instead of spinning at the frame rate. Work that needs the
+    frame clock but no drawing (a music crossfade, polling the loading progress) keeps the loop
+    awake without redrawing the screen.
+
+    The processor and wall time spent in every state are accumulated, so the cost of idling can be
+    compared with the cost of playing.
+
+    Attributes:
+        maxFPS (int): Frame rate cap of the animated states.
+        idleStates (Collection[str]): States drawn only when they change.
+        idleTimeout (float): Longest sleep of an idle state, in seconds.
+        clock (pygame.time.Clock): Clock capping the frame rate.
+        usage (Dict[str, Dict[str, float]]): Processor and wall seconds, drawn and skipped frames and wake-ups per state.
+
+    Methods:
+        invalidate: Forces the next frame to be drawn.
+        needs_redraw: Tells if the current frame has to be drawn.
+        wait: Sleeps until the next frame is due and books the elapsed time on a state.
+        stats: Returns the usage per state.
+        report: Returns a one line summary of the usage per state.
+    """
+
+    def __init__(self, maxFPS: int, idleStates: Collection[str], idleTimeout: float = 1.0) -> None:
+        """
+        Initializes a FrameScheduler instance.
+
+        Args:
+            maxFPS (int): Frame rate cap of the animated states.
+            idleStates (Collection[str]): States drawn only when they change.
+            idleTimeout (float, optional): Longest sleep of an idle state, in seconds. Defaults to 1.0.
+        """
+        self.maxFPS: int = maxFPS
+        self.idleStates: Collection[str] = idleStates
+        self.idleTimeout: float = idleTimeout
+        self.clock: pygame.time.Clock = pygame.time.Clock()
+        self.usage: Dict[str, Dict[str, float]] = {}
+        self.__view: Optional[Hashable] = None
+        self.__dirty: bool = True
+        self.__awake: bool = True
+        self.__cpuTime: float = time.process_time()
+        self.__wallTime: float = time.perf_counter()
+
+    def __usage(self, state: str) -> Dict[str, float]:
+        """
+        Returns the usage counters of a state, creating them on first use.
+
+        Args:
+            state (str): The state.
+
+        Returns:
+            Dict[str, float]: The counters of the state.
+        """
+        if state not in self.usage:
+            self.usage[state] = {"cpuSeconds": 0.0, "wallSeconds": 0.0, "drawn": 0, "skipped": 0, "wakeUps": 0}
+        return self.usage[state]
+
+    def invalidate(self) -> None:
+        """
+        Forces the next frame to be drawn (an input arrived, the window was exposed).
+        """
+        self.__dirty = True
+
+    def needs_redraw(self, state: str, view: Hashable, animating: bool = False, busy: bool = False) -> bool:
+        """
+        Tells if the current frame has to be drawn. Animated states are always drawn, idle states
+        only when their view changed, the frame was invalidated or something on them is animating.
+
+        Args:
+            state (str): The game state.
+            view (Hashable): Everything the state shows (score, loading progress, ...), compared with the last drawn frame.
+            animating (bool, optional): Flag indicating if the frame changes on its own. Defaults to False.
+            busy (bool, optional): Flag indicating if the next frame is needed soon although nothing has to be drawn. Defaults to False.
+
+        Returns:
+            bool: True if the frame has to be drawn.
+        """
+        view = (state, view)
+        redraw: bool = state not in self.idleStates or animating or self.__dirty or view != self.__view
+        self.__view = view
+        self.__dirty = False
+        self.__awake = animating or busy
+        self.__usage(state)["drawn" if redraw else "skipped"] += 1
+        return redraw
+
+    def wait(self, state: str) -> float:
+        """
+        Sleeps until the next frame is due and books the time since the previous call on a state.
+        An idle state sleeps until an event arrives or the idle timeout expires, the event is put
+        back into the queue for the input source. Any other state is capped at the frame rate.
+
+        Args:
+            state (str): The game state the elapsed time is booked on.
+
+        Returns:
+            float: Time slept waiting for an event, in seconds (0.0 when the frame rate cap applied).
+        """
+        slept: float = 0.0
+        if state in self.idleStates and not self.__awake and not self.__dirty:
+            start: float = time.perf_counter()
+            event: "pygame.event.Event" = pygame.event.wait(int(self.idleTimeout * 1000))
+            slept = time.perf_counter() - start
+            if event.type != pygame.NOEVENT:
+                pygame.event.post(event)
+            self.__usage(state)["wakeUps"] += 1
+            self.clock.tick()
+        else:
+            self.clock.tick(self.maxFPS)
+
+        cpuTime: float = time.process_time()
+        wallTime: float = time.perf_counter()
+        usage: Dict[str, float] = self.__usage(state)
+        usage["cpuSeconds"] += cpuTime - self.__cpuTime
+        usage["wallSeconds"] += wallTime - self.__wallTime
+        self.__cpuTime, self.__wallTime = cpuTime, wallTime
+        return slept
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the usage per state.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The counters of every state plus its processor use in percent of one core.
+        """
+        return {
+            state: dict(usage, cpuPercent=usage["cpuSeconds"] / usage["wallSeconds"] * 100 if usage["wallSeconds"] else 0.0)
+            for state, usage in self.usage.items()
+        }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the usage per state.
+
+        Returns:
+            str: The formatted summary.
+        """
+        return "FrameScheduler: " + ", ".join(
+            f"{state} {usage['cpuPercent']:.1f}% CPU over {usage['wallSeconds']:.1f} s "
+            f"({usage['drawn']} drawn, {usage['skipped']} skipped)"
+            for state, usage in self.stats().items()
+        )
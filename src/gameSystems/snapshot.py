@@ -0,0 +1,359 @@
+import os
+import time
+import struct
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+class SpriteState(NamedTuple):
+    """
+    SpriteState is the saved state of one falling fruit or bug.
+
+    Attributes:
+        kind (int): Object kind (0 fruit, 1 bug).
+        image (int): Index of the sprite image in the sorted image list of its kind.
+        value (int): Points (fruit) or damage (bug).
+        spawnX (int): Horizontal spawn position.
+        spawnY (int): Vertical spawn position.
+        posY (float): Vertical position.
+        prevPosY (float): Vertical position of the previous simulation step.
+        acc (float): Vertical speed.
+        gravity (int): Gravity.
+        angle (float): Spawn rotation angle, in degrees.
+        speed (float): Rotation speed.
+        swing (float): Current swing offset, in degrees.
+        amplitude (float): Maximum swing offset, in degrees.
+        direction (int): Swing direction (-1 or 1).
+    """
+
+    kind: int
+    image: int
+    value: int
+    spawnX: int
+    spawnY: int
+    posY: float
+    prevPosY: float
+    acc: float
+    gravity: int
+    angle: float
+    speed: float
+    swing: float
+    amplitude: float
+    direction: int
+
+class Snapshot:
+    """
+    Snapshot is the full state of a game session: score, level, lives, basket position, the state
+    of the random number generator and every falling sprite. Restoring it resumes the session
+    exactly where it was saved.
+
+    Binary layout (little endian): the magic b"FBSS", a version byte, the game record (tick, seed,
+    state, point, level, lives, best score, basket position and unconsumed frame time), the
+    Mersenne Twister state of the generator (625 uint32 and the cached gauss value), the sprite
+    count (uint16) and one fixed size record per sprite.
+
+    Attributes:
+        MAGIC (bytes): File signature.
+        VERSION (int): Format version.
+        tick (int): Number of simulation steps run.
+        seed (int): Seed of the game's random number generator.
+        state (int): Index of the game state in Game.STATE.
+        point (int): Score.
+        lvl (int): Level.
+        live (int): Lives of the player.
+        maxScore (int): Best score so far.
+        basketX (float): Exact horizontal position of the basket.
+        accumulator (float): Frame time not yet consumed by the simulation.
+        rngState (Tuple): State of the random number generator (random.Random.getstate()).
+        sprites (List[SpriteState]): Every falling sprite, in group order.
+
+    Methods:
+        encode: Returns the binary snapshot.
+        decode: Parses a binary snapshot.
+        save: Writes the binary snapshot to a file, atomically.
+        load: Reads a binary snapshot from a file.
+    """
+
+    MAGIC: bytes = b"FBSS"
+    VERSION: int = 1
+
+    __HEADER: struct.Struct = struct.Struct("<4sB")
+    __GAME: struct.Struct = struct.Struct("<QQBiBiidd")
+    __RNG: struct.Struct = struct.Struct("<625IBd")
+    __COUNT: struct.Struct = struct.Struct("<H")
+    __SPRITE: struct.Struct = struct.Struct("<BHHhhdddHddddb")
+
+    def __init__(self, tick: int, seed: int, state: int, point: int, lvl: int, live: int, maxScore: int,
+                 basketX: float, accumulator: float, rngState: Tuple, sprites: List[SpriteState]) -> None:
+        """
+        Initializes a Snapshot instance.
+
+        Args:
+            tick (int): Number of simulation steps run.
+            seed (int): Seed of the game's random number generator.
+            state (int): Index of the game state in Game.STATE.
+            point (int): Score.
+            lvl (int): Level.
+            live (int): Lives of the player.
+            maxScore (int): Best score so far.
+            basketX (float): Exact horizontal position of the basket.
+            accumulator (float): Frame time not yet consumed by the simulation.
+            rngState (Tuple): State of the random number generator.
+            sprites (List[SpriteState]): Every falling sprite, in group order.
+        """
+        self.tick: int = tick
+        self.seed: int = seed
+        self.state: int = state
+        self.point: int = point
+        self.lvl: int = lvl
+        self.live: int = live
+        self.maxScore: int = maxScore
+        self.basketX: float = basketX
+        self.accumulator: float = accumulator
+        self.rngState: Tuple = rngState
+        self.sprites: List[SpriteState] = sprites
+
+    def encode(self) -> bytes:
+        """
+        Returns the binary snapshot.
+
+        Returns:
+            bytes: The encoded snapshot.
+
+        Raises:
+            struct.error: If a field does not fit its binary record.
+        """
+        version, words, gauss = self.rngState
+        parts: List[bytes] = [
+            Snapshot.__HEADER.pack(Snapshot.MAGIC, Snapshot.VERSION),
+            Snapshot.__GAME.pack(self.tick, self.seed, self.state, self.point, self.lvl, self.live,
+                                 self.maxScore, self.basketX, self.accumulator),
+            Snapshot.__RNG.pack(*words, gauss is not None, gauss or 0.0),
+            Snapshot.__COUNT.pack(len(self.sprites))
+        ]
+        parts.extend(Snapshot.__SPRITE.pack(*sprite) for sprite in self.sprites)
+        return b"".join(parts)
+
+    @staticmethod
+    def decode(data: bytes) -> "Snapshot":
+        """
+        Parses a binary snapshot.
+
+        Args:
+            data (bytes): The encoded snapshot.
+
+        Returns:
+            Snapshot: The decoded snapshot.
+
+        Raises:
+            ValueError: If the data is not a snapshot of a supported version or is truncated.
+        """
+        try:
+            magic, version = Snapshot.__HEADER.unpack_from(data)
+            if magic != Snapshot.MAGIC or version != Snapshot.VERSION:
+                raise ValueError("not a supported snapshot file")
+            offset: int = Snapshot.__HEADER.size
+
+            game: Tuple = Snapshot.__GAME.unpack_from(data, offset)
+            offset += Snapshot.__GAME.size
+            rng: Tuple = Snapshot.__RNG.unpack_from(data, offset)
+            offset += Snapshot.__RNG.size
+            count: int = Snapshot.__COUNT.unpack_from(data, offset)[0]
+            offset += Snapshot.__COUNT.size
+
+            sprites: List[SpriteState] = [
+                SpriteState._make(values) for values in Snapshot.__SPRITE.iter_unpack(data[offset:offset + count * Snapshot.__SPRITE.size])
+            ]
+        except struct.error as error:
+            raise ValueError("snapshot is truncated") from error
+        if len(sprites) != count:
+            raise ValueError("snapshot is truncated")
+
+        rngState: Tuple = (3, rng[:625], rng[626] if rng[625] else None)
+        return Snapshot(*game, rngState, sprites)
+
+    def save(self, path: str) -> int:
+        """
+        Writes the binary snapshot to a file, atomically (see atomic_write).
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Returns:
+            int: Size of the file in bytes.
+        """
+        data: bytes = self.encode()
+        atomic_write(path, data)
+        return len(data)
+
+    @staticmethod
+    def load(path: str) -> "Snapshot":
+        """
+        Reads a binary snapshot from a file.
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Returns:
+            Snapshot: The decoded snapshot.
+        """
+        with open(path, "rb") as file:
+            return Snapshot.decode(file.read())
+
+def atomic_write(path: str, data: bytes) -> None:
+    """
+    Writes a file atomically: the data goes to a temporary file in the same folder, which then
+    replaces the target. A crash never leaves a half written file behind.
+
+    Args:
+        path (str): Path of the file.
+        data (bytes): Content of the file.
+    """
+    temporary: str = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+class Autosaver:
+    """
+    Autosaver writes snapshots on a background thread, so the game loop never waits on the disk.
+    Only the latest snapshot matters: one submitted while another is still waiting replaces it.
+
+    Attributes:
+        path (str): Path of the save file.
+        saves (int): Number of snapshots written.
+        coalesced (int): Number of snapshots replaced by a newer one before they were written.
+        failures (int): Number of failed writes.
+        lastError (Optional[str]): Reason of the last failed write.
+        lastSize (int): Size of the last written snapshot in bytes.
+        writeTime (float): Total time spent encoding and writing, in seconds.
+        maxWriteTime (float): Longest encode and write, in seconds.
+
+    Methods:
+        submit: Queues a snapshot for writing.
+        flush: Waits until the queued snapshot is written.
+        close: Writes the queued snapshot and stops the thread.
+        stats: Returns the counters.
+        report: Returns a one line summary of the counters.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initializes an Autosaver instance and starts its thread.
+
+        Args:
+            path (str): Path of the save file.
+        """
+        self.path: str = path
+        self.saves: int = 0
+        self.coalesced: int = 0
+        self.failures: int = 0
+        self.lastError: Optional[str] = None
+        self.lastSize: int = 0
+        self.writeTime: float = 0.0
+        self.maxWriteTime: float = 0.0
+        self.__pending: Optional[Snapshot] = None
+        self.__busy: bool = False
+        self.__closed: bool = False
+        self.__condition: threading.Condition = threading.Condition()
+        self.__thread: threading.Thread = threading.Thread(target=self.__run, name="autosave", daemon=True)
+        self.__thread.start()
+
+    def submit(self, snapshot: Snapshot) -> None:
+        """
+        Queues a snapshot for writing, replacing a queued one that was not written yet.
+
+        Args:
+            snapshot (Snapshot): The snapshot.
+        """
+        with self.__condition:
+            if self.__pending is not None:
+                self.coalesced += 1
+            self.__pending = snapshot
+            self.__condition.notify_all()
+
+    def __run(self) -> None:
+        """
+        Writes the queued snapshots until the saver is closed.
+        """
+        while True:
+            with self.__condition:
+                while self.__pending is None and not self.__closed:
+                    self.__condition.wait()
+                if self.__pending is None:
+                    return
+                snapshot: Snapshot = self.__pending
+                self.__pending = None
+                self.__busy = True
+
+            start: float = time.perf_counter()
+            error: Optional[str] = None
+            try:
+                size: int = snapshot.save(self.path)
+            except (OSError, struct.error) as exception:
+                # A field out of range fails this save only, the next snapshots are still written
+                size = 0
+                error = str(exception)
+            elapsed: float = time.perf_counter() - start
+
+            with self.__condition:
+                if size:
+                    self.saves += 1
+                    self.lastSize = size
+                else:
+                    self.failures += 1
+                    self.lastError = error
+                self.writeTime += elapsed
+                self.maxWriteTime = max(self.maxWriteTime, elapsed)
+                self.__busy = False
+                self.__condition.notify_all()
+
+    def flush(self) -> None:
+        """
+        Waits until the queued snapshot is written.
+        """
+        with self.__condition:
+            while self.__pending is not None or self.__busy:
+                self.__condition.wait()
+
+    def close(self) -> None:
+        """
+        Writes the queued snapshot and stops the thread.
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the counters.
+
+        Returns:
+            Dict[str, Any]: Saves, coalesced snapshots, failures and the last error, last size and write times in milliseconds.
+        """
+        with self.__condition:
+            return {
+                "saves": self.saves,
+                "coalesced": self.coalesced,
+                "failures": self.failures,
+                "lastError": self.lastError,
+                "lastSize": self.lastSize,
+                "meanWriteMs": self.writeTime / self.saves * 1000 if self.saves else 0.0,
+                "maxWriteMs": self.maxWriteTime * 1000
+            }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the counters.
+
+        Returns:
+            str: The formatted summary.
+        """
+        stats: Dict[str, Any] = self.stats()
+        summary: str = (f"Autosaver: {stats['saves']} saves ({stats['lastSize']} bytes), {stats['coalesced']} coalesced, "
+                        f"{stats['failures']} failed, write {stats['meanWriteMs']:.2f} ms mean / {stats['maxWriteMs']:.2f} ms max")
+        if stats["lastError"] is not None:
+            summary += f", last error {stats['lastError']}"
+        return summary
@@ -0,0 +1,166 @@
+import pygame
+from typing import Dict, List, Optional, Set, Tuple
+
+class SoundEffectManager:
+    """
+    SoundEffectManager plays short sound effects on a set of reserved mixer channels, so bursts of
+    effects can never take every channel or cut off an important cue.
+
+    Every effect has a maximum number of concurrent voices and a priority. An effect triggered more
+    than once in the same frame is only played once. When every reserved channel is busy, the
+    oldest voice of the lowest priority below the new effect is stolen; otherwise the new effect is dropped.
+
+    Attributes:
+        channels (List[pygame.mixer.Channel]): The reserved channels.
+        effects (Dict[str, Tuple[pygame.mixer.Sound, int, int]]): Sound, max voices and priority of every effect.
+        voices (List[Optional[Tuple[str, int, int]]]): Effect name, priority and start order of the voice of every channel.
+        played (int): Number of voices started.
+        deduplicated (int): Number of triggers merged with an identical trigger of the same frame.
+        dropped (int): Number of triggers dropped (voice limit reached or no channel to steal).
+        stolen (int): Number of voices stopped to make room for a higher priority effect.
+
+    Methods:
+        register: Adds an effect.
+        begin_frame: Starts a new frame for the same-frame de-duplication.
+        play: Triggers an effect.
+        stop: Stops every voice.
+        active_voices: Returns the number of playing voices per effect.
+        stats: Returns the counters.
+        report: Returns a one line summary of the counters.
+    """
+
+    def __init__(self, channelCount: int = 6) -> None:
+        """
+        Initializes a SoundEffectManager instance and reserves its channels.
+
+        Args:
+            channelCount (int, optional): Number of mixer channels reserved for sound effects. Defaults to 6.
+        """
+        if pygame.mixer.get_num_channels() < channelCount:
+            pygame.mixer.set_num_channels(channelCount)
+        pygame.mixer.set_reserved(channelCount)
+
+        self.channels: List["pygame.mixer.Channel"] = [pygame.mixer.Channel(index) for index in range(channelCount)]
+        self.effects: Dict[str, Tuple["pygame.mixer.Sound", int, int]] = {}
+        self.voices: List[Optional[Tuple[str, int, int]]] = [None] * channelCount
+        self.played: int = 0
+        self.deduplicated: int = 0
+        self.dropped: int = 0
+        self.stolen: int = 0
+        self.__frameTriggers: Set[str] = set()
+        self.__serial: int = 0
+
+    def register(self, name: str, sound: "pygame.mixer.Sound", maxVoices: int = 2, priority: int = 0) -> None:
+        """
+        Adds an effect.
+
+        Args:
+            name (str): Name of the effect.
+            sound (pygame.mixer.Sound): The preloaded sound.
+            maxVoices (int, optional): Maximum number of concurrent voices of the effect. Defaults to 2.
+            priority (int, optional): Higher priorities may steal the channels of lower ones. Defaults to 0.
+        """
+        self.effects[name] = (sound, maxVoices, priority)
+
+    def begin_frame(self) -> None:
+        """
+        Starts a new frame: the effects triggered in the previous frame may be played again.
+        """
+        self.__frameTriggers.clear()
+
+    def __release_finished(self) -> None:
+        """
+        Forgets the voices of the channels that finished playing.
+        """
+        for index, channel in enumerate(self.channels):
+            if self.voices[index] is not None and not channel.get_busy():
+                self.voices[index] = None
+
+    def play(self, name: str) -> bool:
+        """
+        Triggers an effect.
+
+        Args:
+            name (str): Name of the effect.
+
+        Returns:
+            bool: True if a voice was started (or the effect was already started this frame).
+        """
+        if name in self.__frameTriggers:
+            self.deduplicated += 1
+            return True
+
+        sound, maxVoices, priority = self.effects[name]
+        self.__release_finished()
+
+        if sum(1 for voice in self.voices if voice is not None and voice[0] == name) >= maxVoices:
+            self.dropped += 1
+            return False
+
+        index: Optional[int] = next((index for index, voice in enumerate(self.voices) if voice is None), None)
+        if index is None:
+            # Steal the oldest voice of the lowest priority below this effect
+            victims: List[Tuple[int, int, int]] = [
+                (voice[1], voice[2], index) for index, voice in enumerate(self.voices) if voice[1] < priority
+            ]
+            if not victims:
+                self.dropped += 1
+                return False
+            index = min(victims)[2]
+            self.channels[index].stop()
+            self.stolen += 1
+
+        self.channels[index].play(sound)
+        self.__serial += 1
+        self.voices[index] = (name, priority, self.__serial)
+        self.__frameTriggers.add(name)
+        self.played += 1
+        return True
+
+    def stop(self) -> None:
+        """
+        Stops every voice.
+        """
+        for channel in self.channels:
+            channel.stop()
+        self.voices = [None] * len(self.channels)
+
+    def active_voices(self) -> Dict[str, int]:
+        """
+        Returns the number of playing voices per effect.
+
+        Returns:
+            Dict[str, int]: Playing voices keyed by effect name.
+        """
+        self.__release_finished()
+        voices: Dict[str, int] = {name: 0 for name in self.effects}
+        for voice in self.voices:
+            if voice is not None:
+                voices[voice[0]] += 1
+        return voices
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the counters.
+
+        Returns:
+            Dict[str, int]: Played, de-duplicated, dropped and stolen counts and the number of reserved channels.
+        """
+        return {
+            "channels": len(self.channels),
+            "played": self.played,
+            "deduplicated": self.deduplicated,
+            "dropped": self.dropped,
+            "stolen": self.stolen
+        }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the counters.
+
+        Returns:
+            str: The formatted summary.
+        """
+        stats: Dict[str, int] = self.stats()
+        return (f"SoundEffectManager: {stats['channels']} channels, {stats['played']} played, "
+                f"{stats['deduplicated']} deduplicated, {stats['dropped']} dropped, {stats['stolen']} stolen")
@@ -0,0 +1,476 @@
+import time
+import socket
+import struct
+import asyncio
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+class TelemetryFrame(NamedTuple):
+    """
+    TelemetryFrame is the state of the game after one simulation tick, as seen by spectators.
+
+    Attributes:
+        tick (int): Simulation tick.
+        stamp (int): Wall clock time the frame was captured at, in microseconds since the epoch.
+        state (int): Index of the game state in Game.STATE.
+        point (int): Score.
+        lvl (int): Level.
+        live (int): Lives of the player.
+        basketX (int): Horizontal position of the basket.
+        sprites (List[Tuple[int, int, int, int, int]]): (identity, kind, image, center x, center y) of every falling sprite.
+    """
+
+    tick: int
+    stamp: int
+    state: int
+    point: int
+    lvl: int
+    live: int
+    basketX: int
+    sprites: List[Tuple[int, int, int, int, int]]
+
+class TelemetryServer:
+    """
+    TelemetryServer streams the game state to spectator clients (tournament dashboards) over TCP.
+    It runs an asyncio event loop on its own thread: the game loop hands over the latest frame and
+    returns at once, encoding and network I/O never happen on the game thread. Nothing is captured
+    while no client is connected.
+
+    A client first receives a snapshot (message type 1: the game record, the sprite count and one
+    full record per sprite), then one delta per frame (type 2: the game record, the tick of the
+    frame it applies to, the keys of the removed sprites, full records of the added sprites and the
+    movement of the moved ones). Sprites are keyed by small integers assigned by the server.
+
+    A client whose socket buffer holds more than highWater bytes is skipped instead of buffering
+    without bound, it is sent a fresh snapshot once it has caught up. When the event loop falls
+    behind the game, frames waiting to be sent are replaced by newer ones, deltas then span
+    several ticks.
+
+    Attributes:
+        SNAPSHOT (int): Message type of a snapshot.
+        DELTA (int): Message type of a delta.
+        FRAMING, GAME_RECORD, SPRITE_RECORD, MOVE_RECORD, COUNT, BASE_TICK (struct.Struct): Binary layouts of the messages.
+        host (str): Address the server listens on.
+        port (int): Port the server listens on (the bound port when 0 was requested).
+        highWater (int): Socket buffer size above which a client is skipped, in bytes.
+        subscribers (int): Number of connected clients.
+        frames (int): Number of frames broadcast.
+        snapshots (int): Number of snapshots sent.
+        deltas (int): Number of deltas sent.
+        skipped (int): Number of frames not sent to a client because its socket buffer was full.
+        coalesced (int): Number of frames replaced by a newer one before they were broadcast.
+        bytesSent (int): Number of bytes written to the clients.
+
+    Methods:
+        start: Starts the event loop thread and waits until the server listens.
+        publish: Hands a frame over to the server.
+        stop: Disconnects the clients and stops the event loop thread.
+        stats: Returns the counters.
+        report: Returns a one line summary of the counters.
+    """
+
+    SNAPSHOT: int = 1
+    DELTA: int = 2
+
+    # Framing (little endian): payload size (uint32) and message type (uint8), then the payload
+    FRAMING: struct.Struct = struct.Struct("<IB")
+    # Every payload starts with the game record: tick, capture time, state, score, level, lives and basket position
+    GAME_RECORD: struct.Struct = struct.Struct("<IqBiBhh")
+    # Full sprite record: key, kind, image, center x and y
+    SPRITE_RECORD: struct.Struct = struct.Struct("<HBBhh")
+    # Moved sprite record: key and the change of the center since the previous frame
+    MOVE_RECORD: struct.Struct = struct.Struct("<Hbb")
+    COUNT: struct.Struct = struct.Struct("<H")
+    BASE_TICK: struct.Struct = struct.Struct("<I")
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, highWater: int = 64 * 1024) -> None:
+        """
+        Initializes a TelemetryServer instance.
+
+        Args:
+            host (str, optional): Address to listen on. Defaults to "127.0.0.1" (local clients only).
+            port (int, optional): Port to listen on, 0 picks a free port. Defaults to 8765.
+            highWater (int, optional): Socket buffer size above which a client is skipped, in bytes. Defaults to 64 KiB.
+        """
+        self.host: str = host
+        self.port: int = port
+        self.highWater: int = highWater
+        self.subscribers: int = 0
+        self.frames: int = 0
+        self.snapshots: int = 0
+        self.deltas: int = 0
+        self.skipped: int = 0
+        self.coalesced: int = 0
+        self.bytesSent: int = 0
+        self.encodeTime: float = 0.0
+        self.__clients: Dict[asyncio.StreamWriter, bool] = {}  # Writer of every client and whether it needs a snapshot
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__server: Optional[asyncio.AbstractServer] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__ready: threading.Event = threading.Event()
+        self.__lock: threading.Lock = threading.Lock()
+        self.__pending: Optional[TelemetryFrame] = None
+        self.__scheduled: bool = False
+
+        # Encoder state, only touched on the event loop thread
+        self.__keys: Dict[int, int] = {}  # Server key of every sprite identity of the previous frame
+        self.__freeKeys: List[int] = []
+        self.__nextKey: int = 0
+        self.__previous: Dict[int, Tuple[int, int, int, int]] = {}  # Key -> (kind, image, x, y) of the previous frame
+        self.__previousTick: int = 0
+
+    def start(self) -> None:
+        """
+        Starts the event loop thread and waits until the server listens.
+
+        Raises:
+            OSError: If the server cannot listen on the address.
+        """
+        self.__thread = threading.Thread(target=self.__run, name="telemetry", daemon=True)
+        self.__thread.start()
+        self.__ready.wait()
+        if self.__server is None:
+            raise OSError(f"telemetry server could not listen on {self.host}:{self.port}")
+
+    def __run(self) -> None:
+        """
+        Runs the event loop until the server is stopped.
+        """
+        self.__loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.__loop)
+        try:
+            self.__server = self.__loop.run_until_complete(asyncio.start_server(self.__serve, self.host, self.port))
+            self.port = self.__server.sockets[0].getsockname()[1]
+        except OSError:
+            self.__ready.set()
+            self.__loop.close()
+            return
+        self.__ready.set()
+        self.__loop.run_forever()
+
+        # Stopped: disconnect the clients, their handlers see the end of the stream and finish
+        self.__server.close()
+        for writer in list(self.__clients):
+            writer.close()
+        tasks: Set[asyncio.Task] = asyncio.all_tasks(self.__loop)
+        if tasks:
+            self.__loop.run_until_complete(asyncio.wait(tasks, timeout=1.0))
+        self.__loop.close()
+
+    async def __serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Registers a client and keeps it until it disconnects. Clients never send anything.
+
+        Args:
+            reader (asyncio.StreamReader): Stream of the client.
+            writer (asyncio.StreamWriter): Writer of the client.
+        """
+        sock: Optional[socket.socket] = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.__clients[writer] = True
+        self.subscribers = len(self.__clients)
+        try:
+            while await reader.read(1024):
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            del self.__clients[writer]
+            self.subscribers = len(self.__clients)
+            writer.close()
+
+    def publish(self, frame: TelemetryFrame) -> None:
+        """
+        Hands a frame over to the server. Never blocks: a frame the event loop has not sent yet is replaced.
+
+        Args:
+            frame (TelemetryFrame): The state after the current tick.
+        """
+        with self.__lock:
+            if self.__pending is not None:
+                self.coalesced += 1
+            self.__pending = frame
+            if self.__scheduled or self.__loop is None:
+                return
+            self.__scheduled = True
+        self.__loop.call_soon_threadsafe(self.__broadcast)
+
+    def __broadcast(self) -> None:
+        """
+        Encodes the pending frame and writes it to every client that can take it.
+        """
+        with self.__lock:
+            frame: Optional[TelemetryFrame] = self.__pending
+            self.__pending = None
+            self.__scheduled = False
+        if frame is None:
+            return
+
+        start: float = time.perf_counter()
+        delta, current = self.__encode_delta(frame)
+        snapshot: Optional[bytes] = None
+        for writer, resync in self.__clients.items():
+            if writer.is_closing():
+                continue
+            if writer.transport.get_write_buffer_size() > self.highWater:
+                self.__clients[writer] = True
+                self.skipped += 1
+                continue
+            if resync:
+                if snapshot is None:
+                    snapshot = self.__encode_snapshot(frame, current)
+                writer.write(snapshot)
+                self.__clients[writer] = False
+                self.snapshots += 1
+                self.bytesSent += len(snapshot)
+            else:
+                writer.write(delta)
+                self.deltas += 1
+                self.bytesSent += len(delta)
+        self.frames += 1
+        self.encodeTime += time.perf_counter() - start
+
+    def __encode_delta(self, frame: TelemetryFrame) -> Tuple[bytes, Dict[int, Tuple[int, int, int, int]]]:
+        """
+        Assigns keys to the sprites of a frame and encodes the delta to the previous frame.
+
+        Args:
+            frame (TelemetryFrame): The frame.
+
+        Returns:
+            Tuple[bytes, Dict[int, Tuple[int, int, int, int]]]: The delta message and the (kind, image, x, y) of every key.
+        """
+        current: Dict[int, Tuple[int, int, int, int]] = {}
+        keys: Dict[int, int] = {}
+        for identity, kind, image, x, y in frame.sprites:
+            key: Optional[int] = self.__keys.pop(identity, None)
+            if key is None:
+                key = self.__freeKeys.pop() if self.__freeKeys else self.__next_key()
+            keys[identity] = key
+            current[key] = (kind, image, x, y)
+
+        # Sprites left over from the previous frame are gone, their keys are free again
+        removed: List[int] = list(self.__keys.values())
+        self.__freeKeys.extend(removed)
+
+        added: List[bytes] = []
+        moved: List[bytes] = []
+        for key, (kind, image, x, y) in current.items():
+            previous: Optional[Tuple[int, int, int, int]] = self.__previous.get(key)
+            if previous is None or previous[:2] != (kind, image):
+                added.append(TelemetryServer.SPRITE_RECORD.pack(key, kind, image, x, y))
+                continue
+            dx, dy = x - previous[2], y - previous[3]
+            if not dx and not dy:
+                continue
+            if -128 <= dx <= 127 and -128 <= dy <= 127:
+                moved.append(TelemetryServer.MOVE_RECORD.pack(key, dx, dy))
+            else:
+                added.append(TelemetryServer.SPRITE_RECORD.pack(key, kind, image, x, y))
+
+        payload: bytes = b"".join((
+            self.__game_record(frame),
+            TelemetryServer.BASE_TICK.pack(self.__previousTick),
+            TelemetryServer.COUNT.pack(len(removed)), b"".join(TelemetryServer.COUNT.pack(key) for key in removed),
+            TelemetryServer.COUNT.pack(len(added)), *added,
+            TelemetryServer.COUNT.pack(len(moved)), *moved
+        ))
+        self.__keys = keys
+        self.__previous = current
+        self.__previousTick = frame.tick
+        return TelemetryServer.FRAMING.pack(len(payload), TelemetryServer.DELTA) + payload, current
+
+    def __next_key(self) -> int:
+        """
+        Returns a key that was never used.
+
+        Returns:
+            int: The key.
+        """
+        self.__nextKey += 1
+        return self.__nextKey - 1
+
+    def __encode_snapshot(self, frame: TelemetryFrame, current: Dict[int, Tuple[int, int, int, int]]) -> bytes:
+        """
+        Encodes a full snapshot of a frame.
+
+        Args:
+            frame (TelemetryFrame): The frame.
+            current (Dict[int, Tuple[int, int, int, int]]): The (kind, image, x, y) of every key.
+
+        Returns:
+            bytes: The snapshot message.
+        """
+        payload: bytes = b"".join((
+            self.__game_record(frame),
+            TelemetryServer.COUNT.pack(len(current)),
+            *(TelemetryServer.SPRITE_RECORD.pack(key, *sprite) for key, sprite in current.items())
+        ))
+        return TelemetryServer.FRAMING.pack(len(payload), TelemetryServer.SNAPSHOT) + payload
+
+    @staticmethod
+    def __game_record(frame: TelemetryFrame) -> bytes:
+        """
+        Encodes the game record of a frame.
+
+        Args:
+            frame (TelemetryFrame): The frame.
+
+        Returns:
+            bytes: The game record.
+        """
+        return TelemetryServer.GAME_RECORD.pack(frame.tick, frame.stamp, frame.state, frame.point, frame.lvl, frame.live, frame.basketX)
+
+    def stop(self) -> None:
+        """
+        Disconnects the clients and stops the event loop thread.
+        """
+        if self.__loop is None or self.__thread is None:
+            return
+        if self.__loop.is_running():
+            self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the counters.
+
+        Returns:
+            Dict[str, Any]: Clients, frames, messages and bytes sent, skipped and coalesced frames and the mean encode time in milliseconds.
+        """
+        return {
+            "subscribers": self.subscribers,
+            "frames": self.frames,
+            "snapshots": self.snapshots,
+            "deltas": self.deltas,
+            "skipped": self.skipped,
+            "coalesced": self.coalesced,
+            "bytesSent": self.bytesSent,
+            "meanEncodeMs": self.encodeTime / self.frames * 1000 if self.frames else 0.0
+        }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the counters.
+
+        Returns:
+            str: The formatted summary.
+        """
+        stats: Dict[str, Any] = self.stats()
+        return (f"TelemetryServer ({self.host}:{self.port}): {stats['frames']} frames, {stats['snapshots']} snapshots, "
+                f"{stats['deltas']} deltas, {stats['bytesSent'] / 1024:.1f} KiB sent, {stats['skipped']} skipped, "
+                f"{stats['coalesced']} coalesced, encode {stats['meanEncodeMs']:.3f} ms")
+
+class TelemetryMirror:
+    """
+    TelemetryMirror rebuilds the game state from the telemetry stream on the client side. Deltas
+    that do not apply to the mirrored frame are ignored until the next snapshot.
+
+    Attributes:
+        tick (int): Tick of the mirrored frame, None before the first snapshot.
+        game (Tuple[int, ...]): Game record of the mirrored frame (tick, capture time, state, score, level, lives, basket position).
+        sprites (Dict[int, List[int]]): [kind, image, x, y] of every sprite keyed by server key.
+        snapshots (int): Number of snapshots applied.
+        deltas (int): Number of deltas applied.
+        ignored (int): Number of deltas ignored while waiting for a snapshot.
+        bytesReceived (int): Number of bytes fed.
+
+    Methods:
+        feed: Parses received bytes and applies the complete messages among them.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a TelemetryMirror instance.
+        """
+        self.tick: Optional[int] = None
+        self.game: Tuple[int, ...] = ()
+        self.sprites: Dict[int, List[int]] = {}
+        self.snapshots: int = 0
+        self.deltas: int = 0
+        self.ignored: int = 0
+        self.bytesReceived: int = 0
+        self.__buffer: bytearray = bytearray()
+
+    def feed(self, data: bytes) -> List[Tuple[int, ...]]:
+        """
+        Parses received bytes and applies the complete messages among them, an incomplete message is kept for the next call.
+
+        Args:
+            data (bytes): Bytes received from the server.
+
+        Returns:
+            List[Tuple[int, ...]]: Game record of every applied message.
+        """
+        self.bytesReceived += len(data)
+        self.__buffer += data
+        applied: List[Tuple[int, ...]] = []
+        offset: int = 0
+        while len(self.__buffer) - offset >= TelemetryServer.FRAMING.size:
+            size, kind = TelemetryServer.FRAMING.unpack_from(self.__buffer, offset)
+            if len(self.__buffer) - offset - TelemetryServer.FRAMING.size < size:
+                break
+            payload: bytes = bytes(self.__buffer[offset + TelemetryServer.FRAMING.size:offset + TelemetryServer.FRAMING.size + size])
+            if self.__apply(kind, payload):
+                applied.append(self.game)
+            offset += TelemetryServer.FRAMING.size + size
+        del self.__buffer[:offset]
+        return applied
+
+    def __apply(self, kind: int, payload: bytes) -> bool:
+        """
+        Applies one message.
+
+        Args:
+            kind (int): Message type.
+            payload (bytes): Message payload.
+
+        Returns:
+            bool: True if the message was applied, False if a delta was ignored.
+
+        Raises:
+            ValueError: If the message type is unknown.
+        """
+        game: Tuple[int, ...] = TelemetryServer.GAME_RECORD.unpack_from(payload)
+        offset: int = TelemetryServer.GAME_RECORD.size
+
+        if kind == TelemetryServer.SNAPSHOT:
+            count: int = TelemetryServer.COUNT.unpack_from(payload, offset)[0]
+            offset += TelemetryServer.COUNT.size
+            self.sprites = {
+                key: [*sprite] for key, *sprite in TelemetryServer.SPRITE_RECORD.iter_unpack(payload[offset:offset + count * TelemetryServer.SPRITE_RECORD.size])
+            }
+            self.snapshots += 1
+        elif kind == TelemetryServer.DELTA:
+            baseTick: int = TelemetryServer.BASE_TICK.unpack_from(payload, offset)[0]
+            offset += TelemetryServer.BASE_TICK.size
+            if baseTick != self.tick:
+                self.ignored += 1
+                return False
+
+            count = TelemetryServer.COUNT.unpack_from(payload, offset)[0]
+            offset += TelemetryServer.COUNT.size
+            for (key,) in TelemetryServer.COUNT.iter_unpack(payload[offset:offset + count * TelemetryServer.COUNT.size]):
+                del self.sprites[key]
+            offset += count * TelemetryServer.COUNT.size
+
+            count = TelemetryServer.COUNT.unpack_from(payload, offset)[0]
+            offset += TelemetryServer.COUNT.size
+            for key, *sprite in TelemetryServer.SPRITE_RECORD.iter_unpack(payload[offset:offset + count * TelemetryServer.SPRITE_RECORD.size]):
+                self.sprites[key] = [*sprite]
+            offset += count * TelemetryServer.SPRITE_RECORD.size
+
+            count = TelemetryServer.COUNT.unpack_from(payload, offset)[0]
+            offset += TelemetryServer.COUNT.size
+            for key, dx, dy in TelemetryServer.MOVE_RECORD.iter_unpack(payload[offset:offset + count * TelemetryServer.MOVE_RECORD.size]):
+                sprite: List[int] = self.sprites[key]
+                sprite[2] += dx
+                sprite[3] += dy
+            self.deltas += 1
+        else:
+            raise ValueError(f"unknown telemetry message type {kind}")
+
+        self.tick = game[0]
+        self.game = game
+        return True
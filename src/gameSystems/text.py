@@ -0,0 +1,259 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+class GlyphAtlas:
+    """
+    GlyphAtlas rasterizes a fixed character set once into a single surface and composes strings
+    made of those characters (scores, lives, ...) by blitting sub-rects of it.
+
+    Attributes:
+        surface (pygame.surface.Surface): The rasterized character set.
+        glyphs (Dict[str, pygame.Rect]): Sub-rect of every character inside the atlas surface.
+        advances (Dict[str, int]): Horizontal pen advance of every character.
+        height (int): Height of the atlas surface.
+
+    Methods:
+        supports: Checks whether a string can be composed from the atlas.
+        size: Returns the size a composed string would have.
+        blit: Composes a string onto a surface.
+    """
+
+    DIGITS: str = "0123456789-"
+
+    def __init__(self, font: "pygame.font.Font", color, charset: str = DIGITS) -> None:
+        """
+        Initializes a GlyphAtlas instance.
+
+        Args:
+            font (pygame.font.Font): The font used to rasterize the characters.
+            color: The text color.
+            charset (str, optional): Characters stored in the atlas. Defaults to the digits and the minus sign.
+        """
+        glyphSurfaces = [font.render(char, False, color) for char in charset]
+        self.height: int = max(glyph.get_height() for glyph in glyphSurfaces)
+        self.glyphs: Dict[str, "pygame.Rect"] = {}
+        self.advances: Dict[str, int] = {}
+
+        # Every glyph is rendered on its own (bold overhang included) and packed side by side on a
+        # transparent surface, per-pixel alpha keeps text of any color (black included) visible
+        self.surface: "pygame.surface.Surface" = pygame.Surface(
+            (sum(glyph.get_width() for glyph in glyphSurfaces), self.height), pygame.SRCALPHA
+        )
+
+        x: int = 0
+        for index, char in enumerate(charset):
+            self.glyphs[char] = self.surface.blit(glyphSurfaces[index], (x, 0))
+            # Pen advance comes from the font's own layout, so composed text lines up with a normal render
+            self.advances[char] = font.size(charset[:index + 1])[0] - (font.size(charset[:index])[0] if index else 0)
+            x += glyphSurfaces[index].get_width()
+
+    def supports(self, text: str) -> bool:
+        """
+        Checks whether a string can be composed from the atlas.
+
+        Args:
+            text (str): The string to check.
+
+        Returns:
+            bool: True if every character of the string is stored in the atlas.
+        """
+        return all(char in self.glyphs for char in text)
+
+    def size(self, text: str) -> Tuple[int, int]:
+        """
+        Returns the size a composed string would have.
+
+        Args:
+            text (str): The string to measure.
+
+        Returns:
+            Tuple[int, int]: Width and height in pixels.
+        """
+        return sum(self.advances[char] for char in text), self.height
+
+    def blit(self, surface: "pygame.surface.Surface", text: str, pos: Tuple[int, int]) -> "pygame.Rect":
+        """
+        Composes a string onto a surface.
+
+        Args:
+            surface (pygame.surface.Surface): The destination surface.
+            text (str): The string to draw, every character must be stored in the atlas.
+            pos (Tuple[int, int]): Top left position of the string.
+
+        Returns:
+            pygame.Rect: The area that was drawn.
+        """
+        x, y = int(pos[0]), int(pos[1])
+        drawnRect: "pygame.Rect" = pygame.Rect(x, y, 0, self.height)
+
+        for char in text:
+            drawnRect.union_ip(surface.blit(self.surface, (x, y), self.glyphs[char]))
+            x += self.advances[char]
+
+        return drawnRect
+
+class TextRenderer:
+    """
+    TextRenderer is the text rendering layer used by the HUD and the menus. It keeps an LRU cache
+    of rendered strings, a set of pre-baked surfaces for static text and one glyph atlas per
+    (font, color) for numbers that change every frame.
+
+    Attributes:
+        maxEntries (int): Maximum number of strings kept in the LRU cache.
+        cache (OrderedDict): Rendered strings keyed by (font, text, color), least recently used first.
+        baked (Dict[Hashable, pygame.surface.Surface]): Pre-baked static text surfaces, never evicted.
+        atlases (Dict[Tuple, GlyphAtlas]): Glyph atlases keyed by (font, color).
+        hits (int): Number of renders served from the LRU cache.
+        misses (int): Number of strings that had to be rasterized.
+
+    Methods:
+        render: Returns a rendered string, rasterizing it only on a cache miss.
+        bake: Pre-renders a static string under a name.
+        blit_baked: Draws a pre-baked surface.
+        atlas: Returns the glyph atlas for a font and color.
+        blit_text: Draws a string, composing the numeric part from the glyph atlas.
+        stats: Returns the cache counters.
+    """
+
+    def __init__(self, maxEntries: int = 128) -> None:
+        """
+        Initializes a TextRenderer instance.
+
+        Args:
+            maxEntries (int, optional): Maximum number of strings kept in the LRU cache. Defaults to 128.
+        """
+        self.maxEntries: int = maxEntries
+        self.cache: "OrderedDict[Tuple, pygame.surface.Surface]" = OrderedDict()
+        self.baked: Dict[Hashable, "pygame.surface.Surface"] = {}
+        self.atlases: Dict[Tuple, GlyphAtlas] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def render(self, font: "pygame.font.Font", text: str, color) -> "pygame.surface.Surface":
+        """
+        Returns a rendered string, rasterizing it only on a cache miss.
+
+        Args:
+            font (pygame.font.Font): The font to render with.
+            text (str): The string to render.
+            color: The text color.
+
+        Returns:
+            pygame.surface.Surface: The rendered string, shared with other callers.
+        """
+        key: Tuple = (font, text, color)
+        surface: Optional["pygame.surface.Surface"] = self.cache.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.cache[key] = font.render(text, False, color)
+        if len(self.cache) > self.maxEntries:
+            self.cache.popitem(last=False)
+        return surface
+
+    def bake(self, name: Hashable, font: "pygame.font.Font", text: str, color) -> "pygame.surface.Surface":
+        """
+        Pre-renders a static string under a name.
+
+        Args:
+            name (Hashable): Name used to draw the surface later on.
+            font (pygame.font.Font): The font to render with.
+            text (str): The string to render.
+            color: The text color.
+
+        Returns:
+            pygame.surface.Surface: The baked surface.
+        """
+        self.baked[name] = font.render(text, False, color)
+        return self.baked[name]
+
+    def blit_baked(self, surface: "pygame.surface.Surface", name: Hashable, pos) -> "pygame.Rect":
+        """
+        Draws a pre-baked surface.
+
+        Args:
+            surface (pygame.surface.Surface): The destination surface.
+            name (Hashable): Name the surface was baked under.
+            pos: Destination position (or rect) of the text.
+
+        Returns:
+            pygame.Rect: The area that was drawn.
+        """
+        return surface.blit(self.baked[name], pos)
+
+    def atlas(self, font: "pygame.font.Font", color) -> GlyphAtlas:
+        """
+        Returns the glyph atlas for a font and color, building it on first use.
+
+        Args:
+            font (pygame.font.Font): The font of the atlas.
+            color: The text color of the atlas.
+
+        Returns:
+            GlyphAtlas: The digit glyph atlas.
+        """
+        key: Tuple = (font, color)
+        atlas: Optional[GlyphAtlas] = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(font, color)
+        return atlas
+
+    def blit_text(self, surface: "pygame.surface.Surface", font: "pygame.font.Font", prefix: str, value, color, pos) -> "pygame.Rect":
+        """
+        Draws a static prefix followed by a changing value. The prefix goes through the LRU cache and
+        the value is composed from the glyph atlas when it only contains digits, so a new score never
+        has to be rasterized.
+
+        Args:
+            surface (pygame.surface.Surface): The destination surface.
+            font (pygame.font.Font): The font to render with.
+            prefix (str): The static part of the text, e.g. "P: ".
+            value: The changing part of the text.
+            color: The text color.
+            pos: Destination position (or rect) of the text.
+
+        Returns:
+            pygame.Rect: The area that was drawn.
+        """
+        drawnRect: "pygame.Rect" = surface.blit(self.render(font, prefix, color), pos)
+        text: str = str(value)
+        atlas: GlyphAtlas = self.atlas(font, color)
+
+        pen: Tuple[int, int] = (drawnRect.left + font.size(prefix)[0], drawnRect.top)
+
+        if atlas.supports(text):
+            drawnRect.union_ip(atlas.blit(surface, text, pen))
+        else:
+            drawnRect.union_ip(surface.blit(self.render(font, text, color), pen))
+        return drawnRect
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters.
+
+        Returns:
+            Dict[str, int]: LRU entries, hits, misses, baked surfaces and glyph atlases.
+        """
+        return {
+            "entries": len(self.cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "baked": len(self.baked),
+            "atlases": len(self.atlases)
+        }
+
+    def report(self) -> str:
+        """
+        Returns a one line summary of the cache counters.
+
+        Returns:
+            str: The formatted summary.
+        """
+        stats: Dict[str, int] = self.stats()
+        return (f"TextRenderer: {stats['entries']} entries, {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['baked']} baked, {stats['atlases']} atlases")
@@ -0,0 +1,136 @@
+import os
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from utility import *  # Importing utility functions and constants
+from gameSystems import AnalyticsStore, LevelTable  # Importing the analytics store and the level table
+from benchmark import percentiles
+
+def populate(store: AnalyticsStore, sessions: int, framesPerSession: int, seed: int) -> List[int]:
+    """
+    Fills the store with synthetic sessions, to measure the queries on a large database.
+
+    Args:
+        store (AnalyticsStore): The store.
+        sessions (int): Number of sessions.
+        framesPerSession (int): Mean number of frames per session.
+        seed (int): Seed of the generator.
+
+    Returns:
+        List[int]: Identifiers of the sessions.
+    """
+    rng: random.Random = random.Random(seed)
+    levels: LevelTable = LevelTable.load(filePaths["levels"])
+    fruits: List[Path] = sorted(file for file in Path(folderPaths["fruit"]).iterdir() if file.is_file())
+    bugs: List[Path] = sorted(file for file in Path(folderPaths["bug"]).iterdir() if file.is_file())
+
+    identifiers: List[int] = []
+    for _ in range(sessions):
+        identifiers.append(store.begin_session(rng.getrandbits(63), 0, 1))
+        frames: int = rng.randint(framesPerSession // 2, framesPerSession * 3 // 2)
+        ticksPerFrame: int = simulationHz // 60
+        point: int = 0
+        lvl: int = 1
+        for frame in range(frames):
+            tick: int = frame * ticksPerFrame
+            store.frame(rng.gauss(1 / 60, .002))
+            if rng.random() < .05:
+                fruit: str = str(rng.choice(fruits))
+                value: int = asset_value(fruit, 10)
+                point += value
+                store.fruit_caught(fruit, value, tick)
+                if levels.level_for(point) != lvl:
+                    lvl = levels.level_for(point)
+                    store.level_up(lvl, tick)
+            if rng.random() < .02:
+                bug: str = str(rng.choice(bugs))
+                store.bug_hit(bug, asset_value(bug, 11), tick)
+        store.end_session(point, frames * ticksPerFrame, True)
+    store.flush()
+    return identifiers
+
+def time_queries(store: AnalyticsStore, sessions: List[int], rounds: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measures the latency of the store queries.
+
+    Args:
+        store (AnalyticsStore): The store.
+        sessions (List[int]): Sessions the per session queries pick from.
+        rounds (int): Number of runs per query.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Latency percentiles per query, in milliseconds.
+    """
+    rng: random.Random = random.Random(0)
+    queries: Dict[str, Callable[[], Any]] = {
+        "leaderboard": lambda: store.leaderboard(10),
+        "levelStats": store.level_stats,
+        "assetStats": store.asset_stats,
+        "sessionLevels": lambda: store.session_levels(rng.choice(sessions)),
+        "frameStats": lambda: store.frame_stats(rng.choice(sessions))
+    }
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, query in queries.items():
+        samples: List[float] = []
+        for _ in range(rounds):
+            start: float = time.perf_counter()
+            query()
+            samples.append(time.perf_counter() - start)
+        results[name] = percentiles(samples)
+    return results
+
+def main() -> None:
+    """
+    Prints the leaderboard and the per level and per asset figures of the analytics database,
+    optionally after filling it with synthetic sessions and measuring the queries.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Session analytics")
+    parser.add_argument("database", nargs="?", default=filePaths["analytics"], help="analytics database")
+    parser.add_argument("--populate", type=int, default=0, help="add this many synthetic sessions first")
+    parser.add_argument("--frames", type=int, default=1000, help="mean frames per synthetic session")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the synthetic sessions")
+    parser.add_argument("--rounds", type=int, default=50, help="runs per query when measuring")
+    parser.add_argument("--out", help="output JSON file for the query latencies")
+    args: argparse.Namespace = parser.parse_args()
+
+    if not args.populate and not os.path.exists(args.database):
+        parser.error(f"{args.database} does not exist, play with analyticsEnabled = True or use --populate")
+
+    store: AnalyticsStore = AnalyticsStore(args.database)
+    try:
+        if args.populate:
+            start: float = time.perf_counter()
+            sessions: List[int] = populate(store, args.populate, args.frames, args.seed)
+            print(f"{store.recorded} rows recorded in {time.perf_counter() - start:.1f} s, {store.report()}")
+
+        print("Leaderboard:")
+        for rank, entry in enumerate(store.leaderboard(10), 1):
+            print(f"  {rank:2d}. session {entry['session']}: {entry['score']} points, level {entry['level']}, "
+                  f"{entry['ticks'] / simulationHz:.0f} s")
+        print("Levels:")
+        for entry in store.level_stats():
+            print(f"  {entry['level']}: {entry['visits']} visits, {entry['meanTicks'] / simulationHz:.1f} s mean, "
+                  f"{entry['caught']} caught, {entry['hits']} hits, {entry['damage']} damage")
+        print("Assets:")
+        for entry in store.asset_stats():
+            print(f"  {'fruit' if entry['kind'] == AnalyticsStore.FRUIT else 'bug'} {os.path.basename(entry['asset'])}: "
+                  f"{entry['count']} times, {entry['value']} {'points' if entry['kind'] == AnalyticsStore.FRUIT else 'damage'}")
+
+        if args.populate:
+            latencies: Dict[str, Dict[str, float]] = time_queries(store, sessions, args.rounds)
+            for name, stats in latencies.items():
+                print(f"{name}: p50 {stats['p50']:.3f} ms, p99 {stats['p99']:.3f} ms")
+            if args.out:
+                with open(args.out, "w") as file:
+                    json.dump(latencies, file, indent=2, sort_keys=True)
+    finally:
+        store.close()
+
+if __name__ == "__main__":
+    # Print the session analytics
+    main()
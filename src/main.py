@@ -1,12 +1,23 @@
+import os
 import sys
 import time
 import pygame
 import random
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple
 
 from utility import *  # Importing utility functions and constants
 from gameObjects import StaticBackgroundImageBaseClass, Fruit, Bug, Busket  # Importing game object classes
+# Importing the game systems
+from gameSystems import (
+    LevelTable, LevelConfig,  # Level table
+    Replay, ReplayRecorder, FrameCapture, TelemetryServer, TelemetryFrame, AnalyticsStore,  # Replays, frame capture, telemetry and analytics
+    Snapshot, SpriteState, Autosaver,  # Snapshots and autosave
+    surfaceCache, rotationCache, TextureAtlas, AssetLoader,  # Shared caches and asset loading
+    MusicPlayer, SoundEffectManager, resident_memory,  # Music player, sound effects and memory probe
+    FrameRenderer, TextRenderer, EventInput, restrict_events, FrameScheduler, FrameProfiler,  # Renderers, input, frame scheduler and profiler
+    SpritePool, ArrayPhysics, RowBandCollider,  # Pools, physics and collider
+)
 
 class Game:
     """
@@ -21,14 +32,22 @@ class Game:
         "PauseState",
         "GameOver"
     )
+    EVENTS: Tuple[int, ...] = (pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED)  # The only event types let into the queue
 
-    def __init__(self, windowConfig: Tuple[int, int]) -> None:
+    def __init__(self, windowConfig: Tuple[int, int], headless: bool = False, inputSource=None, seed: Optional[int] = None) -> None:
         """
         Initializes the game.
         
         Args:
             windowConfig: A tuple containing the window width and height.
+            headless: Run on SDL's dummy video and audio drivers, without a window or an audio device.
+            inputSource: Object whose get() returns the events of a frame and direction() the held movement direction. Defaults to the keyboard.
+            seed: Seed of the game's random number generator. Defaults to a random seed.
         """
+        startTime: float = time.perf_counter()
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
 
         self.windowConfig: Tuple[int, int] = windowConfig
@@ -37,29 +56,57 @@ class Game:
         # Initial game state
         self.state: str = Game.STATE[1]  # Start with MenuState
         self.active: bool = False  # Game active flag
-        self.clock: pygame.time.Clock = pygame.time.Clock()  # Pygame clock object
         self.maxFPS: int = 60  # Maximum frames per second
-
-        # Player score and level
+        self.scheduler: FrameScheduler = FrameScheduler(self.maxFPS, Game.STATE[1:], idleTimeout)  # Frame pacing, static screens are only redrawn when they change
+        self.simStep: float = 1 / simulationHz  # Fixed simulation time step
+        self.accumulator: float = 0.0  # Frame time not yet consumed by the simulation
+        self.inputSource = inputSource if inputSource else EventInput()  # Source of the frame events
+        self.profiler: FrameProfiler = FrameProfiler(enabled=profilerEnabled)  # Per-phase frame profiler
+        self.showOverlay: bool = False  # Performance overlay flag
+        self.overlayRect: Optional[pygame.Rect] = None
+
+        # Every random roll of a session comes from this generator, so a seed and the inputs reproduce the session
+        self.seed: int = seed if seed is not None else random.getrandbits(64)
+        self.rng: random.Random = random.Random(self.seed)
+        self.tick: int = 0  # Number of simulation steps run so far
+        self.recorder: Optional[ReplayRecorder] = None
+        if recordReplay:
+            self.recorder = ReplayRecorder(self.inputSource, Replay(self.seed, simulationHz), lambda: self.tick)
+            self.inputSource = self.recorder
+
+        # Player score and level, the level only changes with the score
+        self.levels: LevelTable = LevelTable.load(filePaths["levels"])
         self.point: int = 0
-        self.lvl: int = self.__set_level()
+        self.lvl: int = self.levels.level_for(self.point)
 
-        # Configure window and initialize fonts and game objects
+        # Configure window and initialize fonts and game objects, the rest of the assets load in the background
         self.__config_window()
-        self.__config_mp3()
-        self.__setup_font()
+        self.loader: AssetLoader = AssetLoader(loaderWorkers, startTime)
+        self.loader.mark("window")
+        rotationCache.configure(rotationSteps, rotationCacheBudget)
         self.__load_fruit_assets()
         self.__load_bug_assets()
+        self.loader.submit("sprites", self.__load_sprites)
+        self.__config_mp3()
+        self.__setup_font()
         self.__setup_game_objects()
+        self.__setup_save(headless)
+        self.__setup_telemetry()
+        # Headless games never touch the analytics database either
+        self.analytics: Optional[AnalyticsStore] = AnalyticsStore(filePaths["analytics"]) if analyticsEnabled and not headless else None
+        self.loader.mark("menu ready")
 
     def __config_mp3(self) -> None:
-        """Configures the game's audio."""
-        self.bgMusic: pygame.mixer.Sound = pygame.mixer.Sound(filePaths["bgMusic"])
-        self.menuMusic: pygame.mixer.Sound = pygame.mixer.Sound(filePaths["menuMusic"])
-        self.fruitCollisionSE: pygame.mixer.Sound = pygame.mixer.Sound(filePaths["fruitCollision"])
-        self.bugCollisionSE: pygame.mixer.Sound = pygame.mixer.Sound(filePaths["bugCollision"])
-        self.lvlUpSE: pygame.mixer.Sound = pygame.mixer.Sound(filePaths["lvlUp"])
-        self.activeMusic: pygame.mixer.Sound = self.menuMusic
+        """
+        Configures the game's audio. The music tracks are streamed from disk, the short sound effects are
+        decoded on the loader and stay resident.
+        """
+        self.music: MusicPlayer = MusicPlayer(
+            {name: filePaths[name] for name in ("menuMusic", "bgMusic")}, musicFadeTime
+        )
+        self.sounds: SoundEffectManager = SoundEffectManager(soundChannels)
+        for name in soundEffects:
+            self.loader.submit(name, pygame.mixer.Sound, filePaths[name])
 
     def __config_window(self) -> None:
         """
@@ -68,7 +115,13 @@ class Game:
         self.window: pygame.display = pygame.display
         self.window.set_mode(self.windowConfig)
         self.window.set_caption(Game.NAME)
+        restrict_events(Game.EVENTS)
         self.mainSurface: pygame.Surface = self.window.get_surface()
+        self.renderer: FrameRenderer = FrameRenderer(self.window, self.mainSurface, dirtyRectRendering)
+        self.frameCapture: Optional[FrameCapture] = None
+        if recordFrames:
+            self.frameCapture = FrameCapture(folderPaths["capture"], self.mainSurface, captureFormat, captureBuffers,
+                                             captureDropPolicy, self.maxFPS)
 
     def __setup_font(self) -> None:
         """
@@ -78,165 +131,441 @@ class Game:
         self.font.bold: bool = True
         self.menuFont: pygame.font.Font = pygame.font.Font(filePaths["font"], fontSize - 10)
         self.menuFont.bold: bool = False
+        self.overlayFont: pygame.font.Font = pygame.font.Font(filePaths["font"], fontSize - 26)
+
+        # Static text is baked once, changing numbers are composed from cached digit glyphs
+        self.textRenderer: TextRenderer = TextRenderer()
+        self.textRenderer.bake("rule", self.font, "_" * int((self.windowWidth / 15)), "white")
+        self.textRenderer.bake("play", self.menuFont, "Press Enter To Play !", "white")
+        self.textRenderer.bake("pause", self.menuFont, "PAUSE", "white")
+        self.textRenderer.bake("gameOver", self.menuFont, "GAME OVER :(", "white")
+        self.textRenderer.bake("pauseHint", self.menuFont, "Use Space key To Pause", "white")
+        self.textRenderer.bake("moveHint", self.menuFont, "Use Left and Right key to move.", "white")
+
+    @staticmethod
+    def sprite_atlas_entries() -> List[Tuple[str, float]]:
+        """
+        Returns the (path, scale) of every sprite image packed into the texture atlas.
+
+        Returns:
+            List[Tuple[str, float]]: Fruit, bug and player images at their game scale.
+        """
+        entries: List[Tuple[str, float]] = []
+        for kind in ("fruit", "bug"):
+            entries.extend(
+                (str(file), spriteScales[kind]) for file in sorted(Path(folderPaths[kind]).iterdir()) if file.is_file()
+            )
+        entries.append((filePaths["player"], spriteScales["player"]))
+        return entries
+
+    def __load_sprite_atlas(self) -> None:
+        """
+        Loads the sprite atlas (rebuilding it first if a source image changed) into the surface cache.
+        The individual PNGs are used if the atlas cannot be written or read.
+        """
+        if not useTextureAtlas:
+            return
+
+        try:
+            surfaceCache.add_atlas(
+                TextureAtlas.ensure(Game.sprite_atlas_entries(), filePaths["atlasImage"], filePaths["atlasIndex"])
+            )
+        except (OSError, ValueError, KeyError, pygame.error) as error:
+            print(f"Texture atlas unavailable, loading the sprite images one by one ({error})", file=sys.stderr)
+
+    def __load_sprites(self) -> None:
+        """
+        Loads the sprite images and pre-renders their rotation frames (runs on the asset loader).
+        """
+        self.__load_sprite_atlas()
+        surfaceCache.preload(self.fruitsAssets, spriteScales["fruit"])
+        surfaceCache.preload(self.bugAssets, spriteScales["bug"])
+        surfaceCache.preload((filePaths["player"],), spriteScales["player"])
+        rotationCache.preload(surfaceCache.get(asset, spriteScales["fruit"]) for asset in self.fruitsAssets)
+        rotationCache.preload(surfaceCache.get(asset, spriteScales["bug"]) for asset in self.bugAssets)
+
+    def wait_for_assets(self) -> None:
+        """
+        Blocks until the gameplay assets are loaded, then creates the objects that need them.
+        Returns immediately once the assets are ready.
+        """
+        if self.assetsReady:
+            return
+
+        self.loader.wait()
+        self.loader.result("sprites")
+        for name, settings in soundEffects.items():
+            self.sounds.register(name, self.loader.result(name), settings["maxVoices"], settings["priority"])
+        self.player = Busket(filePaths["player"], 100, self.windowHeight - 150, [-100, self.windowWidth],
+                             scaleFactor=spriteScales["player"])
+        self.assetsReady = True
+        self.loader.mark("gameplay ready")
+
+        # A session saved on exit is resumed once the sprites can be rebuilt
+        if self.pendingSnapshot is not None:
+            self.restore(self.pendingSnapshot)
+            self.pendingSnapshot = None
 
     def __load_fruit_assets(self) -> None:
         """
         Loads fruit assets.
         """
         fruitAssetsFolderObj: Path = Path(folderPaths["fruit"])
-        self.fruitsAssets: List[str] = [str(file) for file in fruitAssetsFolderObj.iterdir() if file.is_file()]
-        self.fruitPoint: Dict[str, int] = {key: int(key.split("//")[-1].split(".")[0][-1]) + 10 for key in
-                                           self.fruitsAssets}
+        self.fruitsAssets: List[str] = sorted(str(file) for file in fruitAssetsFolderObj.iterdir() if file.is_file())
+        self.fruitPoint: Dict[str, int] = {key: asset_value(key, 10) for key in self.fruitsAssets}
+        self.fruitIndex: Dict[str, int] = {key: index for index, key in enumerate(self.fruitsAssets)}
 
     def __load_bug_assets(self) -> None:
         """
         Loads bug assets.
         """
         bugAssetsFolderObj: Path = Path(folderPaths["bug"])
-        self.bugAssets: List[str] = [str(file) for file in bugAssetsFolderObj.iterdir() if file.is_file()]
-        self.bugDamage: Dict[str, int] = {key: int(key.split("//")[-1].split(".")[0][-1]) + 11 for key in
-                                          self.bugAssets}
+        self.bugAssets: List[str] = sorted(str(file) for file in bugAssetsFolderObj.iterdir() if file.is_file())
+        self.bugDamage: Dict[str, int] = {key: asset_value(key, 11) for key in self.bugAssets}
+        self.bugIndex: Dict[str, int] = {key: index for index, key in enumerate(self.bugAssets)}
 
     def __setup_game_objects(self) -> None:
         """
         Sets up game objects.
         """
         self.backGround: StaticBackgroundImageBaseClass = StaticBackgroundImageBaseClass(filePaths["bg"], (0, 0))
-        self.fruitGroup: pygame.sprite.Group = pygame.sprite.Group()
-        self.bugGroup: pygame.sprite.Group = pygame.sprite.Group()
-        self.player: Busket = Busket(filePaths["player"], 100, self.windowHeight - 150, [-100, self.windowWidth],
-                                     scaleFactor=0.25)
+        self.fruitGroup: pygame.sprite.RenderUpdates = pygame.sprite.RenderUpdates()
+        self.bugGroup: pygame.sprite.RenderUpdates = pygame.sprite.RenderUpdates()
+        self.fruitPool: SpritePool = SpritePool(Fruit, spritePoolSize)
+        self.bugPool: SpritePool = SpritePool(Bug, spritePoolSize)
+        self.collider: RowBandCollider = RowBandCollider()
+        self.physics: Optional[ArrayPhysics] = ArrayPhysics(self.windowConfig) if physicsBackend == "numpy" else None
+        self.player: Optional[Busket] = None  # Created by wait_for_assets once the sprites are loaded
+        self.assetsReady: bool = False
+        self.hudValues: Optional[Tuple[int, int, int]] = None
+        self.hudRect: Optional[pygame.Rect] = None
+
+    def __setup_save(self, headless: bool) -> None:
+        """
+        Starts the autosaver and reads the save file: the best score is restored at once, a session
+        saved while playing is resumed when the gameplay assets are ready. Headless games never touch the save file.
+
+        Args:
+            headless: Flag indicating if the game runs without a window.
+        """
+        self.autosaver: Optional[Autosaver] = None
+        self.pendingSnapshot: Optional[Snapshot] = None
+        self.lastAutosaveTick: int = 0
+        if headless:
+            return
+
+        self.autosaver = Autosaver(filePaths["save"])
+        try:
+            snapshot: Snapshot = Snapshot.load(filePaths["save"])
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as error:
+            print(f"Ignoring save file {filePaths['save']}: {error}", file=sys.stderr)
+            return
+
+        Game.MAXSCORE = max(Game.MAXSCORE, snapshot.maxScore)
+        # A replay starts from its seed at tick 0, it cannot reproduce a session resumed from a snapshot
+        if resumeSession and not recordReplay and Game.STATE[snapshot.state] in (Game.STATE[0], Game.STATE[2]):
+            self.pendingSnapshot = snapshot
+
+    def __setup_telemetry(self) -> None:
+        """
+        Starts the spectator telemetry server when it is enabled. A port that is already taken only disables it.
+        """
+        self.telemetry: Optional[TelemetryServer] = None
+        if not telemetryServer:
+            return
+
+        server: TelemetryServer = TelemetryServer(port=telemetryPort)
+        try:
+            server.start()
+        except OSError as error:
+            print(f"Telemetry disabled: {error}", file=sys.stderr)
+            return
+        self.telemetry = server
 
-    def __set_level(self) -> int:
+    def __publish_telemetry(self) -> None:
+        """
+        Hands the current state over to the telemetry server. Nothing is captured while no spectator is connected.
         """
-        Determines the game level based on the player's score.
+        if self.telemetry is None or not self.telemetry.subscribers:
+            return
+
+        sprites: List[Tuple[int, int, int, int, int]] = [
+            (id(fruit), 0, self.fruitIndex[fruit.imagesSrc[0]], fruit.rect.centerx, fruit.rect.centery) for fruit in self.fruitGroup
+        ]
+        sprites.extend(
+            (id(bug), 1, self.bugIndex[bug.imagesSrc[0]], bug.rect.centerx, bug.rect.centery) for bug in self.bugGroup
+        )
+        self.telemetry.publish(TelemetryFrame(
+            self.tick, time.time_ns() // 1000, Game.STATE.index(self.state), self.point, self.lvl, self.player.live,
+            round(self.player.posX), sprites
+        ))
+
+    def snapshot(self) -> Snapshot:
+        """
+        Captures the full state of the session.
 
         Returns:
-            The game level.
+            Snapshot: The snapshot.
         """
-        if self.point in range(0, 201):
-            return 1
-        if self.point in range(201, 601):
-            return 2
-        if self.point in range(401, 1001):
-            return 3
-        if self.point in range(1001, 1801):
-            return 4
+        if self.physics is not None:
+            self.physics.sync_sprites()
+
+        sprites: List[SpriteState] = [
+            SpriteState(0, self.fruitIndex[fruit.imagesSrc[0]], fruit.point, *fruit.motion_state()) for fruit in self.fruitGroup
+        ]
+        sprites.extend(
+            SpriteState(1, self.bugIndex[bug.imagesSrc[0]], bug.damage, *bug.motion_state()) for bug in self.bugGroup
+        )
+        return Snapshot(
+            self.tick, self.seed, Game.STATE.index(self.state), self.point, self.lvl, self.player.live,
+            max(Game.MAXSCORE, self.point), self.player.posX, self.accumulator, self.rng.getstate(), sprites
+        )
 
-        return 5
+    def restore(self, snapshot: Snapshot) -> None:
+        """
+        Replaces the session by a snapshot.
+
+        Args:
+            snapshot: The snapshot.
+        """
+        self.wait_for_assets()
+        for sprite in [*self.fruitGroup, *self.bugGroup]:
+            sprite.kill()
+
+        self.tick = snapshot.tick
+        self.seed = snapshot.seed
+        self.rng.setstate(snapshot.rngState)
+        self.state = Game.STATE[snapshot.state]
+        self.point = snapshot.point
+        self.lvl = snapshot.lvl
+        self.player.live = snapshot.live
+        self.player.move(snapshot.basketX - self.player.posX)
+        self.accumulator = snapshot.accumulator
+        Game.MAXSCORE = max(Game.MAXSCORE, snapshot.maxScore)
+
+        # The sprites are spawned with a throwaway generator, their saved state then overwrites the random rolls
+        spawnRng: random.Random = random.Random(0)
+        for state in snapshot.sprites:
+            if state.kind == 0:
+                sprite = self.fruitPool.acquire(
+                    (self.fruitsAssets[state.image],), self.fruitGroup, self.windowConfig,
+                    True, spriteScales["fruit"], animateDrops, state.value, state.gravity, None, spawnRng
+                )
+            else:
+                sprite = self.bugPool.acquire(
+                    (self.bugAssets[state.image],), self.bugGroup, self.windowConfig,
+                    True, spriteScales["bug"], animateDrops, state.value, state.gravity, None, spawnRng
+                )
+            sprite.restore_motion(*state[3:])
+            if self.physics is not None:
+                self.physics.attach(sprite, "fruit" if state.kind == 0 else "bug")
+
+        self.lastAutosaveTick = self.tick
+        self.renderer.request_full_redraw()
 
     def __game_logic(self, dt: float) -> None:
         """
-        Handles game logic.
+        Handles game logic for one fixed simulation step.
 
         Args:
-            dt: Time elapsed since the last frame.
+            dt: Length of the simulation step.
         """
+        level: LevelConfig = self.levels[self.lvl]
+
+        # The basket moves while a movement key is held, the keyboard is polled once per step
+        direction: int = self.inputSource.direction()
+        if direction:
+            self.player.move(direction * level.playerSpd * playerSpeedScale * dt)
+
         # Spawning fruits
-        if random.randint(0, 100) < 3 and len(self.fruitGroup) < levelWiseParameters[self.lvl]["fruitSpwanLimit"]:
-            selectedFruit: str = random.choice(self.fruitsAssets)
-            Fruit(
+        if self.rng.random() < spawnRates["fruit"] * dt and len(self.fruitGroup) < level.fruitSpwanLimit:
+            selectedFruit: str = self.rng.choice(self.fruitsAssets)
+            fruit: Fruit = self.fruitPool.acquire(
                 (selectedFruit,),
                 self.fruitGroup, self.windowConfig,
-                True, .9, False, self.fruitPoint[selectedFruit], levelWiseParameters[self.lvl]["fruitG"],
-                random.choice(
-                    (
-                        (30, 50),
-                        (100, 200),
-                        (250, 350),
-                        (180, 380)
-                    )
-                )
+                True, spriteScales["fruit"], animateDrops, self.fruitPoint[selectedFruit], level.fruitG,
+                self.rng.choice(spawnRanges["fruit"]),
+                self.rng
             )
+            if self.physics is not None:
+                self.physics.attach(fruit, "fruit")
 
         # Spawning bugs
-        if random.randint(0, 100) < 1 and len(self.bugGroup) < levelWiseParameters[self.lvl]["bugSpwanLimit"]:
-            selectedBug: str = random.choice(self.bugAssets)
-            Bug(
+        if self.rng.random() < spawnRates["bug"] * dt and len(self.bugGroup) < level.bugSpwanLimit:
+            selectedBug: str = self.rng.choice(self.bugAssets)
+            bug: Bug = self.bugPool.acquire(
                 (selectedBug,),
                 self.bugGroup, self.windowConfig,
-                True, .5, False, self.bugDamage[selectedBug], levelWiseParameters[self.lvl]["bugG"],
-                random.choice(
-                    (
-                        (50, 100),
-                        (120, 160),
-                        (200, 280)
-                    )
-                )
+                True, spriteScales["bug"], animateDrops, self.bugDamage[selectedBug], level.bugG,
+                self.rng.choice(spawnRanges["bug"]),
+                self.rng
             )
+            if self.physics is not None:
+                self.physics.attach(bug, "bug")
+
+        # Update fruits and bugs
+        if self.physics is None:
+            for fruit in self.fruitGroup:
+                fruit.update(dt)
+            for bug in self.bugGroup:
+                bug.update(dt)
+        else:
+            self.physics.step(dt)
+        self.profiler.mark("update")
+
+        # Collect every fruit and bug caught by the player in one broad phase query
+        fruitHits, bugHits = self.collider.collide((self.player.solidAreaRect,), (self.fruitGroup, self.bugGroup))[0]
+
+        # Handle fruit collisions
+        for fruit in fruitHits:
+            self.sounds.play("fruitCollision")
+            self.point += fruit.point
+            if self.analytics is not None:
+                self.analytics.fruit_caught(fruit.imagesSrc[0], fruit.point, self.tick)
+            fruit.kill()
+
+        # Handle bug collisions
+        for bug in bugHits:
+            self.sounds.play("bugCollision")
+            self.player.live -= bug.damage
+            if self.analytics is not None:
+                self.analytics.bug_hit(bug.imagesSrc[0], bug.damage, self.tick)
+            bug.kill()
+        self.profiler.mark("collision")
+
+        # The level follows the score, so it is only looked up again when a fruit was caught
+        if fruitHits:
+            lvl: int = self.levels.level_for(self.point)
+            if lvl != self.lvl:
+                self.lvl = lvl
+                self.sounds.play("lvlUp")
+                if self.analytics is not None:
+                    self.analytics.level_up(lvl, self.tick)
+
+        # Check for game over condition
+        if self.player.live <= 0:
+            self.state = Game.STATE[3]
+            if self.analytics is not None:
+                self.analytics.end_session(self.point, self.tick, True)
+
+    def __render_game(self, alpha: float) -> None:
+        """
+        Renders the game elements.
 
-        # Update fruits
-        for fruit in self.fruitGroup:
-            fruit.update(dt)
-            if self.player.collision_occurred(fruit):
-                self.fruitCollisionSE.play()
-                self.point += fruit.point
-                fruit.kill()
-
-        # Update bugs
-        for bug in self.bugGroup:
-            bug.update(dt)
-            if self.player.collision_occurred(bug):
-                self.bugCollisionSE.play()
-                self.player.live -= bug.damage
-                bug.kill()
+        Args:
+            alpha: Fraction of a simulation step elapsed since the last step, used to interpolate sprite positions.
+        """
+        if self.physics is None:
+            for sprite in self.fruitGroup:
+                sprite.interpolate(alpha)
+            for sprite in self.bugGroup:
+                sprite.interpolate(alpha)
+        else:
+            self.physics.interpolate(alpha)
 
         # Draw game elements on the screen
-        self.fruitGroup.draw(self.mainSurface)
-        self.bugGroup.draw(self.mainSurface)
+        self.renderer.mark(self.fruitGroup.draw(self.mainSurface))
+        self.renderer.mark(self.bugGroup.draw(self.mainSurface))
+        self.profiler.mark("sprites")
 
         # Display player score, lives, and level
-        self.mainSurface.blit(
-            self.font.render(f"P: {self.point}", False, "white"),
+        self.__draw_hud()
+        self.profiler.mark("text")
+
+        # Draw player object
+        self.renderer.mark((self.player.draw_on(self.mainSurface),))
+        self.profiler.mark("sprites")
+
+    def __draw_overlay(self) -> None:
+        """
+        Draws the performance overlay: FPS, frame-time percentiles, phase breakdown, sprite counts and audio channel use.
+        """
+        busyChannels: int = sum(
+            pygame.mixer.Channel(channel).get_busy() for channel in range(pygame.mixer.get_num_channels())
+        )
+        previousRect: Optional[pygame.Rect] = self.overlayRect
+        self.overlayRect = self.profiler.draw_overlay(self.mainSurface, self.overlayFont, {
+            "fruits": str(len(self.fruitGroup)),
+            "bugs": str(len(self.bugGroup)),
+            "pooled": f"{len(self.fruitPool.free)}/{len(self.bugPool.free)}",
+            "collide": f"{self.collider.candidates} cand {self.collider.hits} hits",
+            "channels": f"{busyChannels}/{pygame.mixer.get_num_channels()}",
+            "sfx": f"{self.sounds.dropped} dropped {self.sounds.stolen} stolen"
+        })
+        # The erased area of a wider previous overlay must be pushed too
+        self.renderer.mark((self.overlayRect.union(previousRect) if previousRect else self.overlayRect,))
+
+    def __draw_hud(self) -> None:
+        """
+        Draws the player score, lives and level and marks the HUD area dirty when one of them changed.
+        """
+        live: int = self.player.live if self.player.live > 0 else 0
+
+        hudRect: pygame.Rect = self.textRenderer.blit_text(
+            self.mainSurface, self.font, "P: ", self.point, "white",
             (5, 5, 20, 20)
         )
-        self.mainSurface.blit(
-            self.font.render(f"L: {self.player.live if self.player.live > 0 else 0}", False, "white"),
+        hudRect.union_ip(self.textRenderer.blit_text(
+            self.mainSurface, self.font, "L: ", live, "white",
             (self.windowWidth - 100, 5, 20, 20)
-        )
-        self.mainSurface.blit(
-            self.font.render(f"LVL: {self.lvl if self.lvl != 5 else ' MAX'}", False, "white"),
+        ))
+        hudRect.union_ip(self.mainSurface.blit(
+            self.textRenderer.render(self.font, f"LVL: {self.lvl if self.lvl != self.levels.maxLevel else ' MAX'}", "white"),
             (self.windowWidth / 2 - 50, 5, 20, 20)
-        )
-        self.mainSurface.blit(
-            self.font.render("_" * int((self.windowWidth / 15)), False, "white"),
+        ))
+        hudRect.union_ip(self.textRenderer.blit_baked(
+            self.mainSurface, "rule",
             (0, 12, self.windowWidth, 20)
-        )
+        ))
 
-        # Draw player object
-        self.player.draw_on(self.mainSurface)
+        hudValues: Tuple[int, int, int] = (self.point, live, self.lvl)
+        if hudValues != self.hudValues:
+            self.renderer.mark((hudRect.union(self.hudRect) if self.hudRect else hudRect,))
+            self.hudValues = hudValues
+        self.hudRect = hudRect
 
-        # Check for game over condition
-        if self.player.live <= 0:
-            self.state = Game.STATE[3]
+    def __erase_game_elements(self) -> None:
+        """
+        Erases the sprites, the player and the HUD drawn in the previous frame (dirty rectangle mode).
+        """
+        self.fruitGroup.clear(self.mainSurface, self.renderer.backdrop)
+        self.bugGroup.clear(self.mainSurface, self.renderer.backdrop)
+        self.renderer.erase(self.player.drawnRect)
+        self.renderer.erase(self.hudRect)
+        self.renderer.erase(self.overlayRect)
 
     def __render_menu(self) -> None:
         """
         Renders the game menu.
         """
         if self.state == Game.STATE[1]:
-            self.mainSurface.blit(self.menuFont.render("Press Enter To Play !", False, "white"),
-                                  (110, 220, self.windowWidth, 80))
-            self.mainSurface.blit(self.menuFont.render(f"MAX SCORE : {Game.MAXSCORE}", False, "white"),
-                                  (150, 260, self.windowWidth, 80))
+            self.textRenderer.blit_baked(self.mainSurface, "play", (110, 220, self.windowWidth, 80))
+            self.textRenderer.blit_text(self.mainSurface, self.menuFont, "MAX SCORE : ", Game.MAXSCORE, "white",
+                                        (150, 260, self.windowWidth, 80))
+            if not self.assetsReady:
+                loaded, total = self.loader.progress()
+                self.mainSurface.blit(
+                    self.textRenderer.render(self.menuFont, f"LOADING {loaded}/{total}", "white"),
+                    (175, 300, self.windowWidth, 80)
+                )
         elif self.state == Game.STATE[3]:
-            self.mainSurface.blit(
-                self.menuFont.render(f"YOUR SCORE: {self.point}", False, "white"),
+            self.textRenderer.blit_text(
+                self.mainSurface, self.menuFont, "YOUR SCORE: ", self.point, "white",
                 (self.windowWidth / 2 - 95, self.windowHeight / 2 - 10, 200, 200)
             )
-            self.mainSurface.blit(
-                self.menuFont.render("GAME OVER :(", False, "white"),
+            self.textRenderer.blit_baked(
+                self.mainSurface, "gameOver",
                 (self.windowWidth / 2 - 70, self.windowHeight / 2 - 40, 200, 200)
             )
             return
         else:
-            self.mainSurface.blit(self.menuFont.render("PAUSE", False, "white"), (200, 220, self.windowWidth, 80))
+            self.textRenderer.blit_baked(self.mainSurface, "pause", (200, 220, self.windowWidth, 80))
 
         # Render instructions
-        self.mainSurface.blit(self.menuFont.render(f"Use Space key To Pause", False, "white"),
-                              (100, 450, self.windowWidth, 80))
-        self.mainSurface.blit(self.menuFont.render("Use Left and Right key to move.", False, "white"),
-                              (60, 500, self.windowWidth, 80))
+        self.textRenderer.blit_baked(self.mainSurface, "pauseHint", (100, 450, self.windowWidth, 80))
+        self.textRenderer.blit_baked(self.mainSurface, "moveHint", (60, 500, self.windowWidth, 80))
 
     def __reset(self) -> None:
         """
@@ -245,7 +574,7 @@ class Game:
         Game.MAXSCORE = max(self.point, Game.MAXSCORE)
         self.point = 0
         self.player.live = 100
-        self.lvl = 1
+        self.lvl = self.levels.level_for(self.point)
         [fruit.kill() for fruit in self.fruitGroup]
         [bug.kill() for bug in self.bugGroup]
 
@@ -253,71 +582,147 @@ class Game:
         """
         Main game loop.
         """
-        self.activeMusic.play(-1)
-        lastTime: float = time.time()
+        self.music.play("menuMusic")
+        lastTime: float = time.perf_counter()
         while self.active:
-            dt: float = (time.time() - lastTime)
-            lastTime: float = time.time()
-            
-            prevLvl: int = self.lvl
-            self.lvl = self.__set_level()
-            if prevLvl != self.lvl:
-                self.lvlUpSE.play()
-
-            # Event handling loop
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.active = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_LEFT and self.state == Game.STATE[0]:
-                        self.player.move(-1 * 2 * levelWiseParameters[self.lvl]["playerSpd"])
-                    elif event.key == pygame.K_RIGHT and self.state == Game.STATE[0]:
-                        self.player.move(2 * levelWiseParameters[self.lvl]["playerSpd"])
-                    elif event.key == pygame.K_RETURN:
-                        if self.state == Game.STATE[1]:
-                            self.state = Game.STATE[0]
-                        elif self.state == Game.STATE[3]:
-                            self.__reset()
-                            self.state = Game.STATE[1]
-                    elif event.key == pygame.K_SPACE:
-                        if self.state == Game.STATE[0]:
-                            self.state = Game.STATE[2]
-                        elif self.state == Game.STATE[2]:
+            now: float = time.perf_counter()
+            self.step_frame(now - lastTime)
+            # Time slept on a static screen is not game time, the next frame starts where the sleep ended
+            lastTime = now + self.scheduler.wait(self.state)
+
+    def step_frame(self, frameTime: float, steps: Optional[int] = None) -> None:
+        """
+        Runs one frame: input handling, the fixed simulation steps covering the frame and rendering.
+
+        Args:
+            frameTime: Time elapsed since the previous frame.
+            steps: Run exactly this many simulation steps instead of the steps covered by frameTime (replay playback).
+        """
+        self.profiler.begin_frame()
+        self.sounds.begin_frame()
+
+        # Gameplay needs every asset, a game put straight into PlayState waits for them here
+        if self.state == Game.STATE[0] and not self.assetsReady:
+            self.wait_for_assets()
+
+        # Long frames are clamped so a stall does not turn into a burst of simulation steps
+        self.accumulator += min(frameTime, maxFrameTime)
+
+        prevState: str = self.state
+
+        # Event handling loop
+        events: Sequence["pygame.event.Event"] = self.inputSource.get()
+        if events:
+            self.scheduler.invalidate()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.active = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN:
+                    if self.state == Game.STATE[1]:
+                        # A resumed session keeps the state it was saved in, paused included
+                        resuming: bool = self.pendingSnapshot is not None
+                        self.wait_for_assets()
+                        if not resuming:
                             self.state = Game.STATE[0]
-                        elif self.state == Game.STATE[3]:
-                            self.__reset()
-                            self.state = Game.STATE[1]
-
-            # Clear the screen
-            self.mainSurface.fill("Black")
-
-            # Draw background
-            self.mainSurface.blit(
-                self.backGround.get_render_object(
-                    (self.windowHeight + 1) / self.backGround.image.get_height()
-                ),
-                self.backGround.get_render_object_pos()
-            )
+                    elif self.state == Game.STATE[3]:
+                        self.__reset()
+                        self.state = Game.STATE[1]
+                elif event.key == pygame.K_SPACE:
+                    if self.state == Game.STATE[0]:
+                        self.state = Game.STATE[2]
+                    elif self.state == Game.STATE[2]:
+                        self.state = Game.STATE[0]
+                    elif self.state == Game.STATE[3]:
+                        self.__reset()
+                        self.state = Game.STATE[1]
+                elif event.key == pygame.K_F3:
+                    self.showOverlay = not self.showOverlay
+                    self.profiler.enabled = self.showOverlay or profilerEnabled
+                    self.overlayRect = None
+                    self.renderer.request_full_redraw()
+                elif event.key == pygame.K_F4:
+                    self.profiler.dump_csv(filePaths["profileCsv"])
+        if self.state != prevState and self.assetsReady:
+            self.__publish_telemetry()
+        self.profiler.mark("events")
+
+        # Static screens are drawn once, then only when what they show changes (see FrameScheduler)
+        if self.state != Game.STATE[0]:
+            self.music.play("menuMusic")
+        view: Tuple = (self.point, Game.MAXSCORE, self.assetsReady or self.loader.progress())
+        if not self.scheduler.needs_redraw(self.state, view, self.showOverlay, self.music.fading() or not self.loader.done()):
+            self.accumulator = 0.0
+            self.music.update(frameTime)
+            self.profiler.end_frame()
+            return
 
-            # Update game logic or render menu depending on the game state
-            if self.state == Game.STATE[0]:
-                if self.activeMusic != self.bgMusic:
-                    self.activeMusic.stop()
-                    self.activeMusic = self.bgMusic
-                    self.activeMusic.play(-1)
-                    
-                self.__game_logic(dt)
-            else:
-                if self.activeMusic != self.menuMusic:
-                    self.activeMusic.stop()
-                    self.activeMusic = self.menuMusic
-                    self.activeMusic.play(-1)
-                    
-                self.__render_menu()
+        # Menus and state changes are always redrawn in full
+        if self.state != Game.STATE[0] or self.state != prevState:
+            self.renderer.request_full_redraw()
 
-            # Update the display
-            self.window.update()
-            self.clock.tick(self.maxFPS)
+        # Clear the screen and draw background, or only erase the previous frame in dirty rectangle mode
+        self.renderer.set_background(
+            self.backGround.get_render_object(
+                (self.windowHeight + 1) / self.backGround.image.get_height()
+            ),
+            self.backGround.get_render_object_pos()
+        )
+        if not self.renderer.begin_frame():
+            self.__erase_game_elements()
+        self.profiler.mark("background")
+
+        # Update game logic or render menu depending on the game state
+        if self.state == Game.STATE[0]:
+            self.music.play("bgMusic")
+            if self.analytics is not None:
+                if self.analytics.session is None:
+                    self.analytics.begin_session(self.seed, self.tick, self.lvl)
+                self.analytics.frame(frameTime)
+
+            # Run the simulation in fixed steps, then render in between the last two steps
+            if steps is not None:
+                # Replay playback runs an exact number of steps, independent of the frame time
+                self.accumulator = 0.0
+                for _ in range(steps):
+                    if self.state != Game.STATE[0]:
+                        break
+                    self.__game_logic(self.simStep)
+                    self.tick += 1
+                    self.__publish_telemetry()
+            while self.accumulator >= self.simStep and self.state == Game.STATE[0]:
+                self.__game_logic(self.simStep)
+                self.tick += 1
+                self.__publish_telemetry()
+                self.accumulator -= self.simStep
+            self.__render_game(self.accumulator / self.simStep)
+        else:
+            self.accumulator = 0.0
+
+            self.__render_menu()
+            self.profiler.mark("text")
+        self.music.update(frameTime)
+
+        if self.showOverlay:
+            self.__draw_overlay()
+            self.profiler.mark("text")
+
+        # Save the session every autosaveInterval seconds of play and whenever play stops (pause, game over)
+        if self.autosaver is not None and (
+            (prevState == Game.STATE[0] and self.state != prevState)
+            or (self.state == Game.STATE[0] and self.tick - self.lastAutosaveTick >= autosaveInterval * simulationHz)
+        ):
+            self.autosaver.submit(self.snapshot())
+            self.lastAutosaveTick = self.tick
+
+        # Update the display, a recording only copies the frame here and writes it on its own thread
+        self.renderer.present()
+        if self.frameCapture is not None:
+            self.frameCapture.capture(self.mainSurface, self.tick)
+        self.profiler.mark("present")
+        if not self.assetsReady:
+            self.loader.mark("first frame")
+        self.profiler.end_frame()
 
     def run(self) -> None:
         """
@@ -331,6 +736,46 @@ class Game:
         """
         Cleans up resources and quits pygame.
         """
+        self.loader.shutdown()
+        if self.autosaver is not None:
+            if self.assetsReady and self.pendingSnapshot is None:
+                self.autosaver.submit(self.snapshot())
+            self.autosaver.close()
+            if self.autosaver.failures:
+                print(f"{self.autosaver.failures} autosaves failed, last error {self.autosaver.lastError}", file=sys.stderr)
+        if self.telemetry is not None:
+            self.telemetry.stop()
+        if self.analytics is not None:
+            self.analytics.end_session(self.point, self.tick, False)
+            self.analytics.close()
+        replaySize: int = 0
+        if self.recorder is not None:
+            replaySize = self.recorder.finish(self.tick).save(filePaths["replay"])
+        if self.frameCapture is not None:
+            self.frameCapture.close()
+            print(self.frameCapture.report())
+        if perfReport:
+            if self.recorder is not None:
+                print(f"Replay of seed {self.seed} written to {filePaths['replay']} ({replaySize} bytes)")
+            print(self.loader.report())
+            print(self.music.report())
+            if self.telemetry is not None:
+                print(self.telemetry.report())
+            if self.analytics is not None:
+                print(self.analytics.report())
+            print(self.scheduler.report())
+            print(self.sounds.report())
+            if self.autosaver is not None:
+                print(self.autosaver.report())
+            print(f"Resident memory: {resident_memory() / 1048576:.1f} MiB")
+            print(surfaceCache.report())
+            print(rotationCache.report())
+            print(self.renderer.report())
+            print(self.textRenderer.report())
+            print(self.fruitPool.report())
+            print(self.bugPool.report())
+            print(self.collider.report())
+
         pygame.quit()
         sys.exit()
 
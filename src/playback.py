@@ -0,0 +1,95 @@
+import json
+import time
+import argparse
+import pygame
+from typing import Any, Dict, List, Optional
+
+from utility import *  # Importing utility functions and constants
+from gameSystems import Replay, ReplayInput, FrameCapture  # Importing the replay format, its input source and the frame capture
+from benchmark import percentiles
+from main import Game
+
+def play(replay: Replay, stepsPerFrame: int, capture: Optional[str] = None, outputFormat: str = "raw") -> Dict[str, Any]:
+    """
+    Re-runs a recorded session headless, as fast as possible.
+
+    Args:
+        replay (Replay): The recorded session.
+        stepsPerFrame (int): Maximum number of simulation steps run per rendered frame.
+        capture (str, optional): Folder every rendered frame is recorded to. Defaults to no recording.
+        outputFormat (str, optional): Format of the recorded frames, "png" or "raw". Defaults to "raw".
+
+    Returns:
+        Dict[str, Any]: Final game state, simulated and wall time and frame-time percentiles.
+
+    Raises:
+        RuntimeError: If the replay was recorded at another simulation rate or the session diverged.
+    """
+    if replay.simulationHz != simulationHz:
+        raise RuntimeError(f"replay recorded at {replay.simulationHz} Hz, the game runs at {simulationHz} Hz")
+
+    game: Game = Game(windowConfig, headless=True, seed=replay.seed)
+    source: ReplayInput = ReplayInput(replay, lambda: game.tick)
+    game.inputSource = source
+    game.wait_for_assets()
+    game.active = True
+    if capture:
+        # Playback is offline, so the capture waits for the writer instead of dropping frames
+        game.frameCapture = FrameCapture(capture, game.mainSurface, outputFormat, captureBuffers, "block",
+                                         max(simulationHz // stepsPerFrame, 1))
+
+    samples: List[float] = []
+    start: float = time.perf_counter()
+    while game.active and not source.finished():
+        nextTick: int = source.next_tick()
+        if nextTick > game.tick and game.state != Game.STATE[0]:
+            raise RuntimeError(f"session diverged: input due at tick {nextTick} but the game is in {game.state} at tick {game.tick}")
+
+        # Never step past the next input, it must be applied at the tick it was recorded at
+        steps: int = min(nextTick - game.tick, stepsPerFrame)
+        frameStart: float = time.perf_counter()
+        game.step_frame(steps * game.simStep, steps)
+        samples.append(time.perf_counter() - frameStart)
+    wallTime: float = time.perf_counter() - start
+    if game.frameCapture is not None:
+        game.frameCapture.close()
+
+    results: Dict[str, Any] = {
+        "seed": replay.seed,
+        "inputs": len(replay.inputs),
+        "ticks": game.tick,
+        "frames": len(samples),
+        "simulatedSeconds": game.tick / simulationHz,
+        "wallSeconds": wallTime,
+        "speedup": game.tick / simulationHz / wallTime if wallTime else 0.0,
+        "frameMs": percentiles(samples) if samples else {},
+        "final": {"state": game.state, "point": game.point, "live": game.player.live, "lvl": game.lvl},
+        "capture": game.frameCapture.stats() if game.frameCapture is not None else None
+    }
+    if game.frameCapture is not None:
+        print(game.frameCapture.report())
+    pygame.quit()
+    return results
+
+def main() -> None:
+    """
+    Plays a replay file back and prints (or writes) the results.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=f"{Game.NAME} replay playback")
+    parser.add_argument("replay", nargs="?", default=filePaths["replay"], help="replay file")
+    parser.add_argument("--steps-per-frame", type=int, default=8, help="maximum simulation steps per rendered frame")
+    parser.add_argument("--capture", help="record every rendered frame to this folder")
+    parser.add_argument("--capture-format", choices=FrameCapture.FORMATS, default=captureFormat, help="format of the recorded frames")
+    parser.add_argument("--out", help="output JSON file")
+    args: argparse.Namespace = parser.parse_args()
+
+    results: Dict[str, Any] = play(Replay.load(args.replay), max(args.steps_per_frame, 1), args.capture, args.capture_format)
+    print(f"{results['ticks']} ticks ({results['simulatedSeconds']:.1f} s) in {results['wallSeconds']:.2f} s, "
+          f"{results['speedup']:.1f}x real time, final {results['final']}")
+    if args.out:
+        with open(args.out, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+if __name__ == "__main__":
+    # Play the replay back
+    main()
@@ -0,0 +1,143 @@
+import sys
+import json
+import time
+import socket
+import argparse
+import subprocess
+import pygame
+from typing import Any, Dict, List, Optional
+
+from utility import *  # Importing utility functions and constants
+from gameSystems import TelemetryMirror, ScriptedInput  # Importing the telemetry client side and the scripted input source
+from benchmark import percentiles, pin_level
+import main as gameModule
+from main import Game
+
+def serve(seconds: float, lvl: int, port: int) -> None:
+    """
+    Runs a headless game with the telemetry server enabled, in real time, with a scripted player
+    pinned on one level, so spectators can be measured without a window.
+
+    Args:
+        seconds (float): How long the game runs.
+        lvl (int): The level the game is pinned on.
+        port (int): Port of the telemetry server.
+    """
+    gameModule.telemetryServer = True
+    gameModule.telemetryPort = port
+    game: Game = Game(windowConfig, headless=True)
+    game.wait_for_assets()
+    game.inputSource = ScriptedInput.alternating((pygame.K_LEFT, pygame.K_RIGHT), 30, int(seconds * game.maxFPS) + 1)
+    frameTime: float = 1 / game.maxFPS
+
+    start: float = time.perf_counter()
+    frame: int = 0
+    while time.perf_counter() - start < seconds:
+        pin_level(game, lvl)
+        game.step_frame(frameTime)
+        frame += 1
+        time.sleep(max(start + frame * frameTime - time.perf_counter(), 0.0))
+
+    print(game.telemetry.report())
+    game.telemetry.stop()
+    pygame.quit()
+
+def watch(host: str, port: int, seconds: float, delay: float = 0.0, connectTimeout: float = 10.0) -> Dict[str, Any]:
+    """
+    Connects to a telemetry server, mirrors the game state and measures the stream.
+
+    Args:
+        host (str): Address of the server.
+        port (int): Port of the server.
+        seconds (float): How long to watch.
+        delay (float, optional): Pause after every read, in seconds, to act as a slow client. Defaults to 0.0.
+        connectTimeout (float, optional): How long to retry connecting while the server starts, in seconds. Defaults to 10.0.
+
+    Returns:
+        Dict[str, Any]: Message and byte rates, snapshot and delta counts, latency percentiles and the mirrored state.
+
+    Raises:
+        ConnectionError: If the server cannot be reached.
+    """
+    deadline: float = time.perf_counter() + connectTimeout
+    while True:
+        try:
+            connection: socket.socket = socket.create_connection((host, port), timeout=1.0)
+            break
+        except OSError as error:
+            if time.perf_counter() > deadline:
+                raise ConnectionError(f"no telemetry server on {host}:{port}") from error
+            time.sleep(.2)
+
+    mirror: TelemetryMirror = TelemetryMirror()
+    latencies: List[float] = []
+    start: float = time.perf_counter()
+    with connection:
+        connection.settimeout(.5)
+        while time.perf_counter() - start < seconds:
+            try:
+                data: bytes = connection.recv(65536)
+            except socket.timeout:
+                continue
+            if not data:
+                break
+            received: int = time.time_ns() // 1000
+            latencies.extend((received - game[1]) / 1e6 for game in mirror.feed(data))
+            if delay:
+                time.sleep(delay)
+    wallTime: float = time.perf_counter() - start
+
+    messages: int = mirror.snapshots + mirror.deltas
+    return {
+        "seconds": wallTime,
+        "messages": messages,
+        "messagesPerSecond": messages / wallTime,
+        "bytesPerSecond": mirror.bytesReceived / wallTime,
+        "meanMessageBytes": mirror.bytesReceived / messages if messages else 0.0,
+        "snapshots": mirror.snapshots,
+        "deltas": mirror.deltas,
+        "ignoredDeltas": mirror.ignored,
+        "latencyMs": percentiles(latencies) if latencies else {},
+        "lastTick": mirror.tick,
+        "sprites": len(mirror.sprites)
+    }
+
+def main() -> None:
+    """
+    Watches a telemetry server (or a headless game it spawns) and prints (or writes) the measurements.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=f"{Game.NAME} telemetry spectator")
+    parser.add_argument("--host", default="127.0.0.1", help="address of the telemetry server")
+    parser.add_argument("--port", type=int, default=telemetryPort, help="port of the telemetry server")
+    parser.add_argument("--seconds", type=float, default=10.0, help="how long to watch")
+    parser.add_argument("--delay", type=float, default=0.0, help="pause after every read in milliseconds, to act as a slow client")
+    parser.add_argument("--spawn", action="store_true", help="start a headless game with telemetry to watch")
+    parser.add_argument("--serve", action="store_true", help="only run the headless game with telemetry")
+    parser.add_argument("--level", type=int, default=5, help="level the headless game is pinned on")
+    parser.add_argument("--out", help="output JSON file")
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.serve:
+        serve(args.seconds, args.level, args.port)
+        return
+
+    game: Optional[subprocess.Popen] = None
+    if args.spawn:
+        game = subprocess.Popen([sys.executable, __file__, "--serve", "--seconds", str(args.seconds + 5),
+                                 "--port", str(args.port), "--level", str(args.level)])
+    try:
+        results: Dict[str, Any] = watch(args.host, args.port, args.seconds, args.delay / 1000)
+    finally:
+        if game is not None:
+            game.wait()
+
+    print(f"{results['messages']} messages ({results['snapshots']} snapshots, {results['deltas']} deltas) in {results['seconds']:.1f} s: "
+          f"{results['messagesPerSecond']:.0f} msg/s, {results['bytesPerSecond'] / 1024:.1f} KiB/s, "
+          f"{results['meanMessageBytes']:.0f} bytes/msg, latency {results['latencyMs']}")
+    if args.out:
+        with open(args.out, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+if __name__ == "__main__":
+    # Watch the telemetry stream
+    main()
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Tuple, Dict
 
 # Define window dimensions
@@ -6,10 +7,108 @@ windowConfig: Tuple[int, int] = (480, 720)
 # Font size for text rendering
 fontSize: int = 50
 
+# Simulation steps per second, the game logic always advances by 1 / simulationHz
+simulationHz: int = 120
+
+# Basket speed in pixels per second for every point of the level's playerSpd
+playerSpeedScale: int = 12
+
+# Longest sleep (in seconds) of the menu, pause and game over screens between two inputs, they are only redrawn when something changes
+idleTimeout: float = 1.0
+
+# Longest frame (in seconds) fed to the simulation, longer stalls are dropped instead of replayed
+maxFrameTime: float = .25
+
+# Average number of spawns per second while below the level's spawn limit
+spawnRates: Dict[str, float] = {
+    "fruit": 1.8,  # Fruit spawns per second
+    "bug": .6,  # Bug spawns per second
+}
+
+# Scale factors applied to sprite images when they are loaded
+spriteScales: Dict[str, float] = {
+    "fruit": .9,  # Scale factor for fruit sprites
+    "bug": .5,  # Scale factor for bug sprites
+    "player": .25,  # Scale factor for the player sprite
+}
+
+# Horizontal spawn ranges (min x, max x) per kind, one of them is picked for every spawn
+spawnRanges: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    "fruit": ((30, 50), (100, 200), (250, 350), (180, 380)),  # Spawn ranges of fruits
+    "bug": ((50, 100), (120, 160), (200, 280)),  # Spawn ranges of bugs
+}
+
+# Physics backend for falling sprites: "sprite" (one update call per sprite) or "numpy" (batched arrays, needs numpy)
+physicsBackend: str = "sprite"
+
+# Maximum number of dead fruit / bug sprites kept for reuse by the sprite pools
+spritePoolSize: int = 32
+
+# Seconds the music takes to fade out and back in when the game switches between the menu and gameplay tracks
+musicFadeTime: float = .8
+
+# Mixer channels reserved for sound effects
+soundChannels: int = 6
+
+# Sound effects (keys of filePaths): maximum concurrent voices and priority (higher priorities may steal channels)
+soundEffects: Dict[str, Dict[str, int]] = {
+    "fruitCollision": {"maxVoices": 3, "priority": 1},
+    "bugCollision": {"maxVoices": 2, "priority": 2},
+    "lvlUp": {"maxVoices": 1, "priority": 3},
+}
+
+# Record the seed and the inputs of the session into a replay file (filePaths["replay"]) when the game exits
+recordReplay: bool = False
+
+# Record every presented frame into folderPaths["capture"]: "png" files or one "raw" video, through captureBuffers
+# preallocated frame buffers. When the writer falls behind, "drop" skips frames and "block" makes the game wait
+recordFrames: bool = False
+captureFormat: str = "raw"
+captureBuffers: int = 8
+captureDropPolicy: str = "drop"
+
+# Stream the game state of every tick to spectator clients on localhost:telemetryPort (run python spectator.py to watch and measure it)
+telemetryServer: bool = False
+telemetryPort: int = 8765
+
+# Keep the history of every session (catches and hits per asset, time per level, frame times) in a local SQLite file (filePaths["analytics"])
+analyticsEnabled: bool = False
+
+# Seconds of play between two autosaves, the session is also saved on pause, game over and exit
+autosaveInterval: float = 5.0
+
+# Resume the session saved on exit when the game starts again, ignored while recordReplay is on since a replay starts from a fresh seed
+resumeSession: bool = True
+
+# Worker threads decoding sounds and sprites in the background while the menu is shown
+loaderWorkers: int = 4
+
+# Load the fruit, bug and player sprites from one packed texture atlas (rebuilt when a source PNG changes)
+useTextureAtlas: bool = True
+
+# Swing falling fruits / bugs back and forth while they fall (frames come from the rotation cache).
+# The collision rect follows the size of the shown frame, so the swing slightly changes the hit boxes
+animateDrops: bool = False
+
+# Number of pre-rendered angles per fruit / bug image and the memory budget of the rotation cache in bytes.
+# 36 steps (10 degrees) keep about 17 MB resident for the 15 sprite images, 72 steps double that for a smoother swing
+rotationSteps: int = 36
+rotationCacheBudget: int = 48 * 1024 * 1024
+
+# Only erase and push the screen areas that changed instead of redrawing the full frame
+dirtyRectRendering: bool = False
+
+# Record per-phase frame times from the start (F3 toggles the overlay, F4 dumps the recorded frames to CSV)
+profilerEnabled: bool = False
+
+# Print performance counters (asset cache, renderer, text cache, sprite pools, ...) when the game exits
+perfReport: bool = False
+
 # Folder paths for assets
 folderPaths: Dict[str, str] = {
     "fruit": "assets/fruits/",  # Folder path for fruit assets
     "bug": "assets/bugs/",  # Folder path for bug assets
+    "capture": "capture/",  # Folder the recorded frames are written to
 }
 
 # File paths for assets
@@ -21,44 +120,25 @@ filePaths: Dict[str, str] = {
     "bugCollision": "assets/mp3/bug_se.mp3",  # Path to bug collision sound effect
     "bgMusic": "assets/mp3/bg_music.mp3",  # Path to background music
     "menuMusic": "assets/mp3/menu_music.mp3",  # Path to menu music
-    "lvlUp": "assets/mp3/levelUp.mp3"  # Path to level up sound effect
+    "lvlUp": "assets/mp3/levelUp.mp3",  # Path to level up sound effect
+    "profileCsv": "frame_profile.csv",  # Path of the frame profile CSV dump
+    "replay": "last_session.fbr",  # Path of the recorded replay
+    "analytics": "analytics.db",  # Path of the session analytics database
+    "atlasImage": "assets/atlas/sprites.png",  # Path of the generated sprite atlas image
+    "atlasIndex": "assets/atlas/sprites.json",  # Path of the generated sprite atlas index
+    "levels": "assets/data/levels.json",  # Path of the level table (score thresholds and level-wise parameters)
+    "save": "savegame.fbs"  # Path of the save file (session snapshot and best score)
 }
 
-# Level-wise parameters for the game
-levelWiseParameters: Dict[int, Dict[str, int]] = {
-    1: {
-        "fruitG": 330,  # Gravity for fruits in level 1
-        "bugG": 333,  # Gravity for bugs in level 1
-        "playerSpd": 30,  # Player speed in level 1
-        "fruitSpwanLimit": 3,  # Maximum number of fruits spawned in level 1
-        "bugSpwanLimit": 2  # Maximum number of bugs spawned in level 1
-    },
-    2: {
-        "fruitG": 390,  # Gravity for fruits in level 2
-        "bugG": 363,  # Gravity for bugs in level 2
-        "playerSpd": 40,  # Player speed in level 2
-        "fruitSpwanLimit": 4,  # Maximum number of fruits spawned in level 2
-        "bugSpwanLimit": 3  # Maximum number of bugs spawned in level 2
-    },
-    3: {
-        "fruitG": 400,  # Gravity for fruits in level 3
-        "bugG": 393,  # Gravity for bugs in level 3
-        "playerSpd": 60,  # Player speed in level 3
-        "fruitSpwanLimit": 5,  # Maximum number of fruits spawned in level 3
-        "bugSpwanLimit": 4  # Maximum number of bugs spawned in level 3
-    },
-    4: {
-        "fruitG": 420,  # Gravity for fruits in level 4
-        "bugG": 403,  # Gravity for bugs in level 4
-        "playerSpd": 65,  # Player speed in level 4
-        "fruitSpwanLimit": 5,  # Maximum number of fruits spawned in level 4
-        "bugSpwanLimit": 4  # Maximum number of bugs spawned in level 4
-    },
-    5: {
-        "fruitG": 530,  # Gravity for fruits in level 5
-        "bugG": 453,  # Gravity for bugs in level 5
-        "playerSpd": 70,  # Player speed in level 5
-        "fruitSpwanLimit": 5,  # Maximum number of fruits spawned in level 5
-        "bugSpwanLimit": 5  # Maximum number of bugs spawned in level 5
-    }
-}
+def asset_value(path: str, base: int) -> int:
+    """
+    Returns the value of a fruit (points) or bug (damage) image: the base value plus the last digit of its file name.
+
+    Args:
+        path (str): Path of the image.
+        base (int): Base value of the kind.
+
+    Returns:
+        int: The value.
+    """
+    return int(Path(path).stem[-1]) + base
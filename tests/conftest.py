@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The game modules are imported from src, the way the game runs them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
@@ -0,0 +1,40 @@
+import os
+import pytest
+
+from gameSystems import LevelConfig, LevelTable
+
+LEVELS_FILE: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "assets", "data", "levels.json")
+
+def make_table(*minScores: int) -> LevelTable:
+    return LevelTable([LevelConfig(index + 1, minScore, 330, 333, 30, 3, 2) for index, minScore in enumerate(minScores)])
+
+@pytest.mark.parametrize("score, lvl", [
+    (-1, 1), (0, 1), (200, 1), (201, 2), (202, 2), (600, 2), (601, 3), (1000, 3), (1001, 4), (10 ** 9, 4)
+])
+def test_level_for_boundaries(score: int, lvl: int) -> None:
+    assert make_table(0, 201, 601, 1001).level_for(score) == lvl
+
+def test_level_for_single_level() -> None:
+    table: LevelTable = make_table(0)
+    assert [table.level_for(score) for score in (-5, 0, 10 ** 9)] == [1, 1, 1]
+
+def test_shipped_table() -> None:
+    table: LevelTable = LevelTable.load(LEVELS_FILE)
+    assert table.level_for(0) == 1
+    for level in list(table)[1:]:
+        assert table.level_for(level.minScore - 1) == level.level - 1
+        assert table.level_for(level.minScore) == level.level
+    assert table.thresholds() == [level.minScore for level in list(table)[1:]]
+
+def test_data_round_trip() -> None:
+    table: LevelTable = LevelTable.load(LEVELS_FILE)
+    assert LevelTable.from_data(table.to_data()).levels == table.levels
+
+@pytest.mark.parametrize("minScores", [(), (5, 10), (0, 10, 10), (0, 10, 5)])
+def test_invalid_thresholds(minScores) -> None:
+    with pytest.raises(ValueError):
+        make_table(*minScores)
+
+def test_unknown_parameter() -> None:
+    with pytest.raises(ValueError):
+        LevelTable.from_data({"levels": [{"minScore": 0, "speed": 1}]})
@@ -0,0 +1,52 @@
+import struct
+import pytest
+
+from gameSystems import Replay
+
+def make_replay() -> Replay:
+    return Replay(2 ** 64 - 1, 120, [
+        (0, Replay.KEY + 13), (0, Replay.DIRECTION - 1), (127, Replay.DIRECTION), (128, Replay.KEY + 1073741904),
+        (100000, Replay.DIRECTION + 1), (100000, Replay.QUIT)
+    ])
+
+def test_round_trip() -> None:
+    replay: Replay = make_replay()
+    decoded: Replay = Replay.decode(replay.encode())
+    assert (decoded.seed, decoded.simulationHz, decoded.inputs) == (replay.seed, replay.simulationHz, replay.inputs)
+
+def test_round_trip_without_inputs() -> None:
+    decoded: Replay = Replay.decode(Replay(0, 60).encode())
+    assert (decoded.seed, decoded.simulationHz, decoded.inputs) == (0, 60, [])
+
+@pytest.mark.parametrize("delta, size", [(0, 1), (127, 1), (128, 2), (16383, 2), (16384, 3)])
+def test_varint_size(delta: int, size: int) -> None:
+    header: int = len(Replay(0, 60).encode())
+    assert len(Replay(0, 60, [(delta, Replay.QUIT)]).encode()) == header + size + 1
+
+def test_truncated() -> None:
+    data: bytes = make_replay().encode()
+    with pytest.raises(ValueError):
+        Replay.decode(data[:5])
+    # Without the code of the last record
+    with pytest.raises(ValueError):
+        Replay.decode(data[:-1])
+    # Inside a multi-byte tick delta
+    with pytest.raises(ValueError):
+        Replay.decode(Replay(0, 60, [(16384, Replay.QUIT)]).encode()[:-2])
+
+def test_unsupported() -> None:
+    data: bytes = make_replay().encode()
+    with pytest.raises(ValueError):
+        Replay.decode(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        Replay.decode(data[:4] + bytes([Replay.VERSION + 1]) + data[5:])
+
+@pytest.mark.parametrize("inputs", [[(5, Replay.QUIT), (4, Replay.QUIT)], [(0, -1)]])
+def test_negative_values(inputs) -> None:
+    with pytest.raises(ValueError):
+        Replay(0, 60, inputs).encode()
+
+@pytest.mark.parametrize("seed, simulationHz", [(2 ** 64, 60), (-1, 60), (0, 65536)])
+def test_header_out_of_range(seed: int, simulationHz: int) -> None:
+    with pytest.raises(struct.error):
+        Replay(seed, simulationHz).encode()
@@ -0,0 +1,74 @@
+import random
+import struct
+import pytest
+
+from gameSystems import Snapshot, SpriteState
+
+def make_snapshot(count: int = 3, gauss: bool = False, **changes) -> Snapshot:
+    rng: random.Random = random.Random(42)
+    if gauss:
+        rng.gauss(0.0, 1.0)  # Leaves a cached gauss value in the state
+    fields = dict(
+        tick=123456, seed=2 ** 64 - 1, state=0, point=1234, lvl=3, live=57, maxScore=4321,
+        basketX=210.75, accumulator=0.004, rngState=rng.getstate(),
+        sprites=[
+            SpriteState(index % 2, index, 10 + index, 30 + index, -120, 55.5 + index, 54.25, 310.0, 390,
+                        180.0, 250.5, -3.5, 10.0, 1 if index % 2 else -1)
+            for index in range(count)
+        ]
+    )
+    fields.update(changes)
+    return Snapshot(**fields)
+
+def assert_same(decoded: Snapshot, snapshot: Snapshot) -> None:
+    assert vars(decoded) == vars(snapshot)
+
+@pytest.mark.parametrize("count, gauss", [(0, False), (3, False), (3, True), (500, False)])
+def test_round_trip(count: int, gauss: bool) -> None:
+    snapshot: Snapshot = make_snapshot(count, gauss)
+    assert_same(Snapshot.decode(snapshot.encode()), snapshot)
+
+def test_restored_generator() -> None:
+    snapshot: Snapshot = make_snapshot(gauss=True)
+    restored: random.Random = random.Random()
+    restored.setstate(Snapshot.decode(snapshot.encode()).rngState)
+    original: random.Random = random.Random()
+    original.setstate(snapshot.rngState)
+    assert [restored.random() for _ in range(10)] + [restored.gauss(0.0, 1.0)] == \
+           [original.random() for _ in range(10)] + [original.gauss(0.0, 1.0)]
+
+def test_save_and_load(tmp_path) -> None:
+    snapshot: Snapshot = make_snapshot()
+    path: str = str(tmp_path / "save.fbs")
+    assert snapshot.save(path) == len(snapshot.encode())
+    assert_same(Snapshot.load(path), snapshot)
+
+def test_truncated() -> None:
+    data: bytes = make_snapshot().encode()
+    for size in (0, 3, 10, len(data) - 1):
+        with pytest.raises(ValueError):
+            Snapshot.decode(data[:size])
+
+def test_unsupported() -> None:
+    data: bytes = make_snapshot().encode()
+    with pytest.raises(ValueError):
+        Snapshot.decode(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        Snapshot.decode(data[:4] + bytes([Snapshot.VERSION + 1]) + data[5:])
+
+@pytest.mark.parametrize("changes", [
+    {"tick": -1}, {"seed": 2 ** 64}, {"state": 256}, {"point": 2 ** 31}, {"lvl": 256}, {"live": -2 ** 31 - 1}
+])
+def test_game_field_out_of_range(changes) -> None:
+    with pytest.raises(struct.error):
+        make_snapshot(**changes).encode()
+
+@pytest.mark.parametrize("field, value", [("kind", 256), ("image", 65536), ("spawnY", -32769), ("gravity", -1), ("direction", 128)])
+def test_sprite_field_out_of_range(field: str, value: int) -> None:
+    sprite: SpriteState = make_snapshot(1).sprites[0]._replace(**{field: value})
+    with pytest.raises(struct.error):
+        make_snapshot(sprites=[sprite]).encode()
+
+def test_too_many_sprites() -> None:
+    with pytest.raises(struct.error):
+        make_snapshot(65536).encode()